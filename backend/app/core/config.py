@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -9,10 +11,36 @@ class Settings(BaseSettings):
     """Expose the minimal knobs required by the blueprints."""
 
     app_env: str = "local"
-    data_source: str = "local"
+    log_level: str = "INFO"
+    log_json: bool = False
+    data_source: Literal["local", "s3"] = "local"
     parquet_path: str = "data/cleaned_calls.parquet"
     manifest_path: str = "data/manifest.json"
     secret_key: str = "dev-secret"
+    result_cache_max_bytes: int = 64 * 1024 * 1024
+    result_cache_max_entries: int = 4096
+    http_cache_max_age: int = 0
+    worker_pool_kind: Literal["thread", "process"] = "thread"
+    worker_pool_size: int = 4
+    worker_pool_max_concurrency: int = 0
+    enable_refresh_endpoint: bool = False
+    refresh_calls_path: str = "data/sample_calls.json"
+    refresh_agents_path: str = "data/agents.csv"
+    refresh_incremental: bool = False
+    manifest_poll_interval_seconds: float = 0.5
+    event_heartbeat_seconds: float = 15.0
+    warmup_on_startup: bool = True
+    s3_bucket: str = ""
+    s3_prefix: str = ""
+    s3_endpoint_url: str | None = None
+    s3_region: str | None = None
+    s3_metadata_ttl_seconds: float = 5.0
+    block_cache_dir: str = "data/.block-cache"
+    block_cache_max_bytes: int = 512 * 1024 * 1024
+    block_size: int = 1024 * 1024
+    range_coalesce_gap: int = 64 * 1024
+    range_request_max_bytes: int = 8 * 1024 * 1024
+    range_fetch_concurrency: int = 8
 
 
 settings = Settings()
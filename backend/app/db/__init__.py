@@ -0,0 +1 @@
+"""Caching helpers shared by the services layer."""
\ No newline at end of file
@@ -1,9 +1,202 @@
-"""Cache abstractions referenced by services."""
+"""Manifest-versioned, size-bounded LRU cache for query results."""
 
 from __future__ import annotations
 
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from ..core.config import settings
+
+T = TypeVar("T")
+
+CacheKey = tuple[str, str, str]
+
+# Superseded manifest hashes remembered so late reads and writes for them are recognised.
+MAX_SEEN_GENERATIONS = 64
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the retained size of a cached result in bytes."""
+
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) for item in value) + 8 * len(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return sum(estimate_size(getattr(value, field.name)) for field in fields(value))
+    # Polars frames, duck-typed so the cache does not import Polars.
+    estimated_size = getattr(value, "estimated_size", None)
+    if callable(estimated_size):
+        return int(estimated_size())
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return len(json.dumps(value, default=str))
+
+
+def normalize_params(params: BaseModel | dict[str, Any] | None) -> str:
+    """Render filter models and query dicts into a stable cache key fragment."""
+
+    if params is None:
+        return ""
+    if isinstance(params, BaseModel):
+        params = params.model_dump(mode="json")
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ResultCache:
+    """LRU cache bounded by total bytes, invalidated wholesale by new manifest hashes.
+
+    Only the latest manifest's hash advances the generation: ``latest_generation`` reports
+    it, and without one any hash the cache has not seen before is taken as the latest. A
+    request that read the manifest before a publish may still get or set with the superseded
+    hash; those reads miss and those writes are dropped, without clearing the entries of the
+    current generation.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int,
+        latest_generation: Callable[[], str] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.latest_generation = latest_generation
+        self._entries: OrderedDict[CacheKey, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: str | None = None
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(
+        endpoint: str, params: BaseModel | dict[str, Any] | None, manifest_hash: str
+    ) -> CacheKey:
+        """Build the ``(endpoint, normalized filters, manifest hash)`` cache key."""
+
+        return (endpoint, normalize_params(params), manifest_hash)
+
+    def _observe_generation(self, manifest_hash: str) -> bool:
+        """Advance to ``manifest_hash`` if it is new; returns whether it is the current one."""
+
+        if manifest_hash == self._generation:
+            return True
+        if self.latest_generation is not None:
+            if manifest_hash != self.latest_generation():
+                return False
+        elif manifest_hash in self._seen:
+            return False
+        if self._generation is not None:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+        self._generation = manifest_hash
+        self._seen[manifest_hash] = None
+        if len(self._seen) > MAX_SEEN_GENERATIONS:
+            self._seen.popitem(last=False)
+        return True
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return the cached value for ``key`` or ``None`` on a miss."""
+
+        with self._lock:
+            if not self._observe_generation(key[2]):
+                self.misses += 1
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: CacheKey, value: Any, size: int | None = None) -> None:
+        """Store ``value`` and evict least-recently-used entries beyond the byte budget."""
+
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if not self._observe_generation(key[2]):
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_compute(self, key: CacheKey, compute: Callable[[], T]) -> T:
+        """Return the cached value or compute, store and return it."""
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry while keeping the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Expose counters for diagnostics endpoints."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "manifest_hash": self._generation,
+            }
+
+
+def _published_manifest_hash() -> str:
+    # Deferred: the data layer imports the columnar stack, and only services that have
+    # already loaded it consult the cache.
+    from ..services.data_access import current_manifest_hash
+
+    return current_manifest_hash()
+
+
+result_cache = ResultCache(
+    max_bytes=settings.result_cache_max_bytes,
+    max_entries=settings.result_cache_max_entries,
+    latest_generation=_published_manifest_hash,
+)
+
 
 def get_cache_status() -> str:
-    """Describe the not-yet-implemented cache layer."""
+    """Summarise the result cache for logs and diagnostics."""
 
-    return "Cache layer not configured in placeholder build."
+    stats = result_cache.stats()
+    return (
+        f"{stats['entries']} entries / {stats['bytes']} bytes cached, "
+        f"{stats['hits']} hits, {stats['misses']} misses"
+    )
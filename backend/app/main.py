@@ -2,11 +2,58 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import hashlib
+import importlib
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+from urllib.parse import parse_qsl, urlencode
 
-from .routers import agents, auth, calls, health, metrics, settings
+import structlog
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.routing import Match
 
-app = FastAPI(title="AWS Serverless Support Analytics", version="0.1.0")
+from .core.config import settings as app_settings
+from .routers import agents, auth, calls, health, metrics, settings, telemetry
+from .services import data_access
+from .services import warmup as warmup_service
+from .services.executor import worker_pool
+from .utils.instrumentation import (
+    PARQUET_BYTES,
+    PARQUET_ROW_GROUPS,
+    REQUEST_LATENCY,
+    begin_request,
+    end_request,
+)
+from .utils.logging import configure_logging
+
+logger = structlog.get_logger(__name__)
+
+# Imported for its side effect of registering the scrape-time gauges; service modules
+# are otherwise loaded lazily on first use.
+importlib.import_module(f"{__package__}.services.telemetry")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Configure logging and start the warm-up; stop background work on shutdown."""
+
+    configure_logging(app_settings.log_level, json_logs=app_settings.log_json)
+    if app_settings.warmup_on_startup:
+        # Runs in the background: liveness answers at once, readiness once warmed.
+        warmup_service.warmup.start()
+    yield
+    warmup_service.warmup.stop()
+    # Services load on first use; a process that never streamed events has no watcher.
+    events = sys.modules.get(f"{__package__}.services.events")
+    if events is not None:
+        events.broadcaster.close()
+    worker_pool.shutdown(wait=False)
+
+
+app = FastAPI(title="AWS Serverless Support Analytics", version="0.1.0", lifespan=lifespan)
 
 app.include_router(health.router)
 app.include_router(calls.router)
@@ -14,6 +61,121 @@ app.include_router(agents.router)
 app.include_router(metrics.router)
 app.include_router(settings.router)
 app.include_router(auth.router)
+app.include_router(telemetry.router)
+
+CACHEABLE_PREFIXES = ("/api/calls", "/api/agents", "/api/metrics")
+# Streamed downloads under a cacheable prefix; they are neither tagged nor revalidated.
+STREAMING_PATHS = ("/api/calls/export",)
+
+
+def manifest_etag(manifest_hash: str, path: str, query: str) -> str:
+    """Strong validator for a response that depends only on the dataset, route and query."""
+
+    canonical_query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (manifest_hash, path, canonical_query):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Apply the weak comparison RFC 9110 prescribes for ``If-None-Match``."""
+
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@app.middleware("http")
+async def conditional_get(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Answer revalidations of data routes with ``304`` until a new manifest is published.
+
+    The validator is derived from the manifest hash, so checking it costs one ``stat`` of the
+    manifest (on a worker thread, as it may reach object storage) and never reaches the
+    services layer.
+    """
+
+    path = request.url.path
+    if (
+        request.method not in ("GET", "HEAD")
+        or not path.startswith(CACHEABLE_PREFIXES)
+        or path in STREAMING_PATHS
+    ):
+        return await call_next(request)
+    manifest_hash = await data_access.fetch_manifest_hash()
+    if manifest_hash == data_access.MISSING_MANIFEST_HASH:
+        return await call_next(request)
+
+    etag = manifest_etag(manifest_hash, path, request.url.query)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={app_settings.http_cache_max_age}, must-revalidate",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == status.HTTP_200_OK:
+        response.headers.update(headers)
+    return response
+
+
+def route_template(request: Request) -> str:
+    """Label requests by route template rather than raw path to bound metric cardinality."""
+
+    route = request.scope.get("route")
+    if route is not None:
+        return route.path
+    # Requests answered before routing (e.g. 304 revalidations) are matched here.
+    for candidate in request.app.router.routes:
+        match, _ = candidate.matches(request.scope)
+        if match is Match.FULL:
+            return candidate.path
+    return "unmatched"
+
+
+@app.middleware("http")
+async def instrument_requests(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record latency and Parquet reads per request and emit one structured access event."""
+
+    token = begin_request()
+    started = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        reads = end_request(token)
+        route = route_template(request)
+        REQUEST_LATENCY.observe(elapsed, request.method, route, str(status_code))
+        PARQUET_BYTES.observe(reads.bytes_read, route)
+        PARQUET_ROW_GROUPS.observe(reads.row_groups, route)
+        logger.info(
+            "http.request",
+            method=request.method,
+            route=route,
+            status=status_code,
+            duration_ms=round(elapsed * 1000, 3),
+            parquet_bytes=reads.bytes_read,
+            parquet_row_groups=reads.row_groups,
+        )
+
+
+@app.exception_handler(FileNotFoundError)
+async def data_unavailable(request: Request, exc: FileNotFoundError) -> JSONResponse:
+    """Map missing Parquet/manifest artifacts to the documented 503 error envelope."""
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"error": {"code": "DATA_UNAVAILABLE", "message": str(exc), "details": []}},
+    )
 
 
 @app.get("/", tags=["root"])
@@ -1,8 +1,23 @@
 """Pydantic domain models used across routers/services."""
 
-from .call import CallRecord
-from .agent import AgentStats
-from .metrics import MetricPoint
-from .manifest import ManifestInfo
+from __future__ import annotations
 
-__all__ = ["CallRecord", "AgentStats", "MetricPoint", "ManifestInfo"]
+from ..utils.lazy import lazy_package
+
+_EXPORTS = {
+    "CallRecord": "call",
+    "AgentStats": "agent",
+    "MetricPoint": "metrics",
+    "HandleTimePercentiles": "metrics",
+    "ManifestInfo": "manifest",
+}
+
+__all__ = [
+    "CallRecord",
+    "AgentStats",
+    "MetricPoint",
+    "HandleTimePercentiles",
+    "ManifestInfo",
+]
+
+__getattr__ = lazy_package(__name__, _EXPORTS)
@@ -6,7 +6,11 @@ from pydantic import BaseModel, ConfigDict
 
 
 class AgentStats(BaseModel):
-    """Summaries consumed by the frontend agents view."""
+    """Summaries consumed by the frontend agents view.
+
+    ``avg_rating`` is the agent's roster skill rating from ``agents.csv``; the call exports
+    carry no per-call customer score.
+    """
 
     model_config = ConfigDict(extra="forbid")
 
@@ -14,3 +18,7 @@ class AgentStats(BaseModel):
     avg_rating: float
     total_calls: int
     avg_resolution_seconds: int
+    p50_resolution_seconds: int | None = None
+    p90_resolution_seconds: int | None = None
+    p99_resolution_seconds: int | None = None
+    resolution_percentile_bucket: int | None = None
@@ -16,3 +16,4 @@ class CallRecord(BaseModel):
     issue_type: str
     duration_seconds: int
     resolution_status: str
+    started_at: str
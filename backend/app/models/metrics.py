@@ -13,3 +13,14 @@ class MetricPoint(BaseModel):
     timestamp: str
     value: float
     delta: float | None = None
+
+
+class HandleTimePercentiles(BaseModel):
+    """Handle-time quantiles merged from the rollup sketches."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    calls: int
+    p50_seconds: float | None
+    p90_seconds: float | None
+    p99_seconds: float | None
@@ -6,8 +6,11 @@ from pathlib import Path
 
 from support_analytics.manifest import ManifestRecord, load_manifest
 
+from .storage import get_storage
+
 
 def get_manifest(manifest_path: Path) -> ManifestRecord:
-    """Delegate to the shared manifest loader."""
+    """Delegate to the shared manifest loader, after mirroring the manifest from storage."""
 
+    get_storage().sync(manifest_path)
     return load_manifest(manifest_path)
@@ -0,0 +1,115 @@
+"""pyarrow filesystem adapter over the object store, kept apart so pyarrow loads on demand."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+
+from .storage import BlockFetcher, CachedObjectFile, ObjectInfo
+
+
+class ObjectStoreHandler(pafs.FileSystemHandler):
+    """Read-only pyarrow filesystem over an :class:`ObjectStore`; paths are object keys.
+
+    Object metadata is memoised for ``metadata_ttl`` seconds so opening the same footer from
+    several scans costs one ``HEAD`` request.
+    """
+
+    def __init__(self, fetcher: BlockFetcher, metadata_ttl: float = 5.0) -> None:
+        self.fetcher = fetcher
+        self.metadata_ttl = metadata_ttl
+        self._heads: dict[str, tuple[float, ObjectInfo | None]] = {}
+        self._lock = threading.Lock()
+
+    def info(self, key: str) -> ObjectInfo:
+        """Return (possibly memoised) object metadata or raise ``FileNotFoundError``."""
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._heads.get(key)
+        if cached is None or cached[0] < now:
+            try:
+                head: ObjectInfo | None = self.fetcher.store.head(key)
+            except FileNotFoundError:
+                head = None
+            cached = (now + self.metadata_ttl, head)
+            with self._lock:
+                self._heads[key] = cached
+        if cached[1] is None:
+            raise FileNotFoundError(key)
+        return cached[1]
+
+    def open_object(self, key: str) -> CachedObjectFile:
+        """Open one object for ranged, cached reads."""
+
+        return CachedObjectFile(self.fetcher, self.info(key))
+
+    def get_type_name(self) -> str:
+        return "object-store"
+
+    def normalize_path(self, path: str) -> str:
+        return path.strip("/")
+
+    def equals(self, other: Any) -> bool:
+        return isinstance(other, ObjectStoreHandler) and other.fetcher is self.fetcher
+
+    def exists(self, key: str) -> bool:
+        """Whether ``key`` is an object or a prefix with objects under it."""
+
+        return self.get_file_info([key])[0].type != pafs.FileType.NotFound
+
+    def is_dir(self, key: str) -> bool:
+        """Whether ``key`` is a prefix with objects under it."""
+
+        return self.get_file_info([key])[0].type == pafs.FileType.Directory
+
+    def _listing(self, key: str) -> list[ObjectInfo]:
+        return self.fetcher.store.list(f"{key}/" if key else "")
+
+    def get_file_info(self, paths: list[str]) -> list[pafs.FileInfo]:
+        infos = []
+        for path in paths:
+            key = self.normalize_path(path)
+            try:
+                head = self.info(key)
+            except FileNotFoundError:
+                kind = pafs.FileType.Directory if self._listing(key) else pafs.FileType.NotFound
+                infos.append(pafs.FileInfo(path, kind))
+            else:
+                infos.append(pafs.FileInfo(path, pafs.FileType.File, size=head.size))
+        return infos
+
+    def get_file_info_selector(self, selector: pafs.FileSelector) -> list[pafs.FileInfo]:
+        base = self.normalize_path(selector.base_dir)
+        objects = self._listing(base)
+        if not objects and not selector.allow_not_found:
+            raise FileNotFoundError(selector.base_dir)
+        infos: dict[str, pafs.FileInfo] = {}
+        for item in objects:
+            relative = item.key[len(base) + 1 :] if base else item.key
+            parts = relative.split("/")
+            if not selector.recursive and len(parts) > 1:
+                directory = "/".join(filter(None, [base, parts[0]]))
+                infos[directory] = pafs.FileInfo(directory, pafs.FileType.Directory)
+                continue
+            for depth in range(1, len(parts)):
+                directory = "/".join(filter(None, [base, *parts[:depth]]))
+                infos[directory] = pafs.FileInfo(directory, pafs.FileType.Directory)
+            infos[item.key] = pafs.FileInfo(item.key, pafs.FileType.File, size=item.size)
+        return list(infos.values())
+
+    def open_input_file(self, path: str) -> pa.NativeFile:
+        return pa.PythonFile(self.open_object(self.normalize_path(path)), mode="r")
+
+    def open_input_stream(self, path: str) -> pa.NativeFile:
+        return self.open_input_file(path)
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise OSError("object-store filesystem is read-only")
+
+    create_dir = delete_dir = delete_dir_contents = delete_root_dir_contents = _read_only
+    delete_file = move = copy_file = open_output_stream = open_append_stream = _read_only
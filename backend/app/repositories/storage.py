@@ -0,0 +1,550 @@
+"""Storage backends behind the Parquet and manifest repositories.
+
+``local`` reads the published directory straight from disk. ``s3`` reads the same layout
+from an S3-compatible bucket (AWS, MinIO, moto) through a pyarrow filesystem that:
+
+* issues HTTP range requests for only the bytes Parquet asks for (footers, column chunks);
+* coalesces adjacent or nearly adjacent ranges and fetches the resulting runs concurrently;
+* keeps fetched blocks in a disk-backed LRU cache keyed by object ETag, so a restarted or
+  newly scaled worker on the same host reads warm footers and row groups without a request.
+
+Local paths map onto object keys by their position under the manifest's folder, which is
+also where the manifest itself is mirrored from the bucket.
+"""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from ..core.config import settings
+
+if TYPE_CHECKING:
+    import pyarrow.fs as pafs
+
+    from .object_fs import ObjectStoreHandler
+
+ByteRange = tuple[int, int]
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectInfo:
+    """Size and ETag of one stored object."""
+
+    key: str
+    size: int
+    etag: str
+
+
+class ObjectStore(abc.ABC):
+    """Minimal object-store interface: metadata, listing and ranged reads."""
+
+    @abc.abstractmethod
+    def head(self, key: str) -> ObjectInfo:
+        """Return the object's metadata; raise ``FileNotFoundError`` when it does not exist."""
+
+    @abc.abstractmethod
+    def list(self, prefix: str) -> list[ObjectInfo]:
+        """Return every object whose key starts with ``prefix``."""
+
+    @abc.abstractmethod
+    def get_range(self, key: str, start: int, stop: int, etag: str | None = None) -> bytes:
+        """Return bytes ``[start, stop)`` of the object, failing if its ETag is not ``etag``."""
+
+
+class S3ObjectStore(ObjectStore):
+    """S3 or S3-compatible bucket accessed through boto3, imported on first use."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        max_connections: int = 10,
+    ) -> None:
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region = region
+        self.max_connections = max_connections
+        self._client: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """The boto3 S3 client, created lazily so local deployments never import boto3."""
+
+        with self._lock:
+            if self._client is None:
+                try:
+                    import boto3
+                    from botocore.config import Config
+                except ImportError as error:  # pragma: no cover - depends on the environment
+                    raise RuntimeError("DATA_SOURCE=s3 requires boto3") from error
+                self._client = boto3.client(
+                    "s3",
+                    endpoint_url=self.endpoint_url,
+                    region_name=self.region,
+                    config=Config(max_pool_connections=self.max_connections),
+                )
+            return self._client
+
+    @staticmethod
+    def _missing(error: Exception) -> bool:
+        response = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}
+
+    def head(self, key: str) -> ObjectInfo:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except Exception as error:
+            if self._missing(error):
+                raise FileNotFoundError(f"s3://{self.bucket}/{key}") from error
+            raise
+        return ObjectInfo(key=key, size=int(response["ContentLength"]), etag=response["ETag"])
+
+    def list(self, prefix: str) -> list[ObjectInfo]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        return [
+            ObjectInfo(key=item["Key"], size=int(item["Size"]), etag=item["ETag"])
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for item in page.get("Contents", [])
+        ]
+
+    def get_range(self, key: str, start: int, stop: int, etag: str | None = None) -> bytes:
+        if stop <= start:
+            return b""
+        options: dict[str, Any] = {"Range": f"bytes={start}-{stop - 1}"}
+        if etag is not None:
+            options["IfMatch"] = etag
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key, **options)
+        except Exception as error:
+            if self._missing(error):
+                raise FileNotFoundError(f"s3://{self.bucket}/{key}") from error
+            raise
+        return response["Body"].read()
+
+
+def coalesce_ranges(
+    ranges: Iterable[ByteRange], max_gap: int = 0, max_size: int | None = None
+) -> list[ByteRange]:
+    """Merge ``[start, stop)`` ranges separated by at most ``max_gap``, capped at ``max_size``.
+
+    Reading a small hole is cheaper than paying another request's latency; the cap keeps
+    single requests small enough to be fetched in parallel.
+    """
+
+    merged: list[ByteRange] = []
+    for start, stop in sorted(ranges):
+        if stop <= start:
+            continue
+        if merged and start - merged[-1][1] <= max_gap:
+            previous_start, previous_stop = merged[-1]
+            if max_size is None or max(stop, previous_stop) - previous_start <= max_size:
+                merged[-1] = (previous_start, max(stop, previous_stop))
+                continue
+        merged.append((start, stop))
+    return merged
+
+
+class BlockCache:
+    """Disk-backed LRU of fixed-size object blocks, keyed by ETag digest and block index.
+
+    Blocks are written atomically, survive restarts (the LRU order is rebuilt from file
+    modification times) and are evicted oldest first once ``max_bytes`` is exceeded. Because
+    the key is the ETag, a replaced object never serves stale blocks.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, int], int] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def digest(etag: str) -> str:
+        """Filesystem-safe identifier for an ETag."""
+
+        return hashlib.blake2b(etag.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: tuple[str, int]) -> Path:
+        return self.directory / key[0] / f"{key[1]:010d}"
+
+    def _load(self) -> None:
+        if not self.directory.exists():
+            return
+        found = [
+            (path.stat().st_mtime_ns, (path.parent.name, int(path.name)), path.stat().st_size)
+            for path in self.directory.glob("*/*")
+            if path.name.isdigit()
+        ]
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._path(key).unlink(missing_ok=True)
+
+    def get(self, etag: str, index: int) -> bytes | None:
+        """Return a cached block, refreshing its recency, or ``None``."""
+
+        key = (self.digest(etag), index)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            # The LRU order is rebuilt from modification times after a restart.
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._bytes -= self._entries.pop(key, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, etag: str, index: int, data: bytes) -> None:
+        """Store a block and evict least recently used blocks past the byte budget."""
+
+        key = (self.digest(etag), index)
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}")
+        staging.write_bytes(data)
+        os.replace(staging, target)
+        with self._lock:
+            self._bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._bytes += len(data)
+            self._evict()
+
+    def stats(self) -> dict[str, int | float]:
+        """Expose hit ratio and occupancy for diagnostics."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "blocks": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class BlockFetcher:
+    """Reads object byte ranges through the block cache, fetching misses concurrently."""
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        cache: BlockCache,
+        block_size: int,
+        max_gap: int,
+        max_request_bytes: int,
+        concurrency: int,
+    ) -> None:
+        self.store = store
+        self.cache = cache
+        self.block_size = block_size
+        self.max_gap_blocks = max_gap // block_size
+        self.max_request_blocks = max(max_request_bytes // block_size, 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="range-fetch"
+        )
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def _fetch_run(self, info: ObjectInfo, first: int, last: int) -> dict[int, bytes]:
+        start = first * self.block_size
+        stop = min((last + 1) * self.block_size, info.size)
+        payload = self.store.get_range(info.key, start, stop, info.etag)
+        with self._lock:
+            self.requests += 1
+            self.bytes_fetched += len(payload)
+        blocks: dict[int, bytes] = {}
+        for index in range(first, last + 1):
+            offset = (index - first) * self.block_size
+            blocks[index] = payload[offset : offset + self.block_size]
+            self.cache.put(info.etag, index, blocks[index])
+        return blocks
+
+    def blocks(self, info: ObjectInfo, indices: Iterable[int]) -> dict[int, bytes]:
+        """Return the requested blocks, fetching coalesced runs of misses in parallel."""
+
+        found: dict[int, bytes] = {}
+        missing: list[int] = []
+        for index in sorted(set(indices)):
+            cached = self.cache.get(info.etag, index)
+            if cached is None:
+                missing.append(index)
+            else:
+                found[index] = cached
+        runs = coalesce_ranges(
+            ((index, index + 1) for index in missing),
+            max_gap=self.max_gap_blocks,
+            max_size=self.max_request_blocks,
+        )
+        if len(runs) == 1:
+            found.update(self._fetch_run(info, runs[0][0], runs[0][1] - 1))
+        else:
+            futures = [
+                self._executor.submit(self._fetch_run, info, start, stop - 1)
+                for start, stop in runs
+            ]
+            for future in futures:
+                found.update(future.result())
+        return found
+
+    def read(self, info: ObjectInfo, start: int, stop: int) -> bytes:
+        """Return bytes ``[start, stop)`` of the object."""
+
+        stop = min(stop, info.size)
+        if stop <= start:
+            return b""
+        first, last = start // self.block_size, (stop - 1) // self.block_size
+        blocks = self.blocks(info, range(first, last + 1))
+        data = b"".join(blocks[index] for index in range(first, last + 1))
+        offset = first * self.block_size
+        return data[start - offset : stop - offset]
+
+    def prefetch(self, info: ObjectInfo, ranges: Iterable[ByteRange]) -> None:
+        """Warm the cache for several byte ranges (e.g. the column chunks of a row group)."""
+
+        indices: set[int] = set()
+        for start, stop in ranges:
+            stop = min(stop, info.size)
+            if stop > start:
+                indices.update(range(start // self.block_size, (stop - 1) // self.block_size + 1))
+        if indices:
+            self.blocks(info, indices)
+
+    def stats(self) -> dict[str, int]:
+        """Requests issued and bytes transferred since start-up."""
+
+        with self._lock:
+            return {"requests": self.requests, "bytes_fetched": self.bytes_fetched}
+
+
+class CachedObjectFile(io.RawIOBase):
+    """Seekable read-only file over one object version, served by a :class:`BlockFetcher`."""
+
+    def __init__(self, fetcher: BlockFetcher, info: ObjectInfo) -> None:
+        super().__init__()
+        self.fetcher = fetcher
+        self.info = info
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self.info.size}
+        self._position = max(base[whence] + offset, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        data = self.fetcher.read(self.info, self._position, self._position + len(view))
+        view[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def read(self, size: int = -1) -> bytes:
+        stop = self.info.size if size is None or size < 0 else self._position + size
+        data = self.fetcher.read(self.info, self._position, stop)
+        self._position += len(data)
+        return data
+
+
+class LocalStorage:
+    """Published artifacts on the local filesystem."""
+
+    filesystem: pafs.FileSystem | None = None
+
+    def locate(self, path: Path) -> str:
+        """Path string handed to pyarrow."""
+
+        return str(path)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_dir(self, path: Path) -> bool:
+        return path.is_dir()
+
+    def sync(self, path: Path) -> None:
+        """Local files are read in place."""
+
+    def prefetch(self, path: str, ranges: list[ByteRange]) -> None:
+        """The OS page cache already serves local reads."""
+
+    def stats(self) -> dict[str, Any]:
+        return {"data_source": "local"}
+
+
+class ObjectStorage:
+    """Published artifacts in a bucket, mirrored key-for-key from the local data folder."""
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        root: Path,
+        prefix: str,
+        fetcher: BlockFetcher,
+        metadata_ttl: float,
+    ) -> None:
+        self.store = store
+        self.root = Path(os.path.abspath(root))
+        self.prefix = prefix.strip("/")
+        self.fetcher = fetcher
+        # pyarrow is only needed once the bucket is read, not to import the storage settings.
+        import pyarrow.fs as pafs
+
+        from .object_fs import ObjectStoreHandler
+
+        self.handler: ObjectStoreHandler = ObjectStoreHandler(fetcher, metadata_ttl)
+        self.filesystem: pafs.FileSystem = pafs.PyFileSystem(self.handler)
+        self._synced: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def locate(self, path: Path) -> str:
+        """Object key for a local path under the data folder."""
+
+        absolute = Path(os.path.abspath(path))
+        try:
+            relative = absolute.relative_to(self.root).as_posix()
+        except ValueError:
+            relative = absolute.name
+        return f"{self.prefix}/{relative}" if self.prefix else relative
+
+    def exists(self, path: Path) -> bool:
+        return self.handler.exists(self.locate(path))
+
+    def is_dir(self, path: Path) -> bool:
+        return self.handler.is_dir(self.locate(path))
+
+    def sync(self, path: Path) -> None:
+        """Mirror a small object (the manifest) to ``path`` whenever its ETag changes."""
+
+        key = self.locate(path)
+        info = self.handler.info(key)
+        with self._lock:
+            current = self._synced.get(key) == info.etag and path.exists()
+        if current:
+            return
+        payload = self.store.get_range(key, 0, info.size, info.etag)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{os.getpid()}.sync")
+        staging.write_bytes(payload)
+        os.replace(staging, path)
+        with self._lock:
+            self._synced[key] = info.etag
+
+    def prefetch(self, path: str, ranges: list[ByteRange]) -> None:
+        """Fetch the byte ranges a scan is about to read in one concurrent, coalesced batch."""
+
+        self.fetcher.prefetch(self.handler.info(path), ranges)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "data_source": "s3",
+            "block_cache": self.fetcher.cache.stats(),
+            **self.fetcher.stats(),
+        }
+
+
+Storage = LocalStorage | ObjectStorage
+
+_storage: tuple[tuple[Any, ...], Storage] | None = None
+_storage_lock = threading.Lock()
+
+
+def _storage_config() -> tuple[Any, ...]:
+    return (
+        settings.data_source,
+        settings.manifest_path,
+        settings.s3_bucket,
+        settings.s3_prefix,
+        settings.s3_endpoint_url,
+        settings.s3_region,
+        settings.block_cache_dir,
+        settings.block_cache_max_bytes,
+        settings.block_size,
+        settings.range_coalesce_gap,
+        settings.range_request_max_bytes,
+        settings.range_fetch_concurrency,
+        settings.s3_metadata_ttl_seconds,
+    )
+
+
+def build_storage(store: ObjectStore | None = None) -> Storage:
+    """Create the backend selected by ``settings.data_source``.
+
+    ``store`` overrides the S3 client, e.g. to read from another S3-compatible service.
+    """
+
+    if settings.data_source != "s3":
+        return LocalStorage()
+    store = store or S3ObjectStore(
+        settings.s3_bucket,
+        endpoint_url=settings.s3_endpoint_url,
+        region=settings.s3_region,
+        max_connections=settings.range_fetch_concurrency,
+    )
+    fetcher = BlockFetcher(
+        store,
+        BlockCache(Path(settings.block_cache_dir), settings.block_cache_max_bytes),
+        block_size=settings.block_size,
+        max_gap=settings.range_coalesce_gap,
+        max_request_bytes=settings.range_request_max_bytes,
+        concurrency=settings.range_fetch_concurrency,
+    )
+    return ObjectStorage(
+        store,
+        Path(settings.manifest_path).parent,
+        settings.s3_prefix,
+        fetcher,
+        settings.s3_metadata_ttl_seconds,
+    )
+
+
+def get_storage() -> Storage:
+    """Return the process-wide backend, rebuilt when the storage settings change."""
+
+    global _storage
+    config = _storage_config()
+    with _storage_lock:
+        if _storage is None or _storage[0] != config:
+            _storage = (config, build_storage())
+        return _storage[1]
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from ..models import AgentStats
+from ..schemas import AgentCallsQuery, PaginatedCallsResponse
 from ..services import agents as agent_service
+from ..services import calls as call_service
+from ..utils.serialization import envelope_json, json_response
 
 router = APIRouter(prefix="/api/agents", tags=["agents"])
 
 
 @router.get("", response_model=list[AgentStats])
-async def list_agents() -> list[AgentStats]:
-    """Expose placeholder leaderboard data."""
+async def list_agents() -> Response:
+    """Return the agent leaderboard aggregated from the ETL rollups."""
 
-    return agent_service.list_agent_stats()
+    # Pre-encoded JSON bypasses per-row validation; ``response_model`` still documents it.
+    return json_response(await agent_service.fetch_agent_stats_json())
+
+
+@router.get("/{agent_id}/calls", response_model=PaginatedCallsResponse)
+async def list_agent_calls(agent_id: str, query: AgentCallsQuery = Depends()) -> Response:
+    """Return one agent's calls in time order, reading only the row groups they appear in."""
+
+    try:
+        page = await agent_service.list_agent_calls(agent_id, query)
+    except call_service.InvalidCursorError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+    body = envelope_json(
+        page.data,
+        meta={"per_page": query.per_page, "total": page.total},
+        links={"next": agent_service.agent_calls_link(agent_id, query, page.next_cursor)},
+    )
+    return json_response(body)
@@ -2,21 +2,58 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 
-from ..schemas import CallFilters, PaginatedCallsResponse
+from ..models import CallRecord
+from ..schemas import CallFilters, ExportFormat, PaginatedCallsResponse
 from ..services import calls as call_service
+from ..services import export as export_service
+from ..utils.serialization import envelope_json, json_response
 
 router = APIRouter(prefix="/api/calls", tags=["calls"])
 
 
 @router.get("", response_model=PaginatedCallsResponse)
-async def list_calls(filters: CallFilters = Depends()) -> PaginatedCallsResponse:
-    """Return a paginated list of call records."""
-
-    records = await call_service.list_calls(filters)
-    return PaginatedCallsResponse(
-        data=records,
-        meta={"page": filters.page, "per_page": filters.per_page, "total": len(records)},
-        links={"next": None},
+async def list_calls(filters: CallFilters = Depends()) -> Response:
+    """Return a page of call records with an opaque keyset cursor in ``links.next``."""
+
+    try:
+        page = await call_service.list_calls(filters)
+    except call_service.InvalidCursorError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+    # Rows arrive pre-encoded; ``response_model`` only documents the envelope.
+    body = envelope_json(
+        page.data,
+        meta={"page": filters.page, "per_page": filters.per_page, "total": page.total},
+        links={"next": page.next_link(filters)},
+    )
+    return json_response(body)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_calls(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    filters: CallFilters = Depends(),
+) -> StreamingResponse:
+    """Stream every call matching the filters as NDJSON, CSV or Arrow IPC batches."""
+
+    try:
+        chunks = export_service.iter_export(filters, export_format)
+    except call_service.InvalidCursorError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+    return StreamingResponse(
+        chunks,
+        media_type=export_service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="calls.{export_format}"'},
     )
+
+
+@router.get("/{call_id}", response_model=CallRecord)
+async def get_call(call_id: str) -> CallRecord:
+    """Return one call, located through the id index rather than a dataset scan."""
+
+    call = await call_service.get_call(call_id)
+    if call is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Call not found")
+    return call
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+
+from ..services import warmup as warmup_service
 
 router = APIRouter(prefix="/api", tags=["health"])
 
@@ -12,3 +14,17 @@ async def healthz() -> dict[str, str]:
     """Basic liveness check."""
 
     return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(response: Response) -> dict[str, object]:
+    """Readiness: ``200`` once the data layer is warmed against a readable manifest.
+
+    Until then (or when the manifest disappears) it answers ``503`` so load balancers keep
+    traffic away from workers whose first requests would be served cold.
+    """
+
+    state = await warmup_service.warmup.check()
+    if not state.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"data": state.to_dict()}
@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from ..models import MetricPoint
+from ..models import HandleTimePercentiles, MetricPoint
+from ..schemas import MetricsRequest
 from ..services import metrics as metrics_service
+from ..utils.serialization import json_response
 
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
 
 @router.get("", response_model=list[MetricPoint])
-async def get_metrics() -> list[MetricPoint]:
-    """Return synthetic KPI data."""
+async def get_metrics(request: MetricsRequest = Depends()) -> Response:
+    """Return one bucketed KPI series with period-over-period deltas from the ETL rollups."""
 
-    return metrics_service.get_metrics()
+    try:
+        body = await metrics_service.fetch_metrics_json(request)
+    except metrics_service.InvalidMetricsRequestError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+    # Pre-encoded JSON bypasses per-row validation; ``response_model`` still documents it.
+    return json_response(body)
+
+
+@router.get("/handle-time", response_model=HandleTimePercentiles)
+async def get_handle_time(
+    region: str | None = None, issue_type: str | None = None
+) -> HandleTimePercentiles:
+    """Return handle-time percentiles merged from the rollup sketches."""
+
+    return await metrics_service.fetch_handle_time_percentiles(region, issue_type)
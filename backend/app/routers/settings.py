@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import asdict
 from pathlib import Path
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from ..core.config import settings
+from ..db.cache import result_cache
 from ..repositories import manifest_repo
+from ..repositories.storage import get_storage
+from ..services import events as events_service
+from ..services import refresh as refresh_service
+from ..services.executor import worker_pool
+from ..services.singleflight import flights
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -16,5 +25,84 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 async def get_manifest() -> dict[str, object]:
     """Expose manifest metadata so the frontend can display diagnostics."""
 
-    record = manifest_repo.get_manifest(Path(settings.manifest_path))
-    return {"data": record.__dict__}
+    # Off the event loop: in S3 mode reading the manifest may reach the bucket.
+    record = await asyncio.to_thread(manifest_repo.get_manifest, Path(settings.manifest_path))
+    return {"data": asdict(record)}
+
+
+@router.get("/manifest/events", response_class=StreamingResponse)
+async def stream_manifest_events() -> StreamingResponse:
+    """Push the manifest and the latest KPI deltas as server-sent events on every publish.
+
+    One shared watcher computes each event once for every connected dashboard, replacing
+    per-widget polling of ``/manifest``.
+    """
+
+    return StreamingResponse(
+        await events_service.manifest_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_links(job_id: str) -> dict[str, str]:
+    return {
+        "self": f"/api/settings/refresh/{job_id}",
+        "events": f"/api/settings/refresh/{job_id}/events",
+    }
+
+
+@router.post("/refresh", status_code=status.HTTP_202_ACCEPTED)
+async def start_refresh() -> dict[str, object]:
+    """Start an ETL refresh in a background process, or return the one already running.
+
+    Answers ``409`` while a run started by another process is publishing.
+    """
+
+    if not settings.enable_refresh_endpoint:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="The refresh endpoint is disabled"
+        )
+    try:
+        job, created = await asyncio.to_thread(refresh_service.trigger_refresh)
+    except refresh_service.EtlLockedError as error:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error)) from error
+    return {"data": job.to_dict(), "meta": {"created": created}, "links": _job_links(job.id)}
+
+
+@router.get("/refresh/{job_id}")
+async def get_refresh(job_id: str) -> dict[str, object]:
+    """Report a refresh job's status, current stage, rows processed and throughput."""
+
+    snapshot = refresh_service.refresh_jobs.snapshot(job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Refresh job not found")
+    return {"data": snapshot[1], "links": _job_links(job_id)}
+
+
+@router.get("/refresh/{job_id}/events", response_class=StreamingResponse)
+async def stream_refresh(job_id: str) -> StreamingResponse:
+    """Stream a refresh job's progress as server-sent events until it finishes."""
+
+    if refresh_service.refresh_jobs.snapshot(job_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Refresh job not found")
+    return StreamingResponse(
+        refresh_service.job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/runtime")
+async def get_runtime() -> dict[str, object]:
+    """Expose worker pool queue depth, cache counters and storage traffic for diagnostics."""
+
+    return {
+        "data": {
+            "worker_pool": worker_pool.stats(),
+            "result_cache": result_cache.stats(),
+            "single_flight": flights.stats(),
+            "storage": get_storage().stats(),
+            "manifest_events": events_service.broadcaster.stats(),
+        }
+    }
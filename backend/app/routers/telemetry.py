@@ -0,0 +1,23 @@
+"""Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..utils.instrumentation import registry
+
+router = APIRouter(tags=["telemetry"])
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Expose request, Parquet, cache, worker pool and ETL metrics for scraping."""
+
+    # Rendered on a worker thread: the ETL gauges read the manifest, possibly from S3.
+    body = await asyncio.to_thread(registry.render)
+    return PlainTextResponse(body, media_type=PROMETHEUS_MEDIA_TYPE)
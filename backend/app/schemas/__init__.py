@@ -1,6 +1,14 @@
 """Request/response schema placeholders for routers."""
 
-from .calls import CallFilters, PaginatedCallsResponse
+from .calls import AgentCallsQuery, CallFilters, ExportFormat, PaginatedCallsResponse
 from .auth import AuthCredentials
+from .metrics import MetricsRequest
 
-__all__ = ["CallFilters", "PaginatedCallsResponse", "AuthCredentials"]
+__all__ = [
+    "AgentCallsQuery",
+    "CallFilters",
+    "ExportFormat",
+    "PaginatedCallsResponse",
+    "AuthCredentials",
+    "MetricsRequest",
+]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, conint
 
 from ..models import CallRecord
 
+ExportFormat = Literal["ndjson", "csv", "arrow"]
+
 
 class CallFilters(BaseModel):
     """Filter options accepted by the calls router."""
@@ -16,6 +20,16 @@ class CallFilters(BaseModel):
     per_page: conint(ge=1, le=200) = 50
     region: str | None = None
     issue_type: str | None = None
+    cursor: str | None = None
+
+
+class AgentCallsQuery(BaseModel):
+    """Paging options accepted by the per-agent call history route."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    per_page: conint(ge=1, le=200) = 50
+    cursor: str | None = None
 
 
 class PaginatedCallsResponse(BaseModel):
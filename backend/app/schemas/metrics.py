@@ -0,0 +1,26 @@
+"""Schemas powering the /api/metrics endpoints."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, constr
+
+KpiName = Literal["volume", "avg_handle_time", "resolution_rate"]
+Granularity = Literal["hour", "day", "week"]
+
+
+class MetricsRequest(BaseModel):
+    """KPI, window and filters accepted by the metrics series route.
+
+    ``time_range`` is a count of hours, days or weeks (``"48h"``, ``"30d"``, ``"12w"``) ending
+    at the latest published bucket; it mirrors ``FilterState.time_range`` in the dashboards.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    kpi: KpiName = "volume"
+    time_range: constr(pattern=r"^[1-9][0-9]{0,3}[hdw]$") = "30d"
+    granularity: Granularity = "day"
+    region: str | None = None
+    issue_type: str | None = None
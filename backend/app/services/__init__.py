@@ -1,8 +1,19 @@
-"""Business logic layer stubs."""
+"""Business logic layer stubs.
 
-from .calls import list_calls
-from .agents import list_agent_stats
-from .metrics import get_metrics
-from .data_access import load_calls_frame
+Submodules are loaded on first use: ``from ..services import calls`` hands out a lazy module,
+so importing the app does not pull in Polars or pyarrow until a data route runs.
+"""
 
-__all__ = ["list_calls", "list_agent_stats", "get_metrics", "load_calls_frame"]
+from __future__ import annotations
+
+from ..utils.lazy import lazy_package
+
+_EXPORTS = {
+    "list_calls": "calls",
+    "list_agent_stats": "agents",
+    "get_metrics": "metrics",
+}
+
+__all__ = ["list_calls", "list_agent_stats", "get_metrics"]
+
+__getattr__ = lazy_package(__name__, _EXPORTS)
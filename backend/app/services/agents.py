@@ -1,18 +1,197 @@
-"""Agent leaderboard helpers."""
+"""Agent leaderboard helpers backed by the per-agent rollup."""
 
 from __future__ import annotations
 
+import json
+import math
+from urllib.parse import quote, urlencode
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from support_analytics.indexes import AGENT_INDEX
+from support_analytics.manifest import ManifestRecord
+from support_analytics.sketch import DDSketch
+
+from ..db.cache import result_cache
 from ..models import AgentStats
+from ..repositories import parquet_repo
+from ..schemas import AgentCallsQuery
+from ..utils.serialization import rows_json
+from .calls import CALL_COLUMNS, CallsPage, decode_cursor, encode_cursor, keyset_predicate
+from .data_access import (
+    MISSING_MANIFEST_HASH,
+    current_manifest_hash,
+    dataset_root,
+    fetch_manifest,
+    fetch_manifest_hash,
+    index_path,
+    rollup_path,
+)
+from .executor import worker_pool
+from .singleflight import single_flight
+
+PERCENTILE_BUCKET_WIDTH = 25
+
+
+def _quantile_seconds(sketch: DDSketch, q: float) -> int | None:
+    value = sketch.quantile(q)
+    return None if value is None else round(value)
+
+
+def _percentile_bucket(median: int | None, overall: DDSketch) -> int | None:
+    """Place an agent's median handle time into a 25/50/75/100 percentile bucket."""
+
+    if median is None or overall.count == 0:
+        return None
+    buckets = math.ceil(overall.rank(median) * 100 / PERCENTILE_BUCKET_WIDTH)
+    return max(buckets, 1) * PERCENTILE_BUCKET_WIDTH
+
+
+def _compute_agent_frame() -> pl.DataFrame:
+    rollup = pl.from_arrow(parquet_repo.read_table(rollup_path("agents")))
+    assert isinstance(rollup, pl.DataFrame)
+    sketches = [
+        DDSketch.from_bytes(payload) if payload else DDSketch()
+        for payload in rollup.get_column("duration_sketch").to_list()
+    ]
+    overall = DDSketch()
+    for sketch in sketches:
+        overall.merge(sketch)
+    medians = [_quantile_seconds(sketch, 0.5) for sketch in sketches]
+    calls = pl.col("calls")
+    rated = pl.col("skill_rating_count")
+    return rollup.select(
+        pl.col("agent_id").cast(pl.Utf8),
+        pl.when(rated > 0)
+        .then((pl.col("skill_rating_sum") / rated).round(2))
+        .otherwise(0.0)
+        .alias("avg_rating"),
+        calls.alias("total_calls"),
+        pl.when(calls > 0)
+        .then(pl.col("duration_sum") // calls)
+        .otherwise(0)
+        .alias("avg_resolution_seconds"),
+        pl.Series("p50_resolution_seconds", medians, dtype=pl.Int64),
+        pl.Series(
+            "p90_resolution_seconds",
+            [_quantile_seconds(sketch, 0.9) for sketch in sketches],
+            dtype=pl.Int64,
+        ),
+        pl.Series(
+            "p99_resolution_seconds",
+            [_quantile_seconds(sketch, 0.99) for sketch in sketches],
+            dtype=pl.Int64,
+        ),
+        pl.Series(
+            "resolution_percentile_bucket",
+            [_percentile_bucket(median, overall) for median in medians],
+            dtype=pl.Int64,
+        ),
+    ).sort(["total_calls", "agent_id"], descending=[True, False])
+
+
+def agent_stats_frame() -> pl.DataFrame:
+    """Return the leaderboard as a columnar frame with the ``AgentStats`` columns.
+
+    The rollup holds one row per agent, so the answer never scans individual calls. Handle
+    time percentiles come from each agent's merged DDSketch, and the percentile bucket places
+    the agent's median within the sketch merged across all agents. The frame is not cached;
+    :func:`agent_stats_json` caches its encoding.
+    """
+
+    return _compute_agent_frame()
+
+
+@single_flight
+def agent_stats_json() -> bytes:
+    """Return the leaderboard pre-encoded as a JSON array, cached between manifest changes."""
+
+    key = result_cache.key("agents:json", None, current_manifest_hash())
+    return result_cache.get_or_compute(key, lambda: rows_json(agent_stats_frame()))
+
+
+@single_flight
+async def fetch_agent_stats_json() -> bytes:
+    """Await the pre-encoded leaderboard, computing cache misses on the worker pool."""
+
+    key = result_cache.key("agents:json", None, await fetch_manifest_hash())
+    return await worker_pool.run_cached(key, agent_stats_json)
 
 
 def list_agent_stats() -> list[AgentStats]:
-    """Return placeholder agent summaries."""
-
-    return [
-        AgentStats(
-            agent_id="A-101",
-            avg_rating=4.8,
-            total_calls=120,
-            avg_resolution_seconds=480,
+    """Return the leaderboard as validated models, decoded from the cached JSON."""
+
+    return [AgentStats.model_validate(row) for row in json.loads(agent_stats_json())]
+
+
+def agent_calls_link(agent_id: str, query: AgentCallsQuery, cursor: str | None) -> str | None:
+    """Render ``links.next`` for one agent's call history."""
+
+    if cursor is None:
+        return None
+    params = urlencode({"per_page": query.per_page, "cursor": cursor})
+    return f"/api/agents/{quote(agent_id, safe='')}/calls?{params}"
+
+
+def read_agent_calls(
+    agent_id: str, query: AgentCallsQuery, record: ManifestRecord | None
+) -> CallsPage:
+    """Read one page of an agent's calls from the row groups listed in their posting list.
+
+    Postings are visited in ``started_at`` order and reading stops once one row more than the
+    page holds has been read and the next posting starts after every row group already read,
+    so only row groups that can contribute to the page are decoded. The extra row tells
+    whether another page exists, so a history that ends exactly on a page boundary gets no
+    ``next_cursor``.
+    """
+
+    postings = parquet_repo.read_table(
+        index_path(AGENT_INDEX, record), predicate=ds.field("agent_id") == agent_id
+    ).to_pylist()
+    # Each index part is sorted, but an incremental run's part follows the earlier ones.
+    postings.sort(key=lambda posting: (posting["first_started_at"], posting["file"]))
+    total = sum(posting["calls"] for posting in postings)
+    after = None if query.cursor is None else decode_cursor(query.cursor)[0]
+    root = dataset_root(record)
+    tables: list[pa.Table] = []
+    collected = 0
+    horizon = None
+    for posting in postings:
+        if after is not None and posting["last_started_at"] < after:
+            continue
+        if collected > query.per_page and posting["first_started_at"] > horizon:
+            break
+        table = parquet_repo.read_row_groups(
+            root / posting["file"], [posting["row_group"]], CALL_COLUMNS, {"agent_id": agent_id}
         )
-    ]
+        if query.cursor is not None:
+            table = table.filter(keyset_predicate(query.cursor))
+        tables.append(table)
+        collected += table.num_rows
+        horizon = max(horizon or posting["last_started_at"], posting["last_started_at"])
+    if not tables:
+        return CallsPage(data=b"[]", row_count=0, next_cursor=None, total=total)
+    rows = pa.concat_tables(tables).sort_by([("started_at", "ascending"), ("id", "ascending")])
+    page = rows.slice(0, query.per_page)
+    next_cursor = None
+    if rows.num_rows > query.per_page:
+        last = page.slice(page.num_rows - 1).to_pylist()[0]
+        next_cursor = encode_cursor(last["started_at"], last["id"])
+    return CallsPage(
+        data=rows_json(page), row_count=page.num_rows, next_cursor=next_cursor, total=total
+    )
+
+
+@single_flight
+async def list_agent_calls(agent_id: str, query: AgentCallsQuery) -> CallsPage:
+    """Return one page of an agent's call history using the agent posting-list index."""
+
+    record = await fetch_manifest()
+    manifest_hash = MISSING_MANIFEST_HASH if record is None else record.hash
+    if query.cursor is not None:
+        decode_cursor(query.cursor)
+    params = {"agent_id": agent_id, **query.model_dump()}
+    key = result_cache.key("agents:calls", params, manifest_hash)
+    return await worker_pool.run_cached(key, read_agent_calls, agent_id, query, record)
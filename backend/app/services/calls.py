@@ -1,20 +1,201 @@
-"""Business logic placeholder for call queries."""
+"""Call queries compiled into pushed-down Parquet scans."""
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlencode
+
+import pyarrow.dataset as ds
+
+from support_analytics.indexes import CALL_INDEX
+from support_analytics.manifest import ManifestRecord
+from support_analytics.timestamps import format_timestamp, parse_timestamp, timestamp_scalar
+
+from ..db.cache import result_cache
 from ..models import CallRecord
+from ..repositories import parquet_repo
 from ..schemas import CallFilters
+from ..utils.serialization import rows_json, wire_frame
+from .data_access import (
+    MISSING_MANIFEST_HASH,
+    artifact_path,
+    dataset_root,
+    fetch_manifest,
+    index_path,
+)
+from .executor import worker_pool
+from .singleflight import single_flight
+
+CALL_COLUMNS = list(CallRecord.model_fields)
+CALLS_PATH = "/api/calls"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor that was not produced by this API."""
+
+
+@dataclass(slots=True)
+class CallsPage:
+    """One page of calls plus the keyset cursor and cached total for its filter set.
+
+    Rows are kept as the pre-encoded JSON array so the hot path never builds ``CallRecord``
+    models; the ETL already enforces the column contract.
+    """
+
+    data: bytes
+    row_count: int
+    next_cursor: str | None
+    total: int
+
+    @property
+    def records(self) -> list[CallRecord]:
+        """Validated models for callers that need objects rather than bytes."""
+
+        return [CallRecord.model_validate(row) for row in json.loads(self.data)]
+
+    def next_link(self, filters: CallFilters) -> str | None:
+        """Render ``links.next`` carrying the same filters and the opaque cursor."""
+
+        if self.next_cursor is None:
+            return None
+        query = {
+            "per_page": filters.per_page,
+            "region": filters.region,
+            "issue_type": filters.issue_type,
+            "cursor": self.next_cursor,
+        }
+        return f"{CALLS_PATH}?{urlencode({k: v for k, v in query.items() if v is not None})}"
+
+
+def encode_cursor(started_at: datetime, call_id: str) -> str:
+    """Pack the ``(started_at, id)`` sort key of the last row into an opaque token."""
+
+    key = [format_timestamp(started_at), call_id]
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Unpack a cursor produced by :func:`encode_cursor`."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        started_at, call_id = json.loads(raw)
+        if not isinstance(started_at, str) or not isinstance(call_id, str):
+            raise TypeError("cursor fields must be strings")
+        return parse_timestamp(started_at), call_id
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as error:
+        raise InvalidCursorError("Malformed pagination cursor") from error
+
+
+def compile_match(filters: CallFilters) -> dict[str, str]:
+    """Collect the optional equality filters: they prune row groups, then match on codes."""
 
+    candidates = (("customer_region", filters.region), ("issue_type", filters.issue_type))
+    return {column: value for column, value in candidates if value is not None}
 
-async def list_calls(filters: CallFilters) -> list[CallRecord]:
-    """Return a handful of records until Polars-backed queries are implemented."""
 
-    dummy = CallRecord(
-        id="call-001",
-        agent_id="A-101",
-        customer_region=filters.region or "NA",
-        issue_type=filters.issue_type or "Billing",
-        duration_seconds=540,
-        resolution_status="Resolved",
+def keyset_predicate(cursor: str) -> ds.Expression:
+    """Rows strictly after the cursor in ``(started_at, id)`` order."""
+
+    started_at, call_id = decode_cursor(cursor)
+    moment = timestamp_scalar(started_at)
+    after = ds.field("started_at") > moment
+    return after | ((ds.field("started_at") == moment) & (ds.field("id") > call_id))
+
+
+def count_calls(filters: CallFilters, parquet_path: Path, manifest_hash: str) -> int:
+    """Return the number of calls matching the filter set, cached per manifest hash."""
+
+    params = {"region": filters.region, "issue_type": filters.issue_type}
+    key = result_cache.key("calls:count", params, manifest_hash)
+    return result_cache.get_or_compute(
+        key, lambda: parquet_repo.count_rows(parquet_path, None, compile_match(filters))
+    )
+
+
+def read_page(filters: CallFilters, record: ManifestRecord | None) -> CallsPage:
+    """Scan one page of calls and its total; runs on the worker pool."""
+
+    manifest_hash = MISSING_MANIFEST_HASH if record is None else record.hash
+    predicate = None
+    offset = (filters.page - 1) * filters.per_page
+    if filters.cursor is not None:
+        predicate = keyset_predicate(filters.cursor)
+        offset = 0
+    parquet_path = artifact_path(record)
+    table = parquet_repo.scan_page(
+        parquet_path,
+        columns=CALL_COLUMNS,
+        predicate=predicate,
+        offset=offset,
+        # One row past the page tells whether another page exists.
+        limit=filters.per_page + 1,
+        match=compile_match(filters),
+    )
+    next_cursor = None
+    if table.num_rows > filters.per_page:
+        table = table.slice(0, filters.per_page)
+        last = table.slice(table.num_rows - 1).to_pylist()[0]
+        next_cursor = encode_cursor(last["started_at"], last["id"])
+    return CallsPage(
+        data=rows_json(table),
+        row_count=table.num_rows,
+        next_cursor=next_cursor,
+        total=count_calls(filters, parquet_path, manifest_hash),
+    )
+
+
+@single_flight
+async def list_calls(filters: CallFilters) -> CallsPage:
+    """Return one page of calls matching ``filters``.
+
+    Region and issue type are matched on dictionary codes and only the ``CallRecord`` columns
+    (plus the filtered ones) are decoded. With a ``cursor`` the page starts right after the encoded
+    ``(started_at, id)`` key, so row groups before it are pruned and every page costs the
+    same; without one, ``page`` falls back to an offset for backwards compatibility. Pages
+    and totals are cached per normalized filter set and manifest hash, and misses are
+    scanned on the worker pool.
+    """
+
+    record = await fetch_manifest()
+    manifest_hash = MISSING_MANIFEST_HASH if record is None else record.hash
+    if filters.cursor is not None:
+        decode_cursor(filters.cursor)
+    key = result_cache.key("calls", filters, manifest_hash)
+    return await worker_pool.run_cached(key, read_page, filters, record)
+
+
+def read_call(call_id: str, record: ManifestRecord | None) -> CallRecord | None:
+    """Look ``call_id`` up in the id index and decode only the row group holding it."""
+
+    entries = parquet_repo.read_table(
+        index_path(CALL_INDEX, record), predicate=ds.field("id") == call_id
     )
-    return [dummy]
+    if entries.num_rows == 0:
+        return None
+    entry = entries.slice(0, 1).to_pylist()[0]
+    table = parquet_repo.read_row_groups(
+        dataset_root(record) / entry["file"], [entry["row_group"]], CALL_COLUMNS
+    )
+    row = wire_frame(table.slice(entry["row"], 1)).row(0, named=True)
+    return CallRecord.model_validate(row)
+
+
+@single_flight
+async def get_call(call_id: str) -> CallRecord | None:
+    """Return one call by id, or ``None`` when the published dataset does not contain it.
+
+    The sidecar index is sorted by id, so statistics prune it to one small row group, and
+    the dataset read is limited to the single row group the index points at.
+    """
+
+    record = await fetch_manifest()
+    manifest_hash = MISSING_MANIFEST_HASH if record is None else record.hash
+    key = result_cache.key("calls:id", {"id": call_id}, manifest_hash)
+    return await worker_pool.run_cached(key, read_call, call_id, record)
@@ -1,13 +1,85 @@
-"""Placeholder data access layer for local Parquet files."""
+"""Centralized read path over the published Parquet artifacts."""
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
+from support_analytics.manifest import ManifestRecord
+
 from ..core.config import settings
+from ..repositories import manifest_repo, parquet_repo
+
+MISSING_MANIFEST_HASH = "missing"
+
+
+def current_manifest() -> ManifestRecord | None:
+    """Return the published manifest, or ``None`` before the ETL has run."""
+
+    try:
+        return manifest_repo.get_manifest(Path(settings.manifest_path))
+    except FileNotFoundError:
+        return None
+
+
+def current_manifest_hash() -> str:
+    """Return the hash of the published artifact, used to version cached results."""
+
+    record = current_manifest()
+    return MISSING_MANIFEST_HASH if record is None else record.hash
+
+
+async def fetch_manifest() -> ManifestRecord | None:
+    """Await :func:`current_manifest` off the event loop.
+
+    In S3 mode reading the manifest may HEAD or GET the bucket, which must not block the
+    loop; async callers use this instead.
+    """
+
+    return await asyncio.to_thread(current_manifest)
+
+
+async def fetch_manifest_hash() -> str:
+    """Await :func:`current_manifest_hash` off the event loop."""
+
+    record = await fetch_manifest()
+    return MISSING_MANIFEST_HASH if record is None else record.hash
+
+
+def artifact_path(record: ManifestRecord | None = None) -> Path:
+    """Resolve the dataset the manifest points at, defaulting to ``settings.parquet_path``."""
+
+    record = record if record is not None else current_manifest()
+    if record is not None and parquet_repo.exists(Path(record.path)):
+        return Path(record.path)
+    return Path(settings.parquet_path)
+
+
+def dataset_root(record: ManifestRecord | None = None) -> Path:
+    """Directory the index ``file`` entries are relative to, resolved in the storage backend.
+
+    A partitioned dataset is its own root and a monolithic file's root is its folder. The
+    check goes through the storage backend because in S3 mode the dataset is not on disk.
+    """
+
+    artifact = artifact_path(record)
+    return artifact if parquet_repo.is_dir(artifact) else artifact.parent
+
+
+def rollup_path(name: str, record: ManifestRecord | None = None) -> Path:
+    """Locate a rollup table published by the ETL, e.g. ``"agents"`` or ``"kpi_hourly"``."""
+
+    record = record if record is not None else current_manifest()
+    if record is None or not record.rollups or name not in record.rollups:
+        raise FileNotFoundError(f"Rollup '{name}' has not been published")
+    return Path(record.rollups[name])
+
 
+def index_path(name: str, record: ManifestRecord | None = None) -> Path:
+    """Locate a point-lookup index sidecar published by the ETL, e.g. ``"calls"``."""
 
-def load_calls_frame() -> str:
-    """Return a human-readable message until Polars integration lands."""
+    record = record if record is not None else current_manifest()
+    if record is None or not record.indexes or name not in record.indexes:
+        raise FileNotFoundError(f"Index '{name}' has not been published")
+    return Path(record.indexes[name])
 
-    return f"Would load {Path(settings.parquet_path).resolve()}"
@@ -0,0 +1,173 @@
+"""Server-sent manifest events: one watcher per process fanning out to every subscriber.
+
+A single task polls the manifest (a ``stat`` per tick locally, a TTL-throttled ``HEAD`` on
+object storage) and, when the published hash changes, builds one event holding the manifest
+and the latest KPI points with their deltas. The encoded frame is shared by all subscribers,
+so N dashboards cost one computation instead of N clients × M widgets of polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Any, AsyncIterator, get_args
+
+import structlog
+
+from ..core.config import settings
+from ..schemas.metrics import KpiName, MetricsRequest
+from . import metrics as metrics_service
+from .data_access import MISSING_MANIFEST_HASH, current_manifest
+
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+
+logger = structlog.get_logger(__name__)
+
+
+def _kpi_snapshot() -> dict[str, dict[str, Any] | None]:
+    """Latest point of each default dashboard series, e.g. today's volume and its delta."""
+
+    snapshot: dict[str, dict[str, Any] | None] = {}
+    for kpi in get_args(KpiName):
+        series = json.loads(metrics_service.metrics_json(MetricsRequest(kpi=kpi)))
+        snapshot[kpi] = series[-1] if series else None
+    return snapshot
+
+
+def build_manifest_event() -> tuple[str, bytes]:
+    """Return the current manifest hash and its encoded ``manifest`` event frame."""
+
+    record = current_manifest()
+    if record is None:
+        return MISSING_MANIFEST_HASH, b""
+    payload = {"manifest": asdict(record), "kpis": _kpi_snapshot()}
+    data = json.dumps(payload, separators=(",", ":"), default=str)
+    return record.hash, f"event: manifest\nid: {record.hash}\ndata: {data}\n\n".encode("utf-8")
+
+
+class ManifestBroadcaster:
+    """Watch the manifest and push each newly published revision to subscriber queues.
+
+    The watcher starts with the first subscriber and stops with the last one. A failed poll
+    (e.g. a manifest caught mid-publish on object storage) is logged and counted, and the
+    next tick tries again. Queues hold one frame: a slow client that has not read the
+    previous revision only ever receives the newest, so a stalled connection cannot grow
+    memory.
+    """
+
+    def __init__(self, poll_interval: float | None = None) -> None:
+        self._poll_interval = poll_interval
+        self._subscribers: set[asyncio.Queue[bytes]] = set()
+        self._watcher: asyncio.Task[None] | None = None
+        self._current: tuple[str, bytes] | None = None
+        self._lock = asyncio.Lock()
+        self.broadcasts = 0
+        self.errors = 0
+
+    @property
+    def poll_interval(self) -> float:
+        """Seconds between manifest checks."""
+
+        return self._poll_interval or settings.manifest_poll_interval_seconds
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue[bytes], frame: bytes) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    async def poll(self) -> bool:
+        """Check the manifest once; broadcast and return ``True`` when its hash changed."""
+
+        async with self._lock:
+            record = await asyncio.to_thread(current_manifest)
+            manifest_hash = MISSING_MANIFEST_HASH if record is None else record.hash
+            if self._current is not None and self._current[0] == manifest_hash:
+                return False
+            self._current = await asyncio.to_thread(build_manifest_event)
+            frame = self._current[1]
+            if frame and self._subscribers:
+                self.broadcasts += 1
+                for queue in self._subscribers:
+                    self._offer(queue, frame)
+            return True
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+            except Exception:  # noqa: BLE001 - one bad tick must not end the watcher
+                self.errors += 1
+                logger.exception("events.poll_failed", subscribers=len(self._subscribers))
+
+    async def subscribe(self) -> asyncio.Queue[bytes]:
+        """Register a subscriber, primed with the current revision, and start watching.
+
+        The initial poll runs before anything is registered, so its errors propagate to the
+        caller without leaving a subscriber behind.
+        """
+
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=1)
+        await self.poll()
+        assert self._current is not None
+        if self._current[1]:
+            queue.put_nowait(self._current[1])
+        self._subscribers.add(queue)
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes]) -> None:
+        """Drop a subscriber; the watcher stops when nobody is listening."""
+
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the watcher task."""
+
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    def stats(self) -> dict[str, int]:
+        """Connected subscribers, revisions pushed and failed polls since start-up."""
+
+        return {
+            "subscribers": len(self._subscribers),
+            "broadcasts": self.broadcasts,
+            "errors": self.errors,
+        }
+
+
+broadcaster = ManifestBroadcaster()
+
+
+async def manifest_events(
+    source: ManifestBroadcaster | None = None, heartbeat: float | None = None
+) -> AsyncIterator[bytes]:
+    """Subscribe one client and return its SSE frames: the manifest, then every new revision.
+
+    Subscribing happens here rather than inside the stream, so a manifest that cannot be
+    read fails the request before the route commits to a ``200`` streaming response.
+    """
+
+    source = source or broadcaster
+    queue = await source.subscribe()
+    return _relay(source, queue, heartbeat or settings.event_heartbeat_seconds)
+
+
+async def _relay(
+    source: ManifestBroadcaster, queue: asyncio.Queue[bytes], heartbeat: float
+) -> AsyncIterator[bytes]:
+    try:
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+    finally:
+        source.unsubscribe(queue)
@@ -0,0 +1,161 @@
+"""Bounded worker pool that keeps Polars/Arrow work off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal, TypeVar
+
+from ..core.config import settings
+from ..db.cache import CacheKey, result_cache
+
+T = TypeVar("T")
+
+PoolKind = Literal["thread", "process"]
+
+
+class WorkerPool:
+    """Run blocking scans and aggregations on a thread or process pool.
+
+    At most ``max_concurrency`` jobs are handed to the executor at once; further callers
+    wait on a per-loop semaphore, and that wait is what the queue-depth counters measure.
+    The executor is created on first use so importing the services stays cheap.
+
+    Process pools only accept picklable, module-level callables, and results computed in a
+    child are not cached there, which is why :meth:`run_cached` stores them on the caller's
+    side.
+    """
+
+    def __init__(
+        self,
+        kind: PoolKind | None = None,
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self._kind = kind
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+        self._executor: Executor | None = None
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_seconds_total = 0.0
+
+    @property
+    def kind(self) -> PoolKind:
+        """``"thread"`` or ``"process"``, defaulting to ``settings.worker_pool_kind``."""
+
+        return self._kind or settings.worker_pool_kind
+
+    @property
+    def max_workers(self) -> int:
+        """Number of executor workers, defaulting to ``settings.worker_pool_size``."""
+
+        return self._max_workers or settings.worker_pool_size
+
+    @property
+    def max_concurrency(self) -> int:
+        """Jobs allowed in the executor at once, defaulting to the pool size."""
+
+        return self._max_concurrency or settings.worker_pool_max_concurrency or self.max_workers
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="worker-pool"
+                    )
+            return self._executor
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return semaphore
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await ``func(*args, **kwargs)`` on the pool, waiting for a free slot first."""
+
+        loop = asyncio.get_running_loop()
+        enqueued = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self.queued)
+        try:
+            await self._semaphore(loop).acquire()
+        finally:
+            with self._lock:
+                self.queued -= 1
+                self.wait_seconds_total += time.perf_counter() - enqueued
+        try:
+            with self._lock:
+                self.running += 1
+            call = functools.partial(func, *args, **kwargs)
+            if self.kind == "thread":
+                # Carry the request context so Parquet reads stay attributed to the request.
+                call = functools.partial(contextvars.copy_context().run, call)
+            result = await loop.run_in_executor(self._get_executor(), call)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        else:
+            with self._lock:
+                self.completed += 1
+            return result
+        finally:
+            with self._lock:
+                self.running -= 1
+            self._semaphore(loop).release()
+
+    async def run_cached(self, key: CacheKey, func: Callable[..., T], *args: Any) -> T:
+        """Serve ``key`` from the result cache inline and compute misses on the pool."""
+
+        cached = result_cache.get(key)
+        if cached is not None:
+            return cached
+        value = await self.run(func, *args)
+        result_cache.set(key, value)
+        return value
+
+    def stats(self) -> dict[str, int | float | str]:
+        """Expose pool sizing and queue-depth counters for diagnostics."""
+
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_concurrency": self.max_concurrency,
+                "queue_depth": self.queued,
+                "peak_queue_depth": self.peak_queue_depth,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the executor; the next job starts a fresh one."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+worker_pool = WorkerPool()
@@ -1,14 +1,192 @@
-"""Metrics aggregation stubs."""
+"""Metrics aggregations answered from the hourly KPI rollup."""
 
 from __future__ import annotations
 
-from ..models import MetricPoint
+import json
+import math
+from datetime import timedelta
 
+import polars as pl
 
-def get_metrics() -> list[MetricPoint]:
-    """Provide a short synthetic time-series."""
+from support_analytics.sketch import DDSketch
 
-    return [
-        MetricPoint(timestamp="2025-11-25T00:00:00Z", value=120.0, delta=5.0),
-        MetricPoint(timestamp="2025-11-26T00:00:00Z", value=132.0, delta=12.0),
-    ]
+from ..db.cache import CacheKey, result_cache
+from ..models import HandleTimePercentiles, MetricPoint
+from ..repositories import parquet_repo
+from ..schemas.metrics import MetricsRequest
+from ..utils.serialization import rows_json
+from ..utils.time import parse_time_range
+from .data_access import current_manifest_hash, fetch_manifest_hash, rollup_path
+from .executor import worker_pool
+from .singleflight import single_flight
+
+
+BUCKETS: dict[str, tuple[str, timedelta]] = {
+    "hour": ("1h", timedelta(hours=1)),
+    "day": ("1d", timedelta(days=1)),
+    "week": ("1w", timedelta(weeks=1)),
+}
+MAX_METRIC_POINTS = 1_000
+
+_KPI_COLUMNS: dict[str, list[str]] = {
+    "volume": ["calls"],
+    "avg_handle_time": ["calls", "duration_sum"],
+    "resolution_rate": ["calls", "resolved_calls"],
+}
+_has_calls = pl.col("calls") > 0
+_KPI_VALUES: dict[str, pl.Expr] = {
+    "volume": pl.col("calls").cast(pl.Float64),
+    "avg_handle_time": pl.when(_has_calls).then(pl.col("duration_sum") / pl.col("calls")),
+    # Percentage of calls closed as resolved; the exports carry no survey ratings to report
+    # a satisfaction score from.
+    "resolution_rate": pl.when(_has_calls).then(pl.col("resolved_calls") * 100.0 / pl.col("calls")),
+}
+_SERIES_SCHEMA = {
+    "timestamp": pl.Datetime("us", "UTC"),
+    "value": pl.Float64,
+    "delta": pl.Float64,
+}
+
+
+class InvalidMetricsRequestError(ValueError):
+    """Raised when a time range would produce more buckets than a series may hold."""
+
+
+def bucket_count(request: MetricsRequest) -> int:
+    """Number of ``granularity`` buckets covering ``time_range`` (a partial bucket counts)."""
+
+    periods = math.ceil(parse_time_range(request.time_range) / BUCKETS[request.granularity][1])
+    if periods > MAX_METRIC_POINTS:
+        raise InvalidMetricsRequestError(
+            f"{request.time_range} at {request.granularity} granularity exceeds "
+            f"{MAX_METRIC_POINTS} points"
+        )
+    return periods
+
+
+def _compute_metrics_frame(request: MetricsRequest) -> pl.DataFrame:
+    periods = bucket_count(request)
+    every, step = BUCKETS[request.granularity]
+    columns = _KPI_COLUMNS[request.kpi]
+    candidates = (("customer_region", request.region), ("issue_type", request.issue_type))
+    rollup = pl.from_arrow(
+        parquet_repo.read_table(
+            rollup_path("kpi_hourly"),
+            columns=["bucket", *columns],
+            match={column: value for column, value in candidates if value is not None},
+        )
+    )
+    assert isinstance(rollup, pl.DataFrame)
+    buckets = rollup.group_by(pl.col("bucket").dt.truncate(every).alias("timestamp")).agg(
+        pl.col(columns).sum()
+    )
+    if buckets.is_empty():
+        return pl.DataFrame(schema=_SERIES_SCHEMA)
+    first = buckets.get_column("timestamp").min()
+    end = buckets.get_column("timestamp").max() + step
+    # The window and the one before it on a single grid: the delta for each bucket is the
+    # value ``periods`` rows earlier, and buckets before the first data point stay null.
+    grid = pl.datetime_range(
+        end - 2 * periods * step,
+        end,
+        step,
+        closed="left",
+        time_unit="us",
+        time_zone="UTC",
+        eager=True,
+    )
+    series = (
+        grid.alias("timestamp")
+        .to_frame()
+        .join(buckets, on="timestamp", how="left")
+        .with_columns(pl.col(columns).fill_null(0))
+        .select(
+            "timestamp",
+            pl.when(pl.col("timestamp") >= first).then(_KPI_VALUES[request.kpi]).alias("value"),
+        )
+        .with_columns((pl.col("value") - pl.col("value").shift(periods)).alias("delta"))
+    )
+    return series.tail(periods).drop_nulls("value")
+
+
+def metrics_frame(request: MetricsRequest | None = None) -> pl.DataFrame:
+    """Return one KPI series over the requested window with period-over-period deltas.
+
+    Built from the hourly × region × issue-type rollup rather than individual calls.
+    ``delta`` compares each bucket with the same bucket one window earlier. The frame is
+    not cached; :func:`metrics_json` caches its encoding.
+    """
+
+    return _compute_metrics_frame(request or MetricsRequest())
+
+
+@single_flight
+def metrics_json(request: MetricsRequest | None = None) -> bytes:
+    """Return the series pre-encoded as a JSON array, cached per request and manifest hash."""
+
+    request = request or MetricsRequest()
+    key = result_cache.key("metrics:json", request, current_manifest_hash())
+    return result_cache.get_or_compute(key, lambda: rows_json(metrics_frame(request)))
+
+
+@single_flight
+async def fetch_metrics_json(request: MetricsRequest | None = None) -> bytes:
+    """Await the pre-encoded series, computing cache misses on the worker pool."""
+
+    request = request or MetricsRequest()
+    bucket_count(request)
+    key = result_cache.key("metrics:json", request, await fetch_manifest_hash())
+    return await worker_pool.run_cached(key, metrics_json, request)
+
+
+def get_metrics(request: MetricsRequest | None = None) -> list[MetricPoint]:
+    """Return the series as validated models, decoded from the cached JSON."""
+
+    return [MetricPoint.model_validate(row) for row in json.loads(metrics_json(request))]
+
+
+def _handle_time_key(region: str | None, issue_type: str | None, manifest_hash: str) -> CacheKey:
+    params = {"region": region, "issue_type": issue_type}
+    return result_cache.key("metrics:handle-time", params, manifest_hash)
+
+
+def _compute_handle_time(region: str | None, issue_type: str | None) -> HandleTimePercentiles:
+    candidates = (("customer_region", region), ("issue_type", issue_type))
+    rollup = parquet_repo.read_table(
+        rollup_path("kpi_hourly"),
+        columns=["duration_sketch"],
+        match={column: value for column, value in candidates if value is not None},
+    )
+    merged = DDSketch()
+    for payload in rollup.column("duration_sketch").to_pylist():
+        if payload is not None:
+            merged.merge(DDSketch.from_bytes(payload))
+    return HandleTimePercentiles(
+        calls=merged.count,
+        p50_seconds=merged.quantile(0.5),
+        p90_seconds=merged.quantile(0.9),
+        p99_seconds=merged.quantile(0.99),
+    )
+
+
+@single_flight
+def get_handle_time_percentiles(
+    region: str | None = None, issue_type: str | None = None
+) -> HandleTimePercentiles:
+    """Return p50/p90/p99 handle times by merging the hourly rollup sketches.
+
+    Merging a few thousand serialised sketches replaces a full sort of every matching call.
+    """
+
+    key = _handle_time_key(region, issue_type, current_manifest_hash())
+    return result_cache.get_or_compute(key, lambda: _compute_handle_time(region, issue_type))
+
+
+@single_flight
+async def fetch_handle_time_percentiles(
+    region: str | None = None, issue_type: str | None = None
+) -> HandleTimePercentiles:
+    """Await the handle-time percentiles, merging sketches on the worker pool on a miss."""
+
+    key = _handle_time_key(region, issue_type, await fetch_manifest_hash())
+    return await worker_pool.run_cached(key, get_handle_time_percentiles, region, issue_type)
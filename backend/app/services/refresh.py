@@ -1,11 +1,234 @@
-"""Manual refresh hooks for the manifest endpoint."""
+"""Background ETL refresh jobs run in a separate process with streamed progress.
+
+``trigger_refresh`` starts at most one ETL run at a time: while a job is queued or running,
+further triggers return that same job instead of starting another. Runs started by other
+processes (another API worker or the CLI) hold the ETL's file lock, and a trigger raises
+:class:`EtlLockedError` while they do. The ETL runs in a spawned child process so parsing and
+Parquet writes never hold the API's GIL or event loop, and it reports each completed stage
+over a queue that a monitor thread folds into the job record. The ETL writes a whole new
+revision directory and publishes it by replacing the manifest, so readers keep serving the
+previous revision until the new one is complete.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from queue import Empty
+from typing import Any, AsyncIterator, Literal
+
+from support_analytics.etl import EtlInput, EtlLockedError, build_local_parquet, etl_lock
+
+from ..core.config import settings
+from .data_access import current_manifest_hash
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+MAX_FINISHED_JOBS = 20
+
+
+@dataclass(slots=True)
+class RefreshJob:
+    """State of one ETL refresh, as reported by the status endpoints."""
+
+    id: str
+    status: JobStatus = "queued"
+    stage: str = "queued"
+    rows: int = 0
+    rows_per_second: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    manifest_hash: str | None = None
+    error: str | None = None
+    version: int = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether the job has not finished yet."""
+
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Public representation without the internal change counter."""
+
+        payload = asdict(self)
+        payload.pop("version")
+        return payload
+
+
+def refresh_inputs() -> EtlInput:
+    """ETL inputs for an API-triggered refresh, taken from the settings."""
+
+    return EtlInput(
+        calls_path=Path(settings.refresh_calls_path),
+        agents_path=Path(settings.refresh_agents_path),
+        manifest_path=Path(settings.manifest_path),
+        incremental=settings.refresh_incremental,
+    )
+
+
+def run_refresh_job(inputs: EtlInput, events: Any) -> None:
+    """Child-process entry point: run the ETL and report progress and the outcome."""
+
+    def progress(stage: str, rows: int) -> None:
+        events.put(("progress", stage, rows))
+
+    try:
+        build_local_parquet(inputs, progress)
+    except BaseException as error:  # noqa: BLE001 - the parent records every failure
+        summary = "".join(traceback.format_exception_only(type(error), error)).strip()
+        events.put(("failed", summary, 0))
+    else:
+        events.put(("succeeded", "published", 0))
+
+
+class RefreshJobRunner:
+    """Start deduplicated ETL jobs in child processes and track their progress."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, RefreshJob] = {}
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context("spawn")
+
+    def trigger(self, inputs: EtlInput | None = None) -> tuple[RefreshJob, bool]:
+        """Return ``(job, created)``: the active job if one exists, else a newly started one.
+
+        Raises :class:`EtlLockedError` while another process is publishing to the manifest.
+        """
+
+        inputs = inputs or refresh_inputs()
+        with self._lock:
+            for job in self._jobs.values():
+                if job.active:
+                    return job, False
+            # Probe the lock so a run owned by another process is reported now rather than
+            # as a failed job; the child takes it for real once it starts.
+            with etl_lock(inputs.manifest_path):
+                pass
+            job = RefreshJob(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            self._prune()
+        events = self._context.Queue()
+        process = self._context.Process(
+            target=run_refresh_job,
+            args=(inputs, events),
+            name=f"etl-refresh-{job.id[:8]}",
+            daemon=True,
+        )
+        try:
+            process.start()
+        except BaseException as error:
+            self._finish(job, "failed", f"Could not start the ETL process: {error}")
+            raise
+        self._update(job, status="running", stage="starting", started_at=time.time())
+        monitor = threading.Thread(
+            target=self._monitor, args=(job, process, events), name="etl-refresh-monitor"
+        )
+        monitor.daemon = True
+        monitor.start()
+        return job, True
+
+    def get(self, job_id: str) -> RefreshJob | None:
+        """Look up a job by id."""
+
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job_id: str) -> tuple[int, dict[str, Any]] | None:
+        """Return a job's change counter and a consistent copy of its public state."""
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else (job.version, job.to_dict())
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if not job.active]
+        for job in finished[: max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job.id]
+
+    def _update(self, job: RefreshJob, **changes: Any) -> None:
+        with self._lock:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+
+    def _monitor(self, job: RefreshJob, process: Any, events: Any) -> None:
+        while True:
+            try:
+                kind, detail, rows = events.get(timeout=0.2)
+            except Empty:
+                if process.is_alive():
+                    continue
+                try:
+                    # The child may have reported its outcome just before exiting.
+                    kind, detail, rows = events.get(timeout=1.0)
+                except Empty:
+                    process.join()
+                    self._finish(job, "failed", f"ETL process exited with {process.exitcode}")
+                    return
+            if kind == "progress":
+                elapsed = max(time.time() - (job.started_at or job.created_at), 1e-9)
+                self._update(job, stage=detail, rows=rows, rows_per_second=rows / elapsed)
+                continue
+            process.join()
+            self._finish(job, kind, None if kind == "succeeded" else detail)
+            return
+
+    def _finish(self, job: RefreshJob, status: JobStatus, error: str | None) -> None:
+        manifest_hash = current_manifest_hash() if status == "succeeded" else None
+        self._update(
+            job,
+            status=status,
+            stage="completed" if status == "succeeded" else "failed",
+            finished_at=time.time(),
+            manifest_hash=manifest_hash,
+            error=error,
+        )
+
+    def wait(self, job_id: str, timeout: float | None = None) -> RefreshJob | None:
+        """Block until the job finishes (used by scripts and tests)."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or not job.active:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.05)
+
+
+refresh_jobs = RefreshJobRunner()
+
+
+def trigger_refresh(inputs: EtlInput | None = None) -> tuple[RefreshJob, bool]:
+    """Enqueue an ETL refresh, or join the one already in progress."""
+
+    return refresh_jobs.trigger(inputs)
 
 
-def trigger_refresh(script_path: Path) -> str:
-    """Document the intent to call the ETL script once implemented."""
+async def job_events(job_id: str, interval: float = 0.1) -> AsyncIterator[bytes]:
+    """Yield a ``progress`` SSE frame on every change to the job, then its final state."""
 
-    return f"Would execute ETL script at {script_path}"
+    seen = -1
+    while True:
+        snapshot = refresh_jobs.snapshot(job_id)
+        if snapshot is None:
+            return
+        version, state = snapshot
+        finished = state["status"] not in ("queued", "running")
+        if version != seen:
+            seen = version
+            event = state["status"] if finished else "progress"
+            data = json.dumps(state, separators=(",", ":"))
+            yield f"event: {event}\nid: {version}\ndata: {data}\n\n".encode("utf-8")
+        if finished:
+            return
+        await asyncio.sleep(interval)
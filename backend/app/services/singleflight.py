@@ -0,0 +1,139 @@
+"""Collapse concurrent identical computations into one in-flight call."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from ..db.cache import normalize_params
+from . import data_access
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Call:
+    """A synchronous computation that followers wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one execution among concurrent callers of the same key.
+
+    The first caller for a key runs the computation; callers arriving while it is in flight
+    wait for and receive the same result (or exception). Nothing is retained once the call
+    finishes, so this complements rather than replaces the result cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Future[Any]] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Run ``compute`` once for all threads concurrently asking for ``key``."""
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.followers += 1
+        assert call is not None
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = compute()
+            return call.value
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """Await ``compute`` once for all coroutines on this event loop asking for ``key``."""
+
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        with self._lock:
+            future = self._tasks.get(slot)
+            if future is None:
+                future = asyncio.ensure_future(compute())
+                self._tasks[slot] = future
+                future.add_done_callback(lambda _: self._forget(slot, future))
+                self.leaders += 1
+            else:
+                self.followers += 1
+        # Shielded so one cancelled request does not cancel the computation for the others.
+        return await asyncio.shield(future)
+
+    def _forget(self, slot: tuple[int, Hashable], future: asyncio.Future[Any]) -> None:
+        with self._lock:
+            if self._tasks.get(slot) is future:
+                del self._tasks[slot]
+
+    def stats(self) -> dict[str, int]:
+        """Expose how many callers ran a computation versus joined one."""
+
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
+
+
+flights = SingleFlight()
+
+
+def flight_key(
+    name: str, args: tuple[Any, ...], kwargs: dict[str, Any], manifest_hash: str | None = None
+) -> tuple[str, str, str]:
+    """Build the ``(function, normalized arguments, manifest hash)`` key for a call."""
+
+    arguments = {
+        "args": [normalize_params(arg) if hasattr(arg, "model_dump") else arg for arg in args],
+        "kwargs": kwargs,
+    }
+    if manifest_hash is None:
+        manifest_hash = data_access.current_manifest_hash()
+    return (name, normalize_params(arguments), manifest_hash)
+
+
+def single_flight(func: F) -> F:
+    """Decorate a sync or async service function so identical concurrent calls share one run."""
+
+    name = f"{func.__module__}.{func.__qualname__}"
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = flight_key(name, args, kwargs, await data_access.fetch_manifest_hash())
+            return await flights.do_async(key, lambda: func(*args, **kwargs))
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return flights.do(flight_key(name, args, kwargs), lambda: func(*args, **kwargs))
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,77 @@
+"""Scrape-time gauges mirroring the cache, worker pool and published ETL run."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from ..db.cache import result_cache
+from ..utils.instrumentation import Sample, registry
+from . import data_access
+from .executor import worker_pool
+from .singleflight import flights
+
+
+def _cache_samples(stat: str) -> Iterable[Sample]:
+    return [({}, float(result_cache.stats()[stat] or 0))]
+
+
+def _pool_samples(stat: str) -> Iterable[Sample]:
+    return [({"kind": worker_pool.kind}, float(worker_pool.stats()[stat]))]
+
+
+def _etl_stage_samples() -> Iterable[Sample]:
+    record = data_access.current_manifest()
+    stages = (record.stage_seconds if record is not None else None) or {}
+    return [({"stage": stage}, float(seconds)) for stage, seconds in stages.items()]
+
+
+def _etl_row_samples() -> Iterable[Sample]:
+    record = data_access.current_manifest()
+    return [] if record is None else [({}, float(record.row_count))]
+
+
+registry.gauge(
+    "result_cache_hit_ratio",
+    "Share of result cache lookups served from memory since start-up.",
+    callback=lambda: _cache_samples("hit_ratio"),
+)
+registry.gauge(
+    "result_cache_entries",
+    "Entries held by the result cache.",
+    callback=lambda: _cache_samples("entries"),
+)
+registry.gauge(
+    "result_cache_bytes",
+    "Estimated bytes held by the result cache.",
+    callback=lambda: _cache_samples("bytes"),
+)
+registry.gauge(
+    "worker_pool_queue_depth",
+    "Jobs waiting for a worker pool slot.",
+    callback=lambda: _pool_samples("queue_depth"),
+)
+registry.gauge(
+    "worker_pool_peak_queue_depth",
+    "Highest worker pool queue depth since start-up.",
+    callback=lambda: _pool_samples("peak_queue_depth"),
+)
+registry.gauge(
+    "worker_pool_running",
+    "Jobs currently executing on the worker pool.",
+    callback=lambda: _pool_samples("running"),
+)
+registry.gauge(
+    "single_flight_in_flight",
+    "Deduplicated computations currently in flight.",
+    callback=lambda: [({}, float(flights.stats()["in_flight"]))],
+)
+registry.gauge(
+    "etl_stage_seconds",
+    "Wall-clock seconds per stage of the ETL run behind the published manifest.",
+    callback=_etl_stage_samples,
+)
+registry.gauge(
+    "etl_rows",
+    "Rows in the published calls dataset.",
+    callback=_etl_row_samples,
+)
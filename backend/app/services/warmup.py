@@ -0,0 +1,168 @@
+"""Start-up warm-up that gates readiness on a primed data layer.
+
+A worker that has just started has cold footers, an empty result cache and, on object
+storage, an empty block cache, so its first dashboard requests are an order of magnitude
+slower than steady state. ``Warmup.run`` opens every published artifact, parses the Parquet
+footers and computes the default dashboard queries through the same cached service calls the
+routes use. ``/api/readyz`` answers ``503`` until that has finished, so a load balancer only
+routes traffic to warm workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Literal
+
+from support_analytics.manifest import ManifestRecord
+
+from ..schemas import CallFilters, MetricsRequest
+from . import agents, calls, data_access, metrics
+
+WarmupStatus = Literal["pending", "warming", "ready", "failed"]
+SERVICE_MODULES = ("data_access", "calls", "agents", "metrics")
+
+
+@dataclass(slots=True)
+class Readiness:
+    """Outcome of the most recent warm-up, as reported by ``/api/readyz``."""
+
+    status: WarmupStatus = "pending"
+    manifest_hash: str | None = None
+    row_groups: int = 0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the worker has been warmed against a published manifest."""
+
+        return self.status == "ready"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Public representation for the readiness probe."""
+
+        return asdict(self)
+
+
+def _import_services() -> None:
+    for name in SERVICE_MODULES:
+        importlib.import_module(f"{__package__}.{name}")
+
+
+def artifact_paths(record: ManifestRecord) -> list[Path]:
+    """The calls dataset plus every rollup and index sidecar the manifest publishes."""
+
+    paths = [data_access.artifact_path(record)]
+    paths += [Path(path) for path in (record.rollups or {}).values()]
+    paths += [Path(path) for path in (record.indexes or {}).values()]
+    return paths
+
+
+def read_footers(record: ManifestRecord) -> int:
+    """Parse the footer of every published artifact; returns the row groups they describe."""
+
+    # Deferred like the services: this module is loaded by the lifespan on the event loop.
+    from ..repositories import parquet_repo
+
+    return sum(parquet_repo.read_footers(path) for path in artifact_paths(record))
+
+
+async def prime_default_queries() -> None:
+    """Compute what a dashboard asks for on load: 30d metrics, the leaderboard, page one."""
+
+    await metrics.fetch_metrics_json(MetricsRequest())
+    await agents.fetch_agent_stats_json()
+    await calls.list_calls(CallFilters())
+
+
+class Warmup:
+    """Run the warm-up once per published manifest and track readiness.
+
+    After a new manifest is published the worker stays ready while it re-warms in the
+    background: taking every worker out of rotation at once on each publish would turn a
+    refresh into an outage. A failed warm-up is retried on the next readiness probe.
+    """
+
+    def __init__(self) -> None:
+        self.state = Readiness()
+        self._task: asyncio.Task[Readiness] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether a warm-up task is in progress."""
+
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task[Readiness]:
+        """Schedule a warm-up on the running loop unless one is already in progress."""
+
+        if not self.running:
+            self._task = asyncio.create_task(self.run())
+        assert self._task is not None
+        return self._task
+
+    def stop(self) -> None:
+        """Cancel an in-progress warm-up, e.g. on shutdown."""
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _stage(
+        self, state: Readiness, name: str, step: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        started = time.perf_counter()
+        result = await step()
+        state.stage_seconds[name] = round(time.perf_counter() - started, 4)
+        return result
+
+    async def run(self) -> Readiness:
+        """Warm the data layer against the current manifest and record the outcome.
+
+        A re-warm builds its readiness separately: the probe keeps reporting the previously
+        warmed revision until the new one has finished warming, and only a worker with
+        nothing warmed yet reports ``warming``.
+        """
+
+        record = await asyncio.to_thread(data_access.current_manifest)
+        if record is None:
+            self.state = Readiness(status="failed", error="No manifest has been published")
+            return self.state
+        warming = Readiness(status="warming", manifest_hash=record.hash)
+        if not self.state.ready:
+            self.state = warming
+        try:
+            await self._stage(warming, "import", lambda: asyncio.to_thread(_import_services))
+            warming.row_groups = await self._stage(
+                warming, "footers", lambda: asyncio.to_thread(read_footers, record)
+            )
+            await self._stage(warming, "queries", prime_default_queries)
+        except Exception as error:  # noqa: BLE001 - reported through the readiness probe
+            if self.state is not warming:
+                # Keep serving the revision that was warmed; the next probe retries.
+                return self.state
+            warming.status = "failed"
+            warming.error = "".join(traceback.format_exception_only(type(error), error)).strip()
+            return warming
+        warming.status = "ready"
+        self.state = warming
+        return warming
+
+    async def check(self) -> Readiness:
+        """Readiness for a probe: ready once warmed and while the manifest stays readable."""
+
+        record = await asyncio.to_thread(data_access.current_manifest)
+        if record is None:
+            return Readiness(status="failed", error="No manifest has been published")
+        stale = self.state.manifest_hash != record.hash or self.state.status == "failed"
+        if stale and not self.running:
+            self.start()
+        return self.state
+
+
+warmup = Warmup()
@@ -0,0 +1,84 @@
+"""Fixtures that publish the sample dataset so API tests run against real artifacts."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from support_analytics.etl import EtlInput, build_local_parquet
+
+from ..core.config import settings
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+PublishCalls = Callable[..., EtlInput]
+
+
+@pytest.fixture(scope="session")
+def published_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run the ETL once over the sample inputs and return the manifest path."""
+
+    data_dir = tmp_path_factory.mktemp("published")
+    manifest_path = data_dir / "manifest.json"
+    build_local_parquet(
+        EtlInput(
+            calls_path=REPO_ROOT / "data" / "sample_calls.json",
+            agents_path=REPO_ROOT / "data" / "agents.csv",
+            manifest_path=manifest_path,
+        )
+    )
+    return manifest_path
+
+
+@pytest.fixture(autouse=True)
+def use_published_dataset(published_dataset: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the settings at the published sample dataset for every backend test."""
+
+    monkeypatch.setattr(settings, "manifest_path", str(published_dataset))
+    monkeypatch.setattr(
+        settings, "parquet_path", str(published_dataset.with_name("cleaned_calls.parquet"))
+    )
+    return published_dataset
+
+
+@pytest.fixture
+def sample_calls() -> list[dict[str, Any]]:
+    """Rows of the sample export, parsed afresh so a test may edit them."""
+
+    return json.loads((REPO_ROOT / "data" / "sample_calls.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def publish_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_calls: list[dict[str, Any]]
+) -> PublishCalls:
+    """Publish calls as an NDJSON export under ``tmp_path`` and point the settings at them.
+
+    ``publish_calls(calls=None, *, build=True, **options)`` defaults to the sample rows;
+    ``options`` such as ``chunk_size`` and ``incremental`` go to :class:`EtlInput`. The
+    manifest lives in ``tmp_path / "published"``; ``build=False`` only writes the export and
+    repoints the settings, for tests that publish through the API or a later run.
+    """
+
+    def publish(
+        calls: list[dict[str, Any]] | None = None, *, build: bool = True, **options: Any
+    ) -> EtlInput:
+        rows = sample_calls if calls is None else calls
+        calls_path = tmp_path / "calls.ndjson"
+        calls_path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+        inputs = EtlInput(
+            calls_path=calls_path,
+            agents_path=REPO_ROOT / "data" / "agents.csv",
+            manifest_path=tmp_path / "published" / "manifest.json",
+            **options,
+        )
+        monkeypatch.setattr(settings, "manifest_path", str(inputs.manifest_path))
+        monkeypatch.setattr(settings, "parquet_path", str(inputs.parquet_path))
+        if build:
+            build_local_parquet(inputs)
+        return inputs
+
+    return publish
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from typing import get_args
+
 from fastapi.testclient import TestClient
 
+from visualization.labels import KPI_LABELS
+
 from ...main import app
+from ...schemas.metrics import KpiName
 
 
 def test_openapi_has_expected_title() -> None:
@@ -13,3 +18,29 @@ def test_openapi_has_expected_title() -> None:
     client = TestClient(app)
     schema = client.get("/openapi.json").json()
     assert schema["info"]["title"] == "AWS Serverless Support Analytics"
+
+
+def test_fast_path_routes_keep_documented_response_models() -> None:
+    """Routes returning pre-encoded JSON still advertise their Pydantic response models."""
+
+    schema = TestClient(app).get("/openapi.json").json()
+
+    def response_schema(path: str) -> dict[str, object]:
+        return schema["paths"][path]["get"]["responses"]["200"]["content"]["application/json"][
+            "schema"
+        ]
+
+    assert response_schema("/api/calls") == {"$ref": "#/components/schemas/PaginatedCallsResponse"}
+    assert response_schema("/api/agents")["items"] == {"$ref": "#/components/schemas/AgentStats"}
+    assert response_schema("/api/metrics")["items"] == {"$ref": "#/components/schemas/MetricPoint"}
+
+
+def test_metrics_kpis_match_the_dashboard_labels() -> None:
+    """Every KPI the dashboards label can be requested, and nothing else."""
+
+    schema = TestClient(app).get("/openapi.json").json()
+    parameters = {
+        parameter["name"] for parameter in schema["paths"]["/api/metrics"]["get"]["parameters"]
+    }
+    assert parameters == {"kpi", "time_range", "granularity", "region", "issue_type"}
+    assert set(get_args(KpiName)) == set(KPI_LABELS)
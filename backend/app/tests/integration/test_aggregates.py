@@ -0,0 +1,115 @@
+"""Integration tests for the rollup-backed agents and metrics endpoints."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ...core.config import settings
+from ...main import app
+from ...models import AgentStats, MetricPoint
+from ..conftest import PublishCalls
+
+
+def test_agents_endpoint_reads_agent_rollup() -> None:
+    """Each agent in the sample data appears once with its rollup totals."""
+
+    client = TestClient(app)
+    agents = {row["agent_id"]: row for row in client.get("/api/agents").json()}
+    assert set(agents) == {"A-101", "A-102"}
+    assert agents["A-102"]["total_calls"] == 1
+    assert agents["A-102"]["avg_resolution_seconds"] == 780
+    assert agents["A-102"]["avg_rating"] == 4.6
+
+
+def test_metrics_endpoint_returns_daily_volume() -> None:
+    """The sample calls both land on the same day."""
+
+    client = TestClient(app)
+    points = client.get("/api/metrics").json()
+    assert points == [{"timestamp": "2025-11-25T00:00:00Z", "value": 2.0, "delta": None}]
+
+
+def test_metrics_series_buckets_filters_and_compares_windows(publish_calls: PublishCalls) -> None:
+    """Each bucket's delta is against the same bucket one window earlier."""
+
+    def call(number: int, day: int, region: str, status: str, seconds: int) -> dict[str, object]:
+        return {
+            "id": f"call-{number:03d}",
+            "agent_id": "A-101",
+            "customer_region": region,
+            "issue_type": "Billing",
+            "duration_seconds": seconds,
+            "resolution_status": status,
+            "started_at": f"2025-11-{day}T09:{number:02d}:00Z",
+        }
+
+    calls = [
+        call(1, 20, "NA", "Resolved", 600),
+        call(2, 21, "NA", "Resolved", 300),
+        call(3, 21, "EU", "Escalated", 900),
+        call(4, 22, "NA", "Resolved", 200),
+        call(5, 22, "NA", "Escalated", 400),
+        call(6, 22, "EU", "Resolved", 600),
+    ]
+    publish_calls(calls)
+    client = TestClient(app)
+
+    volume = client.get("/api/metrics", params={"time_range": "2d"}).json()
+    assert volume == [
+        {"timestamp": "2025-11-21T00:00:00Z", "value": 2.0, "delta": None},
+        {"timestamp": "2025-11-22T00:00:00Z", "value": 3.0, "delta": 2.0},
+    ]
+    handle_time = client.get(
+        "/api/metrics", params={"kpi": "avg_handle_time", "time_range": "1d", "region": "NA"}
+    ).json()
+    assert handle_time == [{"timestamp": "2025-11-22T00:00:00Z", "value": 300.0, "delta": 0.0}]
+    weekly = client.get(
+        "/api/metrics", params={"kpi": "resolution_rate", "time_range": "1w", "granularity": "week"}
+    ).json()
+    assert weekly == [{"timestamp": "2025-11-17T00:00:00Z", "value": 400 / 6, "delta": None}]
+    hourly = client.get("/api/metrics", params={"time_range": "24h", "granularity": "hour"})
+    assert [point["value"] for point in hourly.json()] == [0.0] * 23 + [3.0]
+
+    assert client.get("/api/metrics", params={"region": "Mars"}).json() == []
+    assert client.get("/api/metrics", params={"kpi": "nps"}).status_code == 422
+    assert client.get("/api/metrics", params={"kpi": "csat"}).status_code == 422
+    assert client.get("/api/metrics", params={"time_range": "30x"}).status_code == 422
+    too_long = client.get("/api/metrics", params={"time_range": "9999w", "granularity": "hour"})
+    assert too_long.status_code == 400
+
+
+def test_missing_artifacts_surface_as_503(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Endpoints answer with the error envelope before the ETL has published data."""
+
+    monkeypatch.setattr(settings, "manifest_path", str(tmp_path / "manifest.json"))
+    response = TestClient(app).get("/api/agents")
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "DATA_UNAVAILABLE"
+
+
+def test_handle_time_percentiles_merge_rollup_sketches() -> None:
+    """Percentiles are served from sketches, within the sketch's relative accuracy."""
+
+    client = TestClient(app)
+    body = client.get("/api/metrics/handle-time", params={"region": "EU"}).json()
+    assert body["calls"] == 1
+    assert abs(body["p50_seconds"] - 780) <= 0.01 * 780
+    agents = {row["agent_id"]: row for row in client.get("/api/agents").json()}
+    assert agents["A-101"]["p50_resolution_seconds"] == 540
+    assert agents["A-101"]["resolution_percentile_bucket"] == 50
+
+
+def test_fast_path_payloads_validate_against_response_models() -> None:
+    """Pre-encoded bodies still satisfy the documented Pydantic contracts."""
+
+    client = TestClient(app)
+    for row in client.get("/api/agents").json():
+        AgentStats.model_validate(row)
+    for row in client.get("/api/metrics").json():
+        MetricPoint.model_validate(row)
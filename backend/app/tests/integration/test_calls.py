@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import json
+from typing import Any
+
+import pyarrow as pa
 from fastapi.testclient import TestClient
 
 from ...main import app
+from ..conftest import PublishCalls
 
 
 def test_calls_endpoint_returns_envelope() -> None:
@@ -14,3 +19,74 @@ def test_calls_endpoint_returns_envelope() -> None:
     response = client.get("/api/calls")
     body = response.json()
     assert set(body.keys()) == {"data", "meta", "links"}
+
+
+def test_calls_endpoint_filters_and_pages_published_rows() -> None:
+    """Filters select matching rows and pages beyond the data come back empty."""
+
+    client = TestClient(app)
+    eu_calls = client.get("/api/calls", params={"region": "EU"}).json()["data"]
+    assert [row["id"] for row in eu_calls] == ["call-002"]
+    assert eu_calls[0]["started_at"] == "2025-11-25T15:17:00Z"
+    assert client.get("/api/calls", params={"region": "Mars"}).json()["meta"]["total"] == 0
+
+    first_page = client.get("/api/calls", params={"per_page": 1}).json()["data"]
+    second_page = client.get("/api/calls", params={"per_page": 1, "page": 2}).json()["data"]
+    third_page = client.get("/api/calls", params={"per_page": 1, "page": 3}).json()["data"]
+    assert [first_page[0]["id"], second_page[0]["id"]] == ["call-001", "call-002"]
+    assert third_page == []
+
+
+def test_calls_endpoint_follows_keyset_cursor_links() -> None:
+    """links.next carries an opaque cursor that resumes after the last row."""
+
+    client = TestClient(app)
+    first = client.get("/api/calls", params={"per_page": 1}).json()
+    assert first["meta"]["total"] == 2
+    second = client.get(first["links"]["next"]).json()
+    assert [second["data"][0]["id"], second["meta"]["total"]] == ["call-002", 2]
+    assert second["links"]["next"] is None
+
+    assert client.get("/api/calls", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_keyset_paging_returns_every_row_once_when_chunks_overlap(
+    sample_calls: list[dict[str, Any]], publish_calls: PublishCalls
+) -> None:
+    """Cursor pages cover an out-of-order export exactly once, in ``(started_at, id)`` order."""
+
+    calls = []
+    for index in range(40):
+        # A handful of distinct start times, so pages also split ties on ``id``.
+        started_at = f"2025-11-25T{10 + (index * 7) % 5:02d}:00:00Z"
+        call_id = f"call-{(index * 13) % 40:03d}"
+        calls.append(dict(sample_calls[index % 2], id=call_id, started_at=started_at))
+    publish_calls(calls, chunk_size=7)
+
+    client = TestClient(app)
+    seen: list[tuple[str, str]] = []
+    url: str | None = "/api/calls?per_page=3"
+    while url is not None:
+        body = client.get(url).json()
+        seen += [(row["started_at"], row["id"]) for row in body["data"]]
+        url = body["links"]["next"]
+    assert seen == sorted((row["started_at"], row["id"]) for row in calls)
+
+
+def test_calls_export_streams_each_format() -> None:
+    """The export route honours filters and encodes NDJSON, CSV and Arrow IPC."""
+
+    client = TestClient(app)
+    ndjson = client.get("/api/calls/export", params={"region": "EU"})
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in ndjson.text.splitlines()] == ["call-002"]
+
+    csv_lines = client.get("/api/calls/export", params={"format": "csv"}).text.splitlines()
+    assert csv_lines[0].startswith('"id","agent_id"')
+    assert len(csv_lines) == 3
+    assert "2025-11-25T15:17:00Z" in csv_lines[2]
+
+    arrow = client.get("/api/calls/export", params={"format": "arrow"}).content
+    table = pa.ipc.open_stream(arrow).read_all()
+    assert table.column("id").to_pylist() == ["call-001", "call-002"]
+    assert pa.types.is_dictionary(table.schema.field("customer_region").type)
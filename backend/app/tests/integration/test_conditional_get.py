@@ -0,0 +1,58 @@
+"""Integration tests for manifest-derived ETags on the data routes."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ...main import app
+from ...services import agents as agents_service
+
+
+def test_revalidation_returns_304_without_running_services(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A matching ``If-None-Match`` short-circuits before the handler."""
+
+    client = TestClient(app)
+    first = client.get("/api/agents")
+    etag = first.headers["etag"]
+    assert "must-revalidate" in first.headers["cache-control"]
+
+    async def fail() -> bytes:
+        raise AssertionError("service layer should not run on a 304")
+
+    monkeypatch.setattr(agents_service, "fetch_agent_stats_json", fail)
+    revalidated = client.get("/api/agents", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+
+def test_etag_depends_on_route_and_canonical_query() -> None:
+    """Query parameter order does not matter, but their values and the route do."""
+
+    client = TestClient(app)
+    ordered = client.get("/api/calls?region=EU&per_page=5").headers["etag"]
+    shuffled = client.get("/api/calls?per_page=5&region=EU").headers["etag"]
+    other = client.get("/api/calls?per_page=5&region=US").headers["etag"]
+    assert ordered == shuffled
+    assert ordered != other
+    assert ordered != client.get("/api/metrics").headers["etag"]
+
+
+def test_error_responses_are_not_tagged() -> None:
+    """Only successful payloads are cacheable."""
+
+    response = TestClient(app).get("/api/calls", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert "etag" not in response.headers
+
+
+def test_streamed_exports_are_not_tagged() -> None:
+    """The CSV export shares the ``/api/calls`` prefix but is never revalidated."""
+
+    response = TestClient(app).get("/api/calls/export")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "cache-control" not in response.headers
@@ -0,0 +1,81 @@
+"""Point lookups served from the id index and the agent posting list."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pyarrow.dataset as ds
+from fastapi.testclient import TestClient
+
+from support_analytics.etl import build_local_parquet
+
+from ...main import app
+from ..conftest import PublishCalls
+
+
+def test_call_detail_reads_one_call_by_id() -> None:
+    """A known id returns its record and an unknown id is a 404."""
+
+    client = TestClient(app)
+    response = client.get("/api/calls/call-002")
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": "call-002",
+        "agent_id": "A-102",
+        "customer_region": "EU",
+        "issue_type": "Technical",
+        "duration_seconds": 780,
+        "resolution_status": "Escalated",
+        "started_at": "2025-11-25T15:17:00Z",
+    }
+    assert client.get("/api/calls/call-999").status_code == 404
+    assert client.get("/api/calls/export").headers["content-type"] == "application/x-ndjson"
+
+
+def test_agent_calls_page_through_the_posting_list() -> None:
+    """An agent's history is paged with keyset cursors and totals come from the index."""
+
+    client = TestClient(app)
+    body = client.get("/api/agents/A-101/calls").json()
+    assert [row["id"] for row in body["data"]] == ["call-001"]
+    assert body["meta"] == {"per_page": 50, "total": 1}
+    assert body["links"]["next"] is None
+
+    only = client.get("/api/agents/A-102/calls", params={"per_page": 1}).json()
+    assert [row["id"] for row in only["data"]] == ["call-002"]
+    assert only["links"]["next"] is None
+
+    assert client.get("/api/agents/A-999/calls").json()["meta"]["total"] == 0
+    bad_cursor = client.get("/api/agents/A-101/calls", params={"cursor": "nope"})
+    assert bad_cursor.status_code == 400
+
+
+def test_agent_history_pages_match_a_filtered_scan_across_partitions(
+    sample_calls: list[dict[str, Any]], publish_calls: PublishCalls
+) -> None:
+    """Paging an agent's postings over many row groups and days returns their full history."""
+
+    calls = []
+    for index in range(60):
+        started_at = f"2025-11-{24 + index % 3}T{(index * 5) % 24:02d}:{index % 60:02d}:00Z"
+        calls.append(dict(sample_calls[index % 2], id=f"call-{index:03d}", started_at=started_at))
+    inputs = publish_calls(calls, build=False, chunk_size=4, incremental=True)
+    dataset_dir = build_local_parquet(inputs)
+
+    scanned = ds.dataset(dataset_dir, partitioning="hive").to_table(
+        columns=["id", "started_at"], filter=ds.field("agent_id") == "A-101"
+    )
+    expected = sorted(zip(scanned.column("started_at").to_pylist(), scanned.column("id").to_pylist()))
+    assert len(expected) == 30
+
+    client = TestClient(app)
+    for per_page in (7, 10):
+        seen: list[str] = []
+        url: str | None = f"/api/agents/A-101/calls?per_page={per_page}"
+        while url is not None:
+            body = client.get(url).json()
+            assert body["meta"]["total"] == len(expected)
+            seen += [row["id"] for row in body["data"]]
+            url = body["links"]["next"]
+        assert seen == [call_id for _, call_id in expected]
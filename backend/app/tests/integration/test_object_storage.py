@@ -0,0 +1,36 @@
+"""Reads through the real S3 client against a moto-mocked bucket (skipped without moto)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ...repositories.storage import S3ObjectStore
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+
+def test_s3_object_store_serves_ranges_and_listings(
+    use_published_dataset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """HEAD, ranged GET with ``If-Match`` and prefix listing work against the S3 API."""
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    artifact = use_published_dataset.with_name("cleaned_calls.parquet")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="calls")
+        client.put_object(
+            Bucket="calls", Key="exports/cleaned_calls.parquet", Body=artifact.read_bytes()
+        )
+
+        store = S3ObjectStore("calls", region="us-east-1")
+        info = store.head("exports/cleaned_calls.parquet")
+        assert info.size == artifact.stat().st_size
+        assert [item.key for item in store.list("exports/")] == [info.key]
+        assert store.get_range(info.key, info.size - 4, info.size, info.etag) == b"PAR1"
+        with pytest.raises(FileNotFoundError):
+            store.head("exports/missing.parquet")
@@ -0,0 +1,90 @@
+"""Integration tests for the start-up warm-up behind ``/api/readyz``."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ...core.config import settings
+from ...db.cache import result_cache
+from ...main import app
+from ...services import warmup as warmup_service
+from ...services.data_access import current_manifest_hash
+
+
+def test_warmup_primes_the_default_dashboard_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """After the warm-up the probe is ready and the dashboard's first requests hit the cache."""
+
+    result_cache.clear()
+    warmup = warmup_service.Warmup()
+    state = asyncio.run(warmup.run())
+    assert state.ready, state.error
+    assert state.manifest_hash == current_manifest_hash()
+    assert state.row_groups > 0
+    assert set(state.stage_seconds) == {"import", "footers", "queries"}
+
+    monkeypatch.setattr(warmup_service, "warmup", warmup)
+    client = TestClient(app)
+    probe = client.get("/api/readyz")
+    assert probe.status_code == 200
+    assert probe.json()["data"]["status"] == "ready"
+
+    misses = result_cache.stats()["misses"]
+    for path in ("/api/metrics", "/api/agents", "/api/calls"):
+        assert client.get(path).status_code == 200
+    assert result_cache.stats()["misses"] == misses
+
+
+def test_readyz_is_unavailable_without_a_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A worker that cannot read the manifest is taken out of rotation."""
+
+    monkeypatch.setattr(warmup_service, "warmup", warmup_service.Warmup())
+    monkeypatch.setattr(settings, "manifest_path", str(tmp_path / "manifest.json"))
+    monkeypatch.setattr(settings, "parquet_path", str(tmp_path / "cleaned_calls.parquet"))
+
+    probe = TestClient(app).get("/api/readyz")
+    assert probe.status_code == 503
+    assert probe.json()["data"]["status"] == "failed"
+    assert TestClient(app).get("/api/healthz").status_code == 200
+
+
+def test_rewarm_keeps_reporting_the_warmed_revision_until_it_finishes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A new manifest is only reported once warm; a first warm-up reports ``warming``."""
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+        started = asyncio.Event()
+
+        async def blocked() -> None:
+            started.set()
+            await release.wait()
+
+        monkeypatch.setattr(warmup_service, "prime_default_queries", blocked)
+        warmup = warmup_service.Warmup()
+        task = asyncio.create_task(warmup.run())
+        await started.wait()
+        assert warmup.state.status == "warming"
+        assert warmup.state.manifest_hash == current_manifest_hash()
+        release.set()
+        await task
+
+        previous = warmup_service.Readiness(status="ready", manifest_hash="previous")
+        warmup.state = previous
+        release.clear()
+        started.clear()
+        task = asyncio.create_task(warmup.run())
+        await started.wait()
+        assert warmup.state is previous
+        release.set()
+        state = await task
+        assert warmup.state is state
+        assert state.ready and state.manifest_hash == current_manifest_hash()
+
+    asyncio.run(scenario())
@@ -0,0 +1,73 @@
+"""Background ETL refresh jobs started through the settings router."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from support_analytics.etl import etl_lock
+
+from ...core.config import settings
+from ...main import app
+from ...services.refresh import refresh_jobs
+from ..conftest import PublishCalls
+
+
+def test_refresh_is_disabled_by_default() -> None:
+    """Without ``ENABLE_REFRESH_ENDPOINT`` nothing is started."""
+
+    response = TestClient(app).post("/api/settings/refresh")
+    assert response.status_code == 403
+    assert TestClient(app).get("/api/settings/refresh/unknown").status_code == 404
+
+
+def test_refresh_runs_in_the_background_and_deduplicates(
+    sample_calls: list[dict[str, Any]],
+    publish_calls: PublishCalls,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent triggers share one job whose progress ends in a published manifest."""
+
+    inputs = publish_calls([*sample_calls, dict(sample_calls[0], id="call-003")], build=False)
+    monkeypatch.setattr(settings, "enable_refresh_endpoint", True)
+    monkeypatch.setattr(settings, "refresh_calls_path", str(inputs.calls_path))
+    monkeypatch.setattr(settings, "refresh_agents_path", str(inputs.agents_path))
+    client = TestClient(app)
+
+    started = client.post("/api/settings/refresh")
+    assert started.status_code == 202
+    assert started.json()["meta"] == {"created": True}
+    job_id = started.json()["data"]["id"]
+    duplicate = client.post("/api/settings/refresh").json()
+    assert (duplicate["data"]["id"], duplicate["meta"]) == (job_id, {"created": False})
+
+    finished = refresh_jobs.wait(job_id, timeout=120)
+    assert finished is not None and finished.status == "succeeded", finished
+    status = client.get(f"/api/settings/refresh/{job_id}").json()["data"]
+    assert (status["stage"], status["rows"], status["error"]) == ("completed", 3, None)
+    assert status["manifest_hash"] == client.get("/api/settings/manifest").json()["data"]["hash"]
+
+    events = client.get(f"/api/settings/refresh/{job_id}/events").text
+    assert events.startswith("event: succeeded\n")
+    assert client.get("/api/calls").json()["meta"]["total"] == 3
+    assert not list((tmp_path / "published").rglob(".*"))
+
+
+def test_refresh_conflicts_with_a_run_owned_by_another_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A run holding the ETL lock elsewhere is reported as ``409`` instead of a second job."""
+
+    manifest_path = tmp_path / "published" / "manifest.json"
+    monkeypatch.setattr(settings, "enable_refresh_endpoint", True)
+    monkeypatch.setattr(settings, "manifest_path", str(manifest_path))
+    client = TestClient(app)
+
+    with etl_lock(manifest_path):
+        response = client.post("/api/settings/refresh")
+    assert response.status_code == 409
+    assert response.json()["detail"].startswith("Another ETL run is publishing")
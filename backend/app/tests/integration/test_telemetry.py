@@ -0,0 +1,41 @@
+"""Integration tests for the Prometheus endpoint and per-request instrumentation."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from ...db.cache import result_cache
+from ...main import app
+from ...utils.instrumentation import PARQUET_ROW_GROUPS, REQUEST_LATENCY
+
+
+def test_requests_record_latency_and_parquet_reads() -> None:
+    """A cache miss on ``/api/calls`` reads row groups that are attributed to its route."""
+
+    result_cache.clear()
+    client = TestClient(app)
+    before = REQUEST_LATENCY.count("GET", "/api/calls", "200")
+    reads_before = PARQUET_ROW_GROUPS.count("/api/calls")
+
+    assert client.get("/api/calls", params={"per_page": 7}).status_code == 200
+
+    assert REQUEST_LATENCY.count("GET", "/api/calls", "200") == before + 1
+    assert PARQUET_ROW_GROUPS.count("/api/calls") == reads_before + 1
+    body = client.get("/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/calls",status="200"}' in (
+        body
+    )
+    assert "# TYPE parquet_read_bytes histogram" in body
+    assert "result_cache_hit_ratio " in body
+    assert 'worker_pool_queue_depth{kind="thread"} 0' in body
+    assert 'etl_stage_seconds{stage="parse"}' in body
+
+
+def test_revalidations_are_labelled_by_route_template() -> None:
+    """Requests answered before routing still report their route, not the raw path."""
+
+    client = TestClient(app)
+    etag = client.get("/api/agents").headers["etag"]
+    before = REQUEST_LATENCY.count("GET", "/api/agents", "304")
+    client.get("/api/agents", headers={"If-None-Match": etag})
+    assert REQUEST_LATENCY.count("GET", "/api/agents", "304") == before + 1
@@ -0,0 +1,78 @@
+"""Unit tests for the manifest-versioned result cache."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from ...db.cache import ResultCache, estimate_size
+
+
+def test_result_cache_counts_hits_and_evicts_by_size() -> None:
+    """Entries beyond the byte budget are evicted least-recently-used first."""
+
+    cache = ResultCache(max_bytes=10, max_entries=100)
+    first = cache.key("metrics", {"range": "30d"}, "hash-1")
+    second = cache.key("agents", None, "hash-1")
+    third = cache.key("calls", {"page": 1}, "hash-1")
+
+    cache.set(first, "aaaa")
+    cache.set(second, "bbbb")
+    assert cache.get(first) == "aaaa"
+    cache.set(third, "cccc")
+
+    assert cache.get(second) is None
+    assert cache.get(third) == "cccc"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+
+
+def test_result_cache_invalidates_on_new_manifest_hash() -> None:
+    """Seeing a new manifest hash drops every result computed for the previous one."""
+
+    cache = ResultCache(max_bytes=1024, max_entries=100)
+    cache.set(cache.key("agents", None, "hash-1"), ["stale"])
+
+    assert cache.get(cache.key("agents", None, "hash-2")) is None
+    assert cache.get(cache.key("agents", None, "hash-1")) is None
+    assert cache.stats()["invalidations"] >= 1
+
+
+def test_result_cache_ignores_superseded_manifest_hashes() -> None:
+    """Late reads and writes for an older hash neither clear nor roll back the generation."""
+
+    cache = ResultCache(max_bytes=1024, max_entries=100)
+    cache.set(cache.key("agents", None, "hash-1"), ["old"])
+    current = cache.key("agents", None, "hash-2")
+    cache.set(current, ["new"])
+
+    assert cache.get(cache.key("agents", None, "hash-1")) is None
+    cache.set(cache.key("metrics", None, "hash-1"), ["late"])
+
+    assert cache.get(current) == ["new"]
+    stats = cache.stats()
+    assert (stats["entries"], stats["invalidations"], stats["manifest_hash"]) == (1, 1, "hash-2")
+
+
+def test_result_cache_follows_the_latest_manifest_back_to_an_earlier_hash() -> None:
+    """With ``latest_generation`` a re-published earlier revision becomes current again."""
+
+    latest = ["hash-1"]
+    cache = ResultCache(max_bytes=1024, max_entries=100, latest_generation=lambda: latest[0])
+    cache.set(cache.key("agents", None, "hash-1"), ["first"])
+    latest[0] = "hash-2"
+    cache.set(cache.key("agents", None, "hash-2"), ["second"])
+    cache.set(cache.key("agents", None, "hash-1"), ["late"])
+    assert cache.stats()["manifest_hash"] == "hash-2"
+
+    latest[0] = "hash-1"
+    assert cache.get(cache.key("agents", None, "hash-1")) is None
+    cache.set(cache.key("agents", None, "hash-1"), ["rolled back"])
+    assert cache.get(cache.key("agents", None, "hash-1")) == ["rolled back"]
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_estimate_size_counts_polars_frames_by_their_buffers() -> None:
+    """A frame is charged its estimated buffer size, not the length of its repr."""
+
+    frame = pl.DataFrame({"value": list(range(10_000))})
+    assert estimate_size(frame) == frame.estimated_size() >= 80_000
@@ -0,0 +1,75 @@
+"""Cold-start budget: importing the app and answering liveness must not load the data stack."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+from ..conftest import REPO_ROOT
+
+HEAVY_MODULES = ("polars", "pyarrow", "pyarrow.dataset", "pandas", "numpy")
+BUDGET_ENV = "SUPPORT_ANALYTICS_IMPORT_BUDGET"
+BENCH_ENV = "SUPPORT_ANALYTICS_BENCH"
+DEFAULT_BUDGET_SECONDS = 1.5
+
+PROBE = f"""
+import json, sys
+import backend.app.main
+from fastapi.testclient import TestClient
+response = TestClient(backend.app.main.app).get("/api/healthz")
+heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"status": response.status_code, "heavy": heavy}}))
+"""
+
+
+def import_times(stderr: str) -> dict[str, float]:
+    """Cumulative seconds per module from ``python -X importtime`` output."""
+
+    times: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line.split("|"))
+        times[module] = int(cumulative) / 1_000_000
+    return times
+
+
+def import_budget() -> float | None:
+    """Seconds allowed for importing the app, or ``None`` when timing is not checked.
+
+    Wall-clock import time depends on the machine, so it is only asserted on request:
+    ``SUPPORT_ANALYTICS_IMPORT_BUDGET`` sets the budget, and a benchmark run
+    (``SUPPORT_ANALYTICS_BENCH``) applies the default one.
+    """
+
+    if os.environ.get(BUDGET_ENV):
+        return float(os.environ[BUDGET_ENV])
+    if os.environ.get(BENCH_ENV):
+        return DEFAULT_BUDGET_SECONDS
+    return None
+
+
+def test_cold_start_stays_within_the_import_budget() -> None:
+    """``/api/healthz`` answers without Polars or pyarrow, inside the ``-X importtime`` budget.
+
+    Data routes import the columnar stack on their first request. The heavy-module check
+    always runs; the time budget only when :func:`import_budget` enables it.
+    """
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert probe == {"status": 200, "heavy": []}
+
+    budget = import_budget()
+    if budget is None:
+        return
+    elapsed = import_times(completed.stderr)["backend.app.main"]
+    assert elapsed <= budget, f"importing backend.app.main took {elapsed:.2f}s (> {budget}s)"
@@ -0,0 +1,105 @@
+"""Unit tests for the shared manifest watcher behind the server-sent events route."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import pytest
+
+from support_analytics.etl import build_local_parquet
+
+from ...services.events import HEARTBEAT_FRAME, ManifestBroadcaster, manifest_events
+from ..conftest import PublishCalls
+
+
+def _payload(frame: bytes) -> dict[str, object]:
+    lines = frame.decode("utf-8").splitlines()
+    assert lines[0] == "event: manifest"
+    return json.loads(lines[2].removeprefix("data: "))
+
+
+def test_new_manifest_is_pushed_once_to_every_subscriber(
+    sample_calls: list[dict[str, Any]], publish_calls: PublishCalls
+) -> None:
+    """Subscribers get the current revision, heartbeats, then one shared frame per publish."""
+
+    inputs = publish_calls()
+
+    async def next_event(events: object) -> bytes:
+        while True:
+            frame = await asyncio.wait_for(anext(events), timeout=5)  # type: ignore[arg-type]
+            if frame != HEARTBEAT_FRAME:
+                return frame
+
+    async def scenario() -> None:
+        source = ManifestBroadcaster(poll_interval=0.02)
+        first = await manifest_events(source, heartbeat=0.05)
+        second = await manifest_events(source, heartbeat=0.05)
+
+        current = await anext(first)
+        assert await anext(second) is current
+        initial = _payload(current)
+        assert initial["manifest"]["row_count"] == 2  # type: ignore[index]
+        assert initial["kpis"]["volume"] == {  # type: ignore[index]
+            "timestamp": "2025-11-25T00:00:00Z",
+            "value": 2.0,
+            "delta": None,
+        }
+        assert await anext(first) == HEARTBEAT_FRAME
+        assert source.stats() == {"subscribers": 2, "broadcasts": 0, "errors": 0}
+
+        with inputs.calls_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(dict(sample_calls[0], id="call-003")) + "\n")
+        await asyncio.to_thread(build_local_parquet, inputs)
+        pushed, shared = await next_event(first), await next_event(second)
+        assert pushed is shared
+        assert _payload(pushed)["manifest"]["row_count"] == 3  # type: ignore[index]
+        assert source.stats()["broadcasts"] == 1
+
+        await first.aclose()
+        await second.aclose()
+        assert source.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_watcher_survives_failed_polls_and_subscribe_errors_propagate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failing tick is counted and retried; a failing first poll never opens a stream."""
+
+    async def scenario() -> None:
+        source = ManifestBroadcaster(poll_interval=0.01)
+        events = await manifest_events(source, heartbeat=0.05)
+        await anext(events)
+        real_poll = source.poll
+        calls = 0
+
+        async def flaky_poll() -> bool:
+            nonlocal calls
+            calls += 1
+            if calls <= 3:
+                raise OSError("manifest is being replaced")
+            return await real_poll()
+
+        monkeypatch.setattr(source, "poll", flaky_poll)
+        # Polls keep coming after the three failures, so the watcher task is still alive.
+        await asyncio.wait_for(_until(lambda: calls >= 5), timeout=5)
+        assert source.stats()["errors"] == 3
+        await events.aclose()
+
+        broken = ManifestBroadcaster(poll_interval=0.01)
+        calls = 0
+        monkeypatch.setattr(broken, "poll", flaky_poll)
+        with pytest.raises(OSError):
+            await manifest_events(broken)
+        assert broken.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    while not condition():
+        await asyncio.sleep(0.005)
@@ -0,0 +1,71 @@
+"""Unit tests for the bounded worker pool used by the services layer."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+
+from ...services.executor import WorkerPool
+
+
+def test_pool_limits_concurrency_and_tracks_queue_depth() -> None:
+    """Jobs beyond ``max_concurrency`` wait for a slot and show up as queue depth."""
+
+    pool = WorkerPool(kind="thread", max_workers=4, max_concurrency=2)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def job(value: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return value * 2
+
+    async def scenario() -> list[int]:
+        return await asyncio.gather(*(pool.run(job, value) for value in range(6)))
+
+    try:
+        assert asyncio.run(scenario()) == [0, 2, 4, 6, 8, 10]
+    finally:
+        pool.shutdown()
+    stats = pool.stats()
+    assert peak == 2
+    assert stats["completed"] == 6
+    assert stats["queue_depth"] == 0
+    assert stats["peak_queue_depth"] >= 4
+
+
+def test_event_loop_stays_responsive_while_pool_is_busy() -> None:
+    """Blocking work on the pool does not stall other coroutines."""
+
+    pool = WorkerPool(kind="thread", max_workers=1)
+
+    async def scenario() -> float:
+        busy = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+        started = time.perf_counter()
+        await asyncio.sleep(0)
+        latency = time.perf_counter() - started
+        await busy
+        return latency
+
+    try:
+        assert asyncio.run(scenario()) < 0.1
+    finally:
+        pool.shutdown()
+
+
+def test_process_pool_runs_picklable_jobs() -> None:
+    """The process flavour accepts module-level callables."""
+
+    pool = WorkerPool(kind="process", max_workers=1)
+    try:
+        assert asyncio.run(pool.run(math.factorial, 10)) == 3_628_800
+    finally:
+        pool.shutdown()
+    assert pool.stats()["kind"] == "process"
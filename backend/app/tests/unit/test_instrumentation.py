@@ -0,0 +1,33 @@
+"""Unit tests for the Prometheus text rendering of the metrics registry."""
+
+from __future__ import annotations
+
+from ...utils.instrumentation import Registry, begin_request, end_request, record_parquet_read
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """Bucket counts are cumulative and end with ``+Inf``, ``_sum`` and ``_count``."""
+
+    registry = Registry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, "/api/calls")
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/api/calls",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/api/calls",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/api/calls",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/api/calls"} 5.55' in lines
+    assert 'latency_seconds_count{route="/api/calls"} 3' in lines
+
+
+def test_parquet_reads_are_attributed_to_the_active_request_only() -> None:
+    """Reads outside a request are ignored; inside one they accumulate."""
+
+    record_parquet_read(1, 100)
+    token = begin_request()
+    record_parquet_read(2, 2048)
+    record_parquet_read(1, 1024)
+    stats = end_request(token)
+    assert (stats.row_groups, stats.bytes_read) == (3, 3072)
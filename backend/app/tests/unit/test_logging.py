@@ -0,0 +1,54 @@
+"""Unit tests for the structured logging bootstrap."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Iterator
+
+import pytest
+import structlog
+
+from ...utils.logging import configure_logging
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    root.handlers = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+@pytest.mark.usefixtures("restore_logging")
+def test_stdlib_and_structlog_records_share_the_json_renderer(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Both kinds of logger emit one JSON object per line with the same fields."""
+
+    configure_logging("INFO", json_logs=True)
+    structlog.get_logger("app").info("structured", route="/api/calls")
+    structlog.get_logger("app").debug("dropped")
+    logging.getLogger("uvicorn.error").warning("plain %s", "record")
+
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    assert [line["event"] for line in lines] == ["structured", "plain record"]
+    assert [line["level"] for line in lines] == ["info", "warning"]
+    assert all("timestamp" in line for line in lines)
+    assert lines[0]["route"] == "/api/calls"
+
+
+@pytest.mark.usefixtures("restore_logging")
+def test_reconfiguring_replaces_the_previous_handler() -> None:
+    configure_logging("INFO")
+    configure_logging("DEBUG", json_logs=True)
+
+    ours = [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler.formatter, structlog.stdlib.ProcessorFormatter)
+    ]
+    assert len(ours) == 1
+    assert logging.getLogger().level == logging.DEBUG
@@ -0,0 +1,36 @@
+"""Unit tests for pruned Parquet scans in the repository layer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ...repositories import parquet_repo
+from ...utils.instrumentation import begin_request, end_request
+
+
+def test_match_filters_skip_row_groups_by_their_statistics(tmp_path: Path) -> None:
+    """A rare dictionary value only costs the row groups whose bounds can hold it."""
+
+    regions = ["NA"] * 6 + ["APAC"] * 3 + ["EU"]
+    table = pa.table(
+        {
+            "id": [f"call-{index:03d}" for index in range(len(regions))],
+            "customer_region": pa.array(regions).dictionary_encode(),
+        }
+    )
+    path = tmp_path / "calls.parquet"
+    pq.write_table(table, path, row_group_size=3)
+
+    token = begin_request()
+    page = parquet_repo.scan_page(path, ["id"], None, 0, 10, {"customer_region": "EU"})
+    total = parquet_repo.count_rows(path, None, {"customer_region": "EU"})
+    stats = end_request(token)
+
+    assert page.column("id").to_pylist() == ["call-009"]
+    assert total == 1
+    # Only the last row group spans "EU", once for the page and once for the count.
+    assert stats.row_groups == 2
+    assert parquet_repo.count_rows(path, None, {"customer_region": "Mars"}) == 0
@@ -0,0 +1,91 @@
+"""Unit tests for the single-flight primitive used by the services layer."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ...services.singleflight import SingleFlight
+
+
+def test_concurrent_threads_share_one_computation() -> None:
+    """Threads asking for the same key while it is in flight get the leader's result."""
+
+    flights = SingleFlight()
+    calls = 0
+    release = threading.Event()
+
+    def compute() -> int:
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flights.do, "metrics", compute) for _ in range(8)]
+        while flights.stats()["leaders"] + flights.stats()["followers"] < 8:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [42] * 8
+    assert calls == 1
+    assert flights.stats() == {"leaders": 1, "followers": 7, "in_flight": 0}
+
+
+def test_followers_receive_the_leader_exception() -> None:
+    """A failed computation is reported to every waiter and not remembered afterwards."""
+
+    flights = SingleFlight()
+    calls = 0
+    release = threading.Event()
+    failure = RuntimeError("boom")
+
+    def fail() -> None:
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        raise failure
+
+    def attempt() -> BaseException | None:
+        try:
+            flights.do("agents", fail)
+        except RuntimeError as error:
+            return error
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(attempt) for _ in range(4)]
+        while flights.stats()["leaders"] + flights.stats()["followers"] < 4:
+            time.sleep(0.001)
+        release.set()
+        errors = [future.result() for future in futures]
+
+    assert all(error is failure for error in errors)
+    assert calls == 1
+    assert flights.stats() == {"leaders": 1, "followers": 3, "in_flight": 0}
+    assert flights.do("agents", lambda: "recovered") == "recovered"
+
+
+def test_concurrent_coroutines_share_one_task() -> None:
+    """Awaiters of the same key on one loop share a single coroutine run."""
+
+    flights = SingleFlight()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "page"
+
+    async def scenario() -> list[str]:
+        same = [flights.do_async(("calls", "p1"), compute) for _ in range(5)]
+        other = flights.do_async(("calls", "p2"), compute)
+        return await asyncio.gather(*same, other)
+
+    assert asyncio.run(scenario()) == ["page"] * 6
+    assert calls == 2
+    assert flights.stats()["in_flight"] == 0
@@ -0,0 +1,219 @@
+"""Unit tests for the object-storage backend: range coalescing, block cache and API reads."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+import pytest
+from fastapi.testclient import TestClient
+
+from ...core.config import settings
+from ...db.cache import result_cache
+from ...main import app
+from ...repositories import storage
+from ...repositories.object_fs import ObjectStoreHandler
+from ...repositories.storage import (
+    BlockCache,
+    BlockFetcher,
+    ObjectInfo,
+    ObjectStore,
+    build_storage,
+    coalesce_ranges,
+)
+from ..conftest import PublishCalls
+
+
+class MemoryStore(ObjectStore):
+    """In-memory bucket that records every ranged GET it serves."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.gets: list[tuple[str, int, int]] = []
+
+    def put(self, key: str, payload: bytes) -> None:
+        self.objects[key] = payload
+
+    def _info(self, key: str) -> ObjectInfo:
+        payload = self.objects[key]
+        return ObjectInfo(key=key, size=len(payload), etag=hashlib.md5(payload).hexdigest())
+
+    def head(self, key: str) -> ObjectInfo:
+        if key not in self.objects:
+            raise FileNotFoundError(key)
+        return self._info(key)
+
+    def list(self, prefix: str) -> list[ObjectInfo]:
+        return [self._info(key) for key in sorted(self.objects) if key.startswith(prefix)]
+
+    def get_range(self, key: str, start: int, stop: int, etag: str | None = None) -> bytes:
+        assert etag in (None, self._info(key).etag)
+        self.gets.append((key, start, stop))
+        return self.objects[key][start:stop]
+
+
+def _parquet_bytes(rows: int) -> bytes:
+    table = pa.table({"id": [f"call-{n:05d}" for n in range(rows)], "value": list(range(rows))})
+    sink = io.BytesIO()
+    pq.write_table(table, sink, row_group_size=rows // 4)
+    return sink.getvalue()
+
+
+def _filesystem(store: ObjectStore, cache_dir: Path, block_size: int = 1024) -> pafs.FileSystem:
+    fetcher = BlockFetcher(
+        store,
+        BlockCache(cache_dir, max_bytes=1 << 30),
+        block_size=block_size,
+        max_gap=0,
+        max_request_bytes=1 << 20,
+        concurrency=4,
+    )
+    return pafs.PyFileSystem(ObjectStoreHandler(fetcher, metadata_ttl=0.0))
+
+
+def test_coalesce_ranges_merges_small_gaps_up_to_the_size_cap() -> None:
+    """Nearby ranges become one request unless that request would exceed ``max_size``."""
+
+    ranges = [(100, 200), (0, 50), (60, 90), (1000, 1100), (40, 70)]
+    assert coalesce_ranges(ranges) == [(0, 90), (100, 200), (1000, 1100)]
+    assert coalesce_ranges(ranges, max_gap=10) == [(0, 200), (1000, 1100)]
+    capped = coalesce_ranges(ranges, max_gap=1000, max_size=150)
+    assert capped == [(0, 90), (100, 200), (1000, 1100)]
+
+
+def test_parquet_reads_use_ranges_and_the_disk_cache(tmp_path: Path) -> None:
+    """Reads fetch byte ranges, a second process reads from disk, a new ETag refetches."""
+
+    store = MemoryStore()
+    payload = _parquet_bytes(4_000)
+    store.put("data/calls.parquet", payload)
+
+    cold = pq.read_table("data/calls.parquet", filesystem=_filesystem(store, tmp_path))
+    assert cold.num_rows == 4_000
+    assert 0 < sum(stop - start for _, start, stop in store.gets) <= len(payload)
+
+    column = pq.read_table(
+        "data/calls.parquet", columns=["value"], filesystem=_filesystem(store, tmp_path)
+    )
+    assert column.column("value").to_pylist() == list(range(4_000))
+    requests = len(store.gets)
+
+    warm = pq.read_table("data/calls.parquet", filesystem=_filesystem(store, tmp_path))
+    assert warm.equals(cold)
+    assert len(store.gets) == requests
+
+    store.put("data/calls.parquet", _parquet_bytes(400))
+    replaced = pq.read_table("data/calls.parquet", filesystem=_filesystem(store, tmp_path))
+    assert replaced.num_rows == 400
+    assert len(store.gets) > requests
+
+
+def test_block_cache_evicts_least_recently_used_and_survives_restarts(tmp_path: Path) -> None:
+    """The byte budget drops the oldest block and a new instance reloads what is on disk."""
+
+    cache = BlockCache(tmp_path, max_bytes=10)
+    cache.put("etag-1", 0, b"aaaa")
+    cache.put("etag-1", 1, b"bbbb")
+    assert cache.get("etag-1", 0) == b"aaaa"
+    cache.put("etag-2", 0, b"cccc")
+
+    assert cache.get("etag-1", 1) is None
+    assert cache.stats()["bytes"] == 8
+
+    reopened = BlockCache(tmp_path, max_bytes=10)
+    assert reopened.get("etag-2", 0) == b"cccc"
+    assert reopened.get("etag-1", 0) == b"aaaa"
+    assert reopened.stats()["hit_ratio"] == 1.0
+
+
+def test_block_cache_hits_refresh_recency_across_restarts(tmp_path: Path) -> None:
+    """A hit touches the block file, so the order rebuilt after a restart keeps it."""
+
+    cache = BlockCache(tmp_path, max_bytes=8)
+    cache.put("etag-1", 0, b"aaaa")
+    cache.put("etag-2", 0, b"bbbb")
+    for etag, seconds in (("etag-1", 1), ("etag-2", 2)):
+        block = tmp_path / BlockCache.digest(etag) / f"{0:010d}"
+        os.utime(block, ns=(seconds * 10**9, seconds * 10**9))
+    assert cache.get("etag-1", 0) == b"aaaa"
+
+    reopened = BlockCache(tmp_path, max_bytes=8)
+    reopened.put("etag-3", 0, b"cccc")
+    assert reopened.get("etag-1", 0) == b"aaaa"
+    assert reopened.get("etag-2", 0) is None
+
+
+def _serve_from_bucket(
+    manifest_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> tuple[MemoryStore, Path]:
+    """Mirror a published folder into a bucket and switch the API to read only from it."""
+
+    store = MemoryStore()
+    published = manifest_path.parent
+    for path in published.rglob("*"):
+        if path.is_file():
+            store.put(f"exports/{path.relative_to(published).as_posix()}", path.read_bytes())
+
+    mirror = tmp_path / "mirror" / "manifest.json"
+    monkeypatch.setattr(settings, "data_source", "s3")
+    monkeypatch.setattr(settings, "s3_prefix", "exports")
+    monkeypatch.setattr(settings, "manifest_path", str(mirror))
+    monkeypatch.setattr(settings, "parquet_path", str(mirror.with_name("cleaned_calls.parquet")))
+    monkeypatch.setattr(settings, "block_cache_dir", str(tmp_path / "blocks"))
+    backend = build_storage(store)
+    monkeypatch.setattr(storage, "_storage", (storage._storage_config(), backend))
+    result_cache.clear()
+    return store, mirror
+
+
+def test_api_serves_the_same_calls_from_object_storage(
+    use_published_dataset: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A published folder mirrored to a bucket answers exactly like the local copy."""
+
+    client = TestClient(app)
+    result_cache.clear()
+    local = client.get("/api/calls", params={"per_page": 5}).json()
+
+    store, mirror = _serve_from_bucket(use_published_dataset, tmp_path, monkeypatch)
+
+    remote = client.get("/api/calls", params={"per_page": 5}).json()
+    assert remote == local
+    assert mirror.exists()
+    artifact = json.loads(use_published_dataset.read_text(encoding="utf-8"))["path"]
+    assert {key for key, _, _ in store.gets} >= {"exports/manifest.json", f"exports/{artifact}"}
+    assert not (mirror.parent / artifact).exists()
+    result_cache.clear()
+
+
+def test_index_lookups_resolve_a_partitioned_dataset_in_object_storage(
+    sample_calls: list[dict[str, Any]],
+    publish_calls: PublishCalls,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Call and agent lookups find partition files through the bucket, not the local disk."""
+
+    late = dict(sample_calls[0], id="call-003", started_at="2025-11-26T09:00:00Z")
+    inputs = publish_calls([*sample_calls, late], incremental=True)
+    client = TestClient(app)
+    result_cache.clear()
+    paths = ["/api/calls/call-003", "/api/agents/A-101/calls", "/api/agents/A-102/calls"]
+    local = [client.get(path).json() for path in paths]
+    assert local[0]["started_at"] == "2025-11-26T09:00:00Z"
+    assert [row["id"] for row in local[1]["data"]] == ["call-001", "call-003"]
+
+    store, mirror = _serve_from_bucket(inputs.manifest_path, tmp_path, monkeypatch)
+
+    assert [client.get(path).json() for path in paths] == local
+    fetched = {key for key, _, _ in store.gets}
+    assert any("/cleaned_calls/date=2025-11-26/" in key for key in fetched)
+    assert not (mirror.parent / "revisions").exists()
+    result_cache.clear()
@@ -0,0 +1,287 @@
+"""In-process metrics registry rendered in the Prometheus text exposition format.
+
+Recording is a dictionary lookup and a few additions under a lock, and gauges that mirror
+other components (cache, worker pool, manifest) are only evaluated when ``/metrics`` is
+scraped, so the instrumentation can stay enabled in production.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import contextvars
+import math
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+LabelValues = tuple[str, ...]
+Sample = tuple[dict[str, str], float]
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = tuple(float(4**power * 1024) for power in range(11))
+ROW_GROUP_BUCKETS = (0.0, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 512.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{rendered}}}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(abc.ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _labels(self, values: LabelValues) -> dict[str, str]:
+        return dict(zip(self.label_names, values))
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    @abc.abstractmethod
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        """Yield ``(suffix, labels, value)`` for every exposed series."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing total, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        """Add ``amount`` to the series identified by ``labels``."""
+
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current total for ``labels``."""
+
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            items = list(self._values.items())
+        return [("", self._labels(labels), value) for labels, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with a running sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation; cost is a binary search and three additions."""
+
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # One slot per bucket, then +Inf, sum and count.
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        """Return how many observations were recorded for ``labels``."""
+
+        with self._lock:
+            series = self._series.get(labels)
+            return 0 if series is None else int(series[-1])
+
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._series.items()]
+        samples: list[tuple[str, dict[str, str], float]] = []
+        for labels, series in items:
+            base = self._labels(labels)
+            cumulative = 0.0
+            for bound, observed in zip((*self.buckets, math.inf), series):
+                cumulative += observed
+                bucket_labels = {**base, "le": _format_value(bound)}
+                samples.append(("_bucket", bucket_labels, cumulative))
+            samples.append(("_sum", base, series[-2]))
+            samples.append(("_count", base, series[-1]))
+        return samples
+
+
+class Gauge(_Metric):
+    """Point-in-time values, either set directly or computed by a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Iterable[Sample]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, *labels: str) -> None:
+        """Overwrite the series identified by ``labels``."""
+
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        if self._callback is not None:
+            return [("", labels, value) for labels, value in self._callback()]
+        with self._lock:
+            items = list(self._values.items())
+        return [("", self._labels(labels), value) for labels, value in items]
+
+
+class Registry:
+    """Ordered collection of metrics rendered together on ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add ``metric``, replacing any previous metric with the same name."""
+
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        """Create and register a counter."""
+
+        metric = Counter(name, documentation, labels)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+
+        metric = Histogram(name, documentation, labels, buckets)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Iterable[Sample]] | None = None,
+    ) -> Gauge:
+        """Create and register a gauge."""
+
+        metric = Gauge(name, documentation, labels, callback)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format (version 0.0.4)."""
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template, method and status code.",
+    labels=("method", "route", "status"),
+)
+PARQUET_BYTES = registry.histogram(
+    "parquet_read_bytes",
+    "Compressed Parquet column-chunk bytes read per request.",
+    labels=("route",),
+    buckets=BYTES_BUCKETS,
+)
+PARQUET_ROW_GROUPS = registry.histogram(
+    "parquet_read_row_groups",
+    "Parquet row groups read per request.",
+    labels=("route",),
+    buckets=ROW_GROUP_BUCKETS,
+)
+
+
+@dataclass(slots=True)
+class ReadStats:
+    """Parquet I/O attributed to the current request."""
+
+    bytes_read: int = 0
+    row_groups: int = 0
+
+
+_read_stats: contextvars.ContextVar[ReadStats | None] = contextvars.ContextVar(
+    "parquet_read_stats", default=None
+)
+
+
+def begin_request() -> contextvars.Token[ReadStats | None]:
+    """Start attributing Parquet reads to a fresh :class:`ReadStats` for this context."""
+
+    return _read_stats.set(ReadStats())
+
+
+def end_request(token: contextvars.Token[ReadStats | None]) -> ReadStats:
+    """Stop attributing reads and return what the request consumed."""
+
+    stats = _read_stats.get() or ReadStats()
+    _read_stats.reset(token)
+    return stats
+
+
+def record_parquet_read(row_groups: int, bytes_read: int) -> None:
+    """Attribute row groups and bytes to the active request; a no-op outside of one."""
+
+    stats = _read_stats.get()
+    if stats is not None:
+        stats.row_groups += row_groups
+        stats.bytes_read += bytes_read
@@ -0,0 +1,58 @@
+"""Deferred module loading so the app starts without importing the columnar stack."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any, Callable
+
+
+class LazyModule(ModuleType):
+    """Stand-in for a module that imports it on first attribute access.
+
+    Every read, write and delete is forwarded to the real module, so callers holding the
+    stand-in and callers holding the module itself (e.g. tests that monkeypatch it) always
+    see the same attributes. Importing is delegated to :mod:`importlib`, whose per-module
+    lock makes a first use from several threads at once safe.
+    """
+
+    def _target(self) -> ModuleType:
+        return importlib.import_module(self.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._target(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._target())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_package(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a PEP 562 ``__getattr__`` for ``package``.
+
+    Names in ``exports`` resolve to the attribute of the same name in the mapped submodule,
+    importing it then. Any other submodule is returned as a :class:`LazyModule`, so
+    ``from package import submodule`` costs nothing until the submodule is used.
+    """
+
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            module = importlib.import_module(f"{package}.{exports[name]}")
+            return getattr(module, name)
+        qualified = f"{package}.{name}"
+        if name.startswith("__") or importlib.util.find_spec(qualified) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return namespace.setdefault(name, LazyModule(qualified))
+
+    return __getattr__
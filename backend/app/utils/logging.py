@@ -4,8 +4,44 @@ from __future__ import annotations
 
 import logging
 
+import structlog
 
-def configure_logging(level: str = "INFO") -> None:
-    """Set up basic logging config so future services can opt-in."""
 
-    logging.basicConfig(level=getattr(logging, level.upper(), logging.INFO))
+def configure_logging(level: str = "INFO", json_logs: bool = False) -> None:
+    """Route stdlib and structlog output through one processor chain.
+
+    ``json_logs`` renders one JSON object per line for log shippers; otherwise events are
+    rendered for humans. Events below ``level`` are dropped before any formatting work.
+    """
+
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    shared: list[structlog.types.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+    renderer: structlog.types.Processor = (
+        structlog.processors.JSONRenderer() if json_logs else structlog.dev.ConsoleRenderer()
+    )
+    # structlog events stop after the shared processors and are handed to the stdlib root
+    # handler, whose formatter runs the same chain over records from stdlib loggers.
+    structlog.configure(
+        processors=[*shared, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
+        cache_logger_on_first_use=True,
+    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared,
+            processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, renderer],
+        )
+    )
+    root = logging.getLogger()
+    # Replace a handler installed by an earlier call, but leave foreign handlers alone.
+    for existing in list(root.handlers):
+        if isinstance(existing.formatter, structlog.stdlib.ProcessorFormatter):
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(log_level)
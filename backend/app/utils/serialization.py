@@ -0,0 +1,59 @@
+"""Fast JSON encoding for columnar results that bypasses per-row Pydantic models."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from fastapi import Response
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def wire_frame(rows: pa.Table | pa.RecordBatch | pl.DataFrame) -> pl.DataFrame:
+    """Return ``rows`` as a frame whose timestamps are rendered as ISO-8601 ``...Z`` strings.
+
+    Dictionary columns need no conversion; Polars writes their values, not their codes.
+    """
+
+    # Imported here so routers that only splice envelopes do not load Polars at start-up.
+    import polars as pl
+    import polars.selectors as cs
+
+    from support_analytics.timestamps import POLARS_WIRE_FORMAT
+
+    frame = rows if isinstance(rows, pl.DataFrame) else pl.from_arrow(rows)
+    assert isinstance(frame, pl.DataFrame)
+    return frame.with_columns(cs.datetime().dt.strftime(POLARS_WIRE_FORMAT))
+
+
+def rows_json(rows: pa.Table | pl.DataFrame) -> bytes:
+    """Encode a columnar result as a JSON array of row objects in one vectorised pass."""
+
+    return wire_frame(rows).write_json().encode("utf-8")
+
+
+def envelope_json(data: bytes, meta: dict[str, Any], links: dict[str, Any]) -> bytes:
+    """Splice pre-encoded ``data`` into the ``{data, meta, links}`` envelope."""
+
+    return b"".join(
+        (
+            b'{"data":',
+            data,
+            b',"meta":',
+            json.dumps(meta, separators=(",", ":")).encode("utf-8"),
+            b',"links":',
+            json.dumps(links, separators=(",", ":")).encode("utf-8"),
+            b"}",
+        )
+    )
+
+
+def json_response(body: bytes) -> Response:
+    """Return already-encoded JSON without FastAPI's response-model validation."""
+
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
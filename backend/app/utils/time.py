@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+TIME_RANGE_UNITS = {"h": timedelta(hours=1), "d": timedelta(days=1), "w": timedelta(weeks=1)}
 
 
 def utcnow() -> str:
     """Return ISO formatted UTC timestamp."""
 
     return datetime.now(tz=timezone.utc).isoformat()
+
+
+def parse_time_range(value: str) -> timedelta:
+    """Convert a relative range such as ``"30d"``, ``"48h"`` or ``"12w"`` into a timedelta."""
+
+    unit = TIME_RANGE_UNITS.get(value[-1:])
+    if unit is None or not value[:-1].isdigit():
+        raise ValueError(f"Unsupported time range: {value!r}")
+    return int(value[:-1]) * unit
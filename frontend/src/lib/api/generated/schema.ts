@@ -9,4 +9,19 @@ export type CallRecord = {
   issue_type: string;
   duration_seconds: number;
   resolution_status: string;
+  started_at: string;
+};
+
+export type MetricPoint = {
+  timestamp: string;
+  value: number;
+  delta: number | null;
+};
+
+export type MetricsRequest = {
+  kpi?: "volume" | "avg_handle_time" | "resolution_rate";
+  time_range?: string;
+  granularity?: "hour" | "day" | "week";
+  region?: string;
+  issue_type?: string;
 };
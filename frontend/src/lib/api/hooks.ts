@@ -1,7 +1,10 @@
-import { useQuery } from "@tanstack/react-query";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
+import { useEffect } from "react";
 
+import { getBaseUrl } from "../utils/env";
 import { apiFetch } from "./client";
-import type { CallRecord } from "./generated/schema";
+import { queryKeys } from "../constants/queryKeys";
+import type { CallRecord, MetricPoint, MetricsRequest } from "./generated/schema";
 
 export function useCalls() {
   return useQuery({
@@ -13,3 +16,30 @@ export function useCalls() {
     staleTime: 30_000,
   });
 }
+
+export function useMetrics(request: MetricsRequest = {}) {
+  const params = new URLSearchParams(
+    Object.entries(request).filter((entry): entry is [string, string] => Boolean(entry[1])),
+  );
+  return useQuery({
+    queryKey: queryKeys.metrics(params.toString()),
+    queryFn: () => apiFetch<MetricPoint[]>(`/api/metrics?${params.toString()}`),
+    staleTime: 30_000,
+  });
+}
+
+export function useManifestEvents() {
+  const queryClient = useQueryClient();
+  useEffect(() => {
+    const source = new EventSource(`${getBaseUrl()}/api/settings/manifest/events`);
+    let published: string | null = null;
+    source.addEventListener("manifest", (event) => {
+      const { lastEventId } = event as MessageEvent<string>;
+      if (published !== null && lastEventId !== published) {
+        void queryClient.invalidateQueries();
+      }
+      published = lastEventId;
+    });
+    return () => source.close();
+  }, [queryClient]);
+}
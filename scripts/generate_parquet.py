@@ -1,14 +1,37 @@
-"""Utilities for producing placeholder Parquet files from the sample JSON inputs.
+"""Produce the cleaned Parquet artifacts from the raw JSON calls and agent roster.
 
-This script mirrors the AWS Glue job described in BackArc.md. The current version writes
-informational log statements instead of touching disk so the rest of the stack can be built
-incrementally. Replace the stubs once the ETL flow is ready to ingest large datasets.
+This script mirrors the AWS Glue job described in BackArc.md. A single input file rewrites
+`cleaned_calls.parquet`; `--incremental` appends only calls newer than the manifest watermark
+to a Hive-style `cleaned_calls/date=YYYY-MM-DD/` dataset instead, resuming an append-only
+NDJSON export at the byte offset the previous run recorded. Directories, glob patterns or
+several files are converted in parallel (one worker process per file) into a freshly
+published `cleaned_calls/` dataset with a single manifest.
+
+Examples:
+    python scripts/generate_parquet.py --input data/sample_calls.json --incremental
+    python scripts/generate_parquet.py --input "raw/calls/2025-11-*.json" --workers 8
+    python scripts/generate_parquet.py --verify
 """
 
 from __future__ import annotations
 
+import argparse
+import sys
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from support_analytics.etl import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    EtlInput,
+    build_local_parquet,
+    build_parallel_dataset,
+    resolve_call_files,
+)
+from support_analytics.manifest import verify_manifest  # noqa: E402
 
 
 def generate_parquet(
@@ -16,8 +39,10 @@ def generate_parquet(
     agents_path: Path,
     output_path: Path,
     manifest_path: Path | None = None,
-) -> None:
-    """Log the intended ETL behavior as a placeholder for the real implementation.
+    incremental: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Path:
+    """Run the streaming ETL and return the artifact the manifest now points at.
 
     Parameters
     ----------
@@ -26,23 +51,120 @@ def generate_parquet(
     agents_path:
         CSV containing agent metadata used for enrichment.
     output_path:
-        Destination for the cleaned Parquet artifact that simulates S3/Glue output.
+        Names the cleaned Parquet artifact that simulates S3/Glue output; each run writes it
+        into a new ``revisions/<run id>/`` directory next to the manifest.
     manifest_path:
-        Optional manifest file describing the generated dataset.
+        Optional manifest file describing the generated dataset. Defaults to a
+        `manifest.json` next to `output_path`.
+    incremental:
+        Append calls newer than the manifest watermark to the partitioned dataset instead of
+        rebuilding the monolithic file.
+    chunk_size:
+        Maximum number of rows held in memory (and written per row group).
     """
 
-    message = (
-        "[generate_parquet] Placeholder run — expected to combine %s and %s "
-        "into %s (manifest: %s)"
+    inputs = EtlInput(
+        calls_path=input_path,
+        agents_path=agents_path,
+        manifest_path=manifest_path or output_path.with_name("manifest.json"),
+        chunk_size=chunk_size,
+        output_path=output_path,
+        incremental=incremental,
+    )
+    return build_local_parquet(inputs)
+
+
+def generate_partitioned_dataset(
+    call_files: Sequence[Path],
+    agents_path: Path,
+    output_path: Path,
+    manifest_path: Path | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> Path:
+    """Convert many raw call files in parallel and return the published dataset directory.
+
+    The dataset is written next to ``output_path`` with its suffix dropped (for example
+    ``data/cleaned_calls/``); ``workers`` defaults to the number of CPUs.
+    """
+
+    report = build_parallel_dataset(
+        call_files,
+        agents_path,
+        manifest_path or output_path.with_name("manifest.json"),
+        chunk_size=chunk_size,
+        output_path=output_path,
+        workers=workers,
+    )
+    return report.output_path
+
+
+def parse_args(args: Iterable[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        default=["data/sample_calls.json"],
+        help="Raw calls file(s), directories or glob patterns (quote globs for the shell).",
+    )
+    parser.add_argument("--agents", type=Path, default=Path("data/agents.csv"))
+    parser.add_argument("--output", type=Path, default=Path("data/cleaned_calls.parquet"))
+    parser.add_argument("--manifest", type=Path, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process calls newer than the manifest watermark (single input file).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Rehash the published artifact against the manifest instead of running the ETL.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for multi-file inputs (default: number of CPUs).",
     )
-    print(message % (input_path, agents_path, output_path, manifest_path))
+    options = parser.parse_args(None if args is None else list(args))
+    if options.workers is not None and options.workers < 1:
+        parser.error("--workers must be at least 1")
+    return options
 
 
 def main(args: Iterable[str] | None = None) -> None:
     """Entry point used by `python scripts/generate_parquet.py` during local dev."""
 
-    print(
-        "The ETL placeholder is wired up. Pass real CLI parsing once datasets are ready."
+    options = parse_args(args)
+    if options.verify:
+        manifest_path = options.manifest or options.output.with_name("manifest.json")
+        if not verify_manifest(manifest_path):
+            raise SystemExit(f"{manifest_path} does not match its published artifact")
+        return
+    call_files = resolve_call_files(options.input)
+    single_file = len(options.input) == 1 and call_files == [Path(options.input[0])]
+    if single_file:
+        generate_parquet(
+            call_files[0],
+            options.agents,
+            options.output,
+            manifest_path=options.manifest,
+            incremental=options.incremental,
+            chunk_size=options.chunk_size,
+        )
+        return
+    if options.incremental:
+        raise SystemExit("--incremental only supports a single input file")
+    generate_partitioned_dataset(
+        call_files,
+        options.agents,
+        options.output,
+        manifest_path=options.manifest,
+        chunk_size=options.chunk_size,
+        workers=options.workers,
     )
 
 
@@ -1,10 +1,29 @@
 """Support analytics ETL helpers.
 
 The module exposes light-weight stubs so downstream FastAPI services can import predictable
-symbols even before the actual data pipeline is implemented.
+symbols even before the actual data pipeline is implemented. Exports resolve on first access
+(PEP 562), so reading the manifest does not import the Polars/pyarrow ETL stack.
 """
 
-from .etl import build_local_parquet
-from .manifest import ManifestRecord, load_manifest
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "build_local_parquet": "etl",
+    "ManifestRecord": "manifest",
+    "load_manifest": "manifest",
+}
 
 __all__ = ["build_local_parquet", "ManifestRecord", "load_manifest"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
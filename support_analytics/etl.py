@@ -1,10 +1,103 @@
-"""Stub ETL helpers that describe how local CSV/JSON inputs become Parquet artifacts."""
+"""Streaming ETL helpers that turn local CSV/JSON inputs into Parquet artifacts."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Sequence, TypeVar
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import structlog
+
+from .indexes import write_indexes
+from .manifest import atomic_output, hash_dataset, manifest_entry, resolve_artifact_path
+from .ordering import OrderTracker, merge_row_groups, sort_parquet_file
+from .rollups import RollupAccumulator, write_rollups
+from .timestamps import TIMESTAMP_TYPE, format_timestamp, parse_timestamp
+
+try:  # pragma: no cover - ``resource`` is unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - Windows locks files through ``msvcrt`` instead
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+DEFAULT_CHUNK_SIZE = 100_000
+READ_BLOCK_SIZE = 1 << 16
+FINGERPRINT_TAIL_BYTES = 1 << 16
+PARTITION_KEY = "date"
+REVISIONS_DIR = "revisions"
+
+T = TypeVar("T")
+
+# Called with the stage just completed and the rows processed so far.
+ProgressCallback = Callable[[str, int], None]
+
+logger = structlog.get_logger(__name__)
+
+RAW_CALL_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("agent_id", pa.string()),
+        ("customer_region", pa.string()),
+        ("issue_type", pa.string()),
+        ("duration_seconds", pa.int64()),
+        ("resolution_status", pa.string()),
+        ("started_at", pa.string()),
+    ]
+)
+
+AGENT_SCHEMA = {
+    "agent_id": pl.Utf8,
+    "name": pl.Utf8,
+    "region": pl.Utf8,
+    "skill_rating": pl.Float64,
+}
+
+# Low-cardinality strings are stored dictionary-encoded so scans, filters and group-bys work
+# on integer codes. Durations fit int32 (a uint16 would cap calls at ~18 hours), and
+# ``started_at`` is a real UTC timestamp rather than an ISO string.
+CATEGORY_TYPE = pa.dictionary(pa.int32(), pa.string())
+CLEANED_CALL_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("agent_id", CATEGORY_TYPE),
+        ("customer_region", CATEGORY_TYPE),
+        ("issue_type", CATEGORY_TYPE),
+        ("duration_seconds", pa.int32()),
+        ("resolution_status", CATEGORY_TYPE),
+        ("started_at", TIMESTAMP_TYPE),
+        ("agent_name", CATEGORY_TYPE),
+        ("agent_region", CATEGORY_TYPE),
+        ("skill_rating", pa.float64()),
+    ]
+)
+
+# Sorted timestamps and prefix-sharing call ids compress far better as deltas than through
+# Parquet's default dictionary pages; every other column keeps dictionary encoding.
+CALL_PARQUET_OPTIONS: dict[str, Any] = {
+    "use_dictionary": [
+        name for name in CLEANED_CALL_SCHEMA.names if name not in ("id", "started_at")
+    ],
+    "column_encoding": {"id": "DELTA_BYTE_ARRAY", "started_at": "DELTA_BINARY_PACKED"},
+}
 
 
 @dataclass(slots=True)
@@ -14,17 +107,1039 @@ class EtlInput:
     calls_path: Path
     agents_path: Path
     manifest_path: Path
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    output_path: Path | None = None
+    incremental: bool = False
+
+    @property
+    def parquet_path(self) -> Path:
+        """Name of the monolithic artifact; each revision holds its own copy."""
+
+        return self.output_path or self.manifest_path.with_name("cleaned_calls.parquet")
+
+    @property
+    def revisions_dir(self) -> Path:
+        """Folder next to the manifest holding one sub-directory per published run."""
+
+        return self.manifest_path.with_name(REVISIONS_DIR)
+
+    def revision(self, run_id: str) -> Revision:
+        """Layout of the revision written by run ``run_id``."""
+
+        return Revision(self.revisions_dir / run_id, self.parquet_path.name)
+
+
+@dataclass(slots=True)
+class Revision:
+    """One published run: the calls artifact plus the rollups and indexes built from it.
+
+    A revision directory is written once and never modified after the manifest points at
+    it, so readers holding an older manifest keep a consistent set of files.
+    """
+
+    root: Path
+    artifact_name: str
+
+    @property
+    def name(self) -> str:
+        """Run id the revision is named after, as recorded in the manifest."""
+
+        return self.root.name
+
+    @property
+    def parquet_path(self) -> Path:
+        """Monolithic artifact written by full rebuilds."""
+
+        return self.root / self.artifact_name
+
+    @property
+    def dataset_dir(self) -> Path:
+        """Hive-partitioned dataset root extended by incremental runs."""
+
+        return self.parquet_path.with_suffix("")
+
+    @property
+    def rollup_dir(self) -> Path:
+        """Folder holding the pre-aggregated rollup tables."""
+
+        return self.root / "rollups"
+
+    @property
+    def index_dir(self) -> Path:
+        """Folder holding the call-id and agent posting-list index sidecars."""
+
+        return self.root / "indexes"
+
+
+@dataclass(slots=True)
+class EtlReport:
+    """Throughput and memory figures captured while an ETL run streams its inputs."""
+
+    output_path: Path
+    row_count: int
+    row_groups: int
+    elapsed_seconds: float
+    peak_rss_bytes: int | None
+    revision: str | None = None
+    watermark: str | None = None
+    source_fingerprint: str | None = None
+    resume: ResumePoint | None = None
+    rollups: dict[str, str] | None = None
+    indexes: dict[str, str] | None = None
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Average throughput across the whole run."""
+
+        if self.elapsed_seconds <= 0:
+            return float(self.row_count)
+        return self.row_count / self.elapsed_seconds
+
+
+@contextmanager
+def timed_stage(stages: dict[str, float], name: str) -> Iterator[None]:
+    """Add the wall-clock time spent inside the block to ``stages[name]``."""
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + time.perf_counter() - started
+
+
+def timed_iter(stages: dict[str, float], name: str, items: Iterable[T]) -> Iterator[T]:
+    """Yield from ``items`` while charging the time spent producing each item to ``name``."""
+
+    iterator = iter(items)
+    while True:
+        with timed_stage(stages, name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def iter_call_records(
+    path: Path, block_size: int = READ_BLOCK_SIZE, start: int = 0
+) -> Iterator[dict[str, Any]]:
+    """Yield call dictionaries one at a time from a JSON array or NDJSON export.
+
+    NDJSON files are consumed line by line. JSON arrays (such as ``sample_calls.json``) are
+    decoded incrementally from fixed-size text blocks so the full document never has to be
+    resident in memory. A non-zero ``start`` resumes an NDJSON export at that byte offset,
+    which must be the start of a line (see :func:`resume_point`).
+    """
+
+    if start:
+        yield from _iter_ndjson_from(path, start)
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        head = handle.read(block_size)
+        stripped = head.lstrip()
+        if not stripped.startswith("["):
+            yield from _iter_ndjson(head, handle)
+            return
+        yield from _iter_json_array(stripped[1:], handle, block_size)
+
 
+def _iter_ndjson(head: str, handle: Any) -> Iterator[dict[str, Any]]:
+    for line in _chain_lines(head, handle):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
 
-def build_local_parquet(inputs: EtlInput) -> Path:
-    """Pretend to build a Parquet artifact from the provided sources.
 
-    The real implementation will leverage Polars for speed and align column contracts with the
-    FastAPI schemas. For now we simply echo the paths to prove the wiring works end-to-end.
+def _iter_ndjson_from(path: Path, start: int) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as handle:
+        handle.seek(start)
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _chain_lines(head: str, handle: Any) -> Iterator[str]:
+    lines = head.split("\n")
+    carry = lines.pop()
+    yield from lines
+    for line in handle:
+        if carry:
+            line = carry + line
+            carry = ""
+        yield line
+    if carry:
+        yield carry
+
+
+def _iter_json_array(buffer: str, handle: Any, block_size: int) -> Iterator[dict[str, Any]]:
+    decoder = json.JSONDecoder()
+    position = 0
+    exhausted = False
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if exhausted:
+                if position >= len(buffer):
+                    raise ValueError("Unterminated JSON array in calls export") from None
+                raise
+            block = handle.read(block_size)
+            exhausted = not block
+            buffer = buffer[position:] + block
+            position = 0
+            continue
+        position = end
+        yield record
+
+
+def iter_call_chunks(path: Path, chunk_size: int, start: int = 0) -> Iterator[pa.Table]:
+    """Group streamed call records into Arrow tables of at most ``chunk_size`` rows."""
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    batch: list[dict[str, Any]] = []
+    for record in iter_call_records(path, start=start):
+        batch.append(record)
+        if len(batch) >= chunk_size:
+            yield pa.Table.from_pylist(batch, schema=RAW_CALL_SCHEMA)
+            batch = []
+    if batch:
+        yield pa.Table.from_pylist(batch, schema=RAW_CALL_SCHEMA)
+
+
+def load_agents(agents_path: Path) -> pl.DataFrame:
+    """Read the (small) agent roster used to enrich each call chunk."""
+
+    agents = pl.read_csv(agents_path, schema_overrides=AGENT_SCHEMA)
+    return agents.select(
+        pl.col("agent_id"),
+        pl.col("name").alias("agent_name"),
+        pl.col("region").alias("agent_region"),
+        pl.col("skill_rating"),
+    ).unique(subset="agent_id", keep="first")
+
+
+def parse_started_at(frame: pl.DataFrame) -> pl.DataFrame:
+    """Convert the raw ISO-8601 ``started_at`` strings into UTC timestamps."""
+
+    if frame.schema["started_at"] != pl.Utf8:
+        return frame
+    return frame.with_columns(
+        pl.col("started_at").str.to_datetime(time_unit="us", time_zone="UTC")
+    )
+
+
+def enrich_chunk(chunk: pa.Table, agents: pl.DataFrame) -> pa.Table:
+    """Join one raw call chunk against the agent roster and enforce the column contract.
+
+    Rows are sorted by ``(started_at, id)``, which gives every row group tight ``started_at``
+    stats. This only orders the chunk: writers track chunk key ranges with an
+    :class:`~support_analytics.ordering.OrderTracker` and merge-sort their output when chunks
+    overlap in time, so keyset paging sees one global order.
+    """
+
+    frame = pl.from_arrow(chunk)
+    assert isinstance(frame, pl.DataFrame)
+    frame = parse_started_at(frame)
+    joined = frame.join(agents, on="agent_id", how="left").sort(["started_at", "id"])
+    return joined.to_arrow().select(CLEANED_CALL_SCHEMA.names).cast(CLEANED_CALL_SCHEMA)
+
+
+def partition_dates(enriched: pa.Table) -> pl.Series:
+    """Return the ``YYYY-MM-DD`` partition value of every row of an enriched chunk."""
+
+    return pl.Series(enriched.column("started_at")).dt.strftime("%Y-%m-%d")
+
+
+def peak_rss_bytes(include_children: bool = False) -> int | None:
+    """Return the process high-water resident set size, when the platform exposes it.
+
+    With ``include_children`` the largest finished worker process is considered too.
+    """
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports kilobytes while macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def report_progress(progress: ProgressCallback | None, stage: str, rows: int) -> None:
+    """Forward a progress update when the caller asked for them."""
+
+    if progress is not None:
+        progress(stage, rows)
+
+
+class EtlLockedError(RuntimeError):
+    """Raised when another process is already publishing to the same manifest."""
+
+
+def new_run_id() -> str:
+    """Sortable, microsecond-resolution id naming a run's revision and part files."""
+
+    return datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def lock_path(manifest_path: Path) -> Path:
+    """File whose OS lock serialises the runs publishing to ``manifest_path``."""
+
+    return manifest_path.with_name(f"{manifest_path.name}.lock")
+
+
+@contextmanager
+def etl_lock(manifest_path: Path) -> Iterator[None]:
+    """Hold the exclusive lock that lets one process at a time publish to ``manifest_path``.
+
+    The lock is an OS file lock, so it covers API refresh jobs in every worker as well as CLI
+    runs, and the OS releases it if the holder dies. Raises :class:`EtlLockedError` instead
+    of waiting when another run holds it.
     """
 
-    print(f"[ETL] Ready to transform {inputs.calls_path} + {inputs.agents_path}")
-    return inputs.manifest_path.with_name("cleaned_calls.parquet")
+    path = lock_path(manifest_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as handle:
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError as error:
+            raise EtlLockedError(f"Another ETL run is publishing {manifest_path}") from error
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def published_revision(inputs: EtlInput, content: dict[str, Any]) -> Revision | None:
+    """The revision the manifest ``content`` points at, if it still exists."""
+
+    name = content.get("revision")
+    if not name:
+        return None
+    revision = inputs.revision(name)
+    return revision if revision.root.is_dir() else None
+
+
+@contextmanager
+def staged_revision(inputs: EtlInput, run_id: str) -> Iterator[Revision]:
+    """Create the run's revision directory and delete it again if the run fails.
+
+    Nothing refers to the directory until the manifest is replaced, so a run that is killed
+    outright only leaves an orphan for the next successful run to prune.
+    """
+
+    revision = inputs.revision(run_id)
+    revision.root.mkdir(parents=True)
+    try:
+        yield revision
+    except BaseException:
+        shutil.rmtree(revision.root, ignore_errors=True)
+        raise
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def link_revision(previous: Revision, revision: Revision) -> None:
+    """Seed ``revision`` with hard links to the files of ``previous`` (copies if unsupported).
+
+    Incremental runs then extend the new revision: partition parts are added as new files and
+    rollups and indexes are replaced by rename, so files shared with ``previous`` are never
+    written to.
+    """
+
+    shutil.copytree(
+        previous.root,
+        revision.root,
+        ignore=shutil.ignore_patterns(".*"),
+        copy_function=_link_or_copy,
+        dirs_exist_ok=True,
+    )
+
+
+def prune_revisions(inputs: EtlInput, keep: Iterable[str | None]) -> None:
+    """Delete every revision directory except those named in ``keep``.
+
+    Callers keep the revision they just published and the one it replaced, so requests that
+    read the previous manifest just before the switch can still finish.
+    """
+
+    kept = {name for name in keep if name}
+    for path in inputs.revisions_dir.iterdir():
+        if path.is_dir() and path.name not in kept:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def stream_calls_to_parquet(
+    inputs: EtlInput,
+    output_path: Path,
+    rollups: RollupAccumulator | None = None,
+    progress: ProgressCallback | None = None,
+) -> EtlReport:
+    """Stream calls through the agent join and write one Parquet row group per chunk.
+
+    The file is written under a staging name and renamed over ``output_path`` once complete.
+    When the export is not in chronological order the staged file is merge-sorted first, so
+    the published file is ordered on ``(started_at, id)`` as a whole.
+    """
+
+    started = time.perf_counter()
+    stages: dict[str, float] = {}
+    with timed_stage(stages, "load_agents"):
+        agents = load_agents(inputs.agents_path)
+    row_count = 0
+    row_groups = 0
+    order = OrderTracker()
+    chunks = iter_call_chunks(inputs.calls_path, inputs.chunk_size)
+    with atomic_output(output_path) as staging:
+        with pq.ParquetWriter(staging, CLEANED_CALL_SCHEMA, **CALL_PARQUET_OPTIONS) as writer:
+            for chunk in timed_iter(stages, "parse", chunks):
+                with timed_stage(stages, "enrich"):
+                    enriched = enrich_chunk(chunk, agents)
+                with timed_stage(stages, "write"):
+                    writer.write_table(enriched, row_group_size=inputs.chunk_size)
+                    order.add(enriched)
+                if rollups is not None:
+                    with timed_stage(stages, "rollup"):
+                        rollups.add(enriched)
+                row_count += enriched.num_rows
+                row_groups += 1
+                report_progress(progress, "write", row_count)
+        if not order.ordered:
+            with timed_stage(stages, "sort"):
+                row_groups = sort_parquet_file(
+                    staging, inputs.chunk_size, **CALL_PARQUET_OPTIONS
+                )
+            report_progress(progress, "sort", row_count)
+    return EtlReport(
+        output_path=output_path,
+        row_count=row_count,
+        row_groups=row_groups,
+        elapsed_seconds=time.perf_counter() - started,
+        peak_rss_bytes=peak_rss_bytes(),
+        stage_seconds=stages,
+    )
+
+
+def source_fingerprint(path: Path) -> str:
+    """Cheaply identify a source file revision from its size, mtime and trailing bytes.
+
+    Appends always change the tail, so hashing the last block is enough to notice new calls
+    without re-reading a multi-GB export.
+    """
+
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as handle:
+        handle.seek(max(stat.st_size - FINGERPRINT_TAIL_BYTES, 0))
+        digest.update(handle.read())
+    return f"{stat.st_size}-{stat.st_mtime_ns}-{digest.hexdigest()}"
+
+
+@dataclass(slots=True, frozen=True)
+class ResumePoint:
+    """Where an incremental run stopped reading an append-only NDJSON export.
+
+    ``offset`` is the byte just past the last complete line and ``digest`` fingerprints the
+    bytes before it, so an export that was rewritten rather than appended to is read from the
+    start again.
+    """
+
+    offset: int
+    digest: str
+
+
+def _prefix_digest(handle: BinaryIO, offset: int) -> str:
+    start = max(offset - FINGERPRINT_TAIL_BYTES, 0)
+    handle.seek(start)
+    return hashlib.blake2b(handle.read(offset - start), digest_size=16).hexdigest()
+
+
+def resume_point(path: Path) -> ResumePoint | None:
+    """Locate the end of the last complete line of an NDJSON export (``None`` for arrays).
+
+    JSON arrays are not append-only (the closing bracket moves), so they are always re-read.
+    """
+
+    with path.open("rb") as handle:
+        if handle.read(READ_BLOCK_SIZE).lstrip().startswith(b"["):
+            return None
+        end = offset = handle.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(end - READ_BLOCK_SIZE, 0)
+            handle.seek(start)
+            newline = handle.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                offset = start + newline + 1
+                break
+            end = start
+        else:
+            offset = 0
+        return ResumePoint(offset=offset, digest=_prefix_digest(handle, offset))
+
+
+def resume_offset(path: Path, watermark: dict[str, Any]) -> int:
+    """Byte offset the previous run recorded in ``watermark``, or 0 unless it still holds.
+
+    The offset holds while the export is at least that long and the bytes before it are
+    unchanged, i.e. the export has only been appended to since.
+    """
+
+    offset, digest = watermark.get("source_offset"), watermark.get("source_digest")
+    if not isinstance(offset, int) or offset <= 0 or not digest:
+        return 0
+    with path.open("rb") as handle:
+        if handle.seek(0, os.SEEK_END) < offset:
+            return 0
+        return offset if _prefix_digest(handle, offset) == digest else 0
+
+
+def read_manifest_content(manifest_path: Path) -> dict[str, Any]:
+    """Return the raw manifest dictionary, or an empty one before the first run."""
+
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text(encoding="utf-8") or "{}")
+
+
+def stream_calls_to_partitions(
+    inputs: EtlInput,
+    dataset_dir: Path,
+    run_id: str,
+    watermark: str | None,
+    rollups: RollupAccumulator | None = None,
+    progress: ProgressCallback | None = None,
+    start: int = 0,
+) -> EtlReport:
+    """Append calls newer than ``watermark`` to ``date=YYYY-MM-DD/`` partitions.
+
+    Each run writes one new ``part-<run id>.parquet`` file per touched date and never rewrites
+    existing files, so the cost is proportional to the delta rather than the dataset. Parts
+    are written under hidden staging names and renamed into place together once every chunk
+    has been written, so a failed run leaves no partial parts behind. A part whose chunks
+    overlap in time is merge-sorted before the rename; rows past the watermark always sort
+    after the existing parts, so the partitions stay ordered as a whole. ``start`` skips the
+    part of an NDJSON export an earlier run already consumed; records before the watermark
+    are still dropped, e.g. a trailing line without a newline that is read twice.
+    """
+
+    started = time.perf_counter()
+    stages: dict[str, float] = {}
+    with timed_stage(stages, "load_agents"):
+        agents = load_agents(inputs.agents_path)
+    writers: dict[str, pq.ParquetWriter] = {}
+    staged: dict[Path, Path] = {}
+    orders: dict[str, OrderTracker] = {}
+    part_groups: dict[str, int] = {}
+    row_count = 0
+    high_water = None if watermark is None else parse_timestamp(watermark)
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        chunks = iter_call_chunks(inputs.calls_path, inputs.chunk_size, start)
+        for chunk in timed_iter(stages, "parse", chunks):
+            with timed_stage(stages, "enrich"):
+                frame = pl.from_arrow(chunk)
+                assert isinstance(frame, pl.DataFrame)
+                frame = parse_started_at(frame)
+                if watermark is not None:
+                    frame = frame.filter(pl.col("started_at") > parse_timestamp(watermark))
+                if frame.is_empty():
+                    continue
+                enriched = enrich_chunk(frame.to_arrow(), agents)
+            if rollups is not None:
+                with timed_stage(stages, "rollup"):
+                    rollups.add(enriched)
+            dates = partition_dates(enriched)
+            for date in dates.unique().sort():
+                with timed_stage(stages, "write"):
+                    partition = enriched.filter((dates == date).to_arrow())
+                    writer = writers.get(date)
+                    if writer is None:
+                        partition_dir = dataset_dir / f"{PARTITION_KEY}={date}"
+                        target = partition_dir / f"part-{run_id}.parquet"
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        staging = staged[target] = target.with_name(f".{target.name}.tmp")
+                        writer = writers[date] = pq.ParquetWriter(
+                            staging, CLEANED_CALL_SCHEMA, **CALL_PARQUET_OPTIONS
+                        )
+                    writer.write_table(partition, row_group_size=inputs.chunk_size)
+                    orders.setdefault(date, OrderTracker()).add(partition)
+                part_groups[date] = part_groups.get(date, 0) + 1
+            row_count += enriched.num_rows
+            chunk_max = frame.get_column("started_at").max()
+            if isinstance(chunk_max, datetime) and (high_water is None or chunk_max > high_water):
+                high_water = chunk_max
+            report_progress(progress, "write", row_count)
+        for writer in writers.values():
+            writer.close()
+        for date, order in orders.items():
+            if not order.ordered:
+                partition_dir = dataset_dir / f"{PARTITION_KEY}={date}"
+                staging = staged[partition_dir / f"part-{run_id}.parquet"]
+                with timed_stage(stages, "sort"):
+                    part_groups[date] = sort_parquet_file(
+                        staging, inputs.chunk_size, **CALL_PARQUET_OPTIONS
+                    )
+    except BaseException:
+        for writer in writers.values():
+            writer.close()
+        for staging in staged.values():
+            staging.unlink(missing_ok=True)
+        raise
+    for target, staging in staged.items():
+        os.replace(staging, target)
+    return EtlReport(
+        output_path=dataset_dir,
+        row_count=row_count,
+        row_groups=sum(part_groups.values()),
+        elapsed_seconds=time.perf_counter() - started,
+        peak_rss_bytes=peak_rss_bytes(),
+        watermark=None if high_water is None else format_timestamp(high_water),
+        stage_seconds=stages,
+    )
+
+
+def write_manifest(manifest_path: Path, report: EtlReport, append: bool = False) -> None:
+    """Merge the latest run statistics and watermark into ``manifest.json``.
+
+    With ``append`` the row and row-group counts accumulate on top of the previous manifest,
+    which is how incremental runs keep the totals describing the whole dataset.
+    """
+
+    content = read_manifest_content(manifest_path)
+    row_count, row_groups = report.row_count, report.row_groups
+    if append:
+        row_count += int(content.get("row_count", 0))
+        row_groups += int(content.get("row_groups", 0))
+    with timed_stage(report.stage_seconds, "hash"):
+        content_hash, size_bytes, files = hash_dataset(report.output_path, content.get("files"))
+    content.update(
+        {
+            "dataset": "cleaned_calls",
+            "path": manifest_entry(manifest_path, report.output_path),
+            "hash": content_hash,
+            "size_bytes": size_bytes,
+            "files": files,
+            "row_count": row_count,
+            "row_groups": row_groups,
+            "generated_at": datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    )
+    if report.revision is None:
+        content.pop("revision", None)
+    else:
+        content["revision"] = report.revision
+    for section, paths in (("rollups", report.rollups), ("indexes", report.indexes)):
+        if paths is not None:
+            content[section] = {
+                name: manifest_entry(manifest_path, Path(path)) for name, path in paths.items()
+            }
+    content["stage_seconds"] = {
+        name: round(seconds, 6) for name, seconds in report.stage_seconds.items()
+    }
+    if report.watermark is None and report.source_fingerprint is None:
+        content.pop("watermark", None)
+    else:
+        content["watermark"] = {
+            "started_at": report.watermark,
+            "source_fingerprint": report.source_fingerprint,
+        }
+        if report.resume is not None:
+            content["watermark"]["source_offset"] = report.resume.offset
+            content["watermark"]["source_digest"] = report.resume.digest
+    with atomic_output(manifest_path) as staging:
+        staging.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+
+
+def build_full_dataset(inputs: EtlInput, progress: ProgressCallback | None = None) -> EtlReport:
+    """Rebuild ``cleaned_calls.parquet`` with its rollups and indexes in a new revision."""
+
+    previous = read_manifest_content(inputs.manifest_path).get("revision")
+    run_id = new_run_id()
+    with staged_revision(inputs, run_id) as revision:
+        rollups = RollupAccumulator()
+        report = stream_calls_to_parquet(inputs, revision.parquet_path, rollups, progress)
+        report.revision = revision.name
+        with timed_stage(report.stage_seconds, "rollup_write"):
+            report.rollups = write_rollups(rollups, revision.rollup_dir)
+        report_progress(progress, "rollup_write", report.row_count)
+        with timed_stage(report.stage_seconds, "index"):
+            report.indexes = write_indexes(revision.parquet_path, revision.index_dir, run_id)
+        report_progress(progress, "index", report.row_count)
+        write_manifest(inputs.manifest_path, report)
+    report_progress(progress, "manifest", report.row_count)
+    prune_revisions(inputs, keep=(run_id, previous))
+    return report
+
+
+def build_incremental_dataset(
+    inputs: EtlInput, progress: ProgressCallback | None = None
+) -> EtlReport:
+    """Process only calls newer than the manifest watermark into the partitioned dataset.
+
+    The new revision starts from hard links to the published partitions, rollups and
+    indexes and adds the delta on top. The watermark is honoured only while the manifest
+    points at a partitioned revision; after a full rebuild (or a path change) the first
+    incremental run re-seeds an empty dataset from the whole export.
+    """
+
+    content = read_manifest_content(inputs.manifest_path)
+    fingerprint = source_fingerprint(inputs.calls_path)
+    previous = content.get("watermark") or {}
+    published = resolve_artifact_path(inputs.manifest_path, content.get("path"))
+    previous_revision = published_revision(inputs, content)
+    continuing = (
+        previous_revision is not None
+        and "path" in content
+        and os.path.abspath(published) == os.path.abspath(previous_revision.dataset_dir)
+        and bool(previous)
+    )
+    unchanged = previous.get("source_fingerprint") == fingerprint
+    if continuing and unchanged and previous_revision is not None:
+        return EtlReport(
+            output_path=previous_revision.dataset_dir,
+            row_count=0,
+            row_groups=0,
+            elapsed_seconds=0.0,
+            peak_rss_bytes=peak_rss_bytes(),
+            revision=previous_revision.name,
+            watermark=previous.get("started_at"),
+            source_fingerprint=fingerprint,
+        )
+
+    run_id = new_run_id()
+    with staged_revision(inputs, run_id) as revision:
+        stages: dict[str, float] = {}
+        if continuing and previous_revision is not None:
+            with timed_stage(stages, "link"):
+                link_revision(previous_revision, revision)
+        rollups = RollupAccumulator()
+        watermark = previous.get("started_at") if continuing else None
+        # Located before parsing: lines appended meanwhile are read again next run and
+        # dropped there by the watermark.
+        resume = resume_point(inputs.calls_path)
+        start = resume_offset(inputs.calls_path, previous) if continuing else 0
+        report = stream_calls_to_partitions(
+            inputs, revision.dataset_dir, run_id, watermark, rollups, progress, start
+        )
+        report.stage_seconds = {**stages, **report.stage_seconds}
+        report.revision = revision.name
+        report.source_fingerprint = fingerprint
+        report.resume = resume
+        with timed_stage(report.stage_seconds, "rollup_write"):
+            report.rollups = write_rollups(rollups, revision.rollup_dir, append=continuing)
+        report_progress(progress, "rollup_write", report.row_count)
+        with timed_stage(report.stage_seconds, "index"):
+            written = sorted(report.output_path.glob(f"*/part-{run_id}.parquet"))
+            report.indexes = write_indexes(
+                report.output_path, revision.index_dir, run_id, files=written
+            )
+        report_progress(progress, "index", report.row_count)
+        write_manifest(inputs.manifest_path, report, append=continuing)
+    report_progress(progress, "manifest", report.row_count)
+    prune_revisions(inputs, keep=(run_id, content.get("revision")))
+    return report
+
+
+def build_local_parquet(inputs: EtlInput, progress: ProgressCallback | None = None) -> Path:
+    """Build the cleaned calls artifact as a new revision using bounded memory.
+
+    Calls are streamed in chunks of ``inputs.chunk_size`` rows, enriched with the agent roster
+    via Polars, and appended to Parquet as individual row groups, so peak memory is governed
+    by the chunk size rather than the size of the export. Full rebuilds write
+    ``cleaned_calls.parquet``; incremental runs extend the ``cleaned_calls/`` partitions.
+    Both refresh the per-agent and hourly KPI rollups under ``rollups/`` and the point-lookup
+    index sidecars under ``indexes/``.
+
+    Everything is written into a fresh ``revisions/<run id>/`` directory and published by
+    replacing the manifest, the only file that is ever overwritten, so readers see either
+    the previous revision or the new one as a whole. The run holds :func:`etl_lock` for its
+    whole duration, so concurrent runs from other processes fail fast with
+    :class:`EtlLockedError`. ``progress`` is called with each completed stage and the rows
+    processed so far.
+    """
+
+    with etl_lock(inputs.manifest_path):
+        if inputs.incremental:
+            report = build_incremental_dataset(inputs, progress)
+        else:
+            report = build_full_dataset(inputs, progress)
+    output_path = report.output_path
+    logger.info(
+        "etl.completed",
+        path=output_path.as_posix(),
+        revision=report.revision,
+        rows=report.row_count,
+        row_groups=report.row_groups,
+        rows_per_second=round(report.rows_per_second),
+        peak_rss_bytes=report.peak_rss_bytes,
+        stage_seconds={name: round(value, 4) for name, value in report.stage_seconds.items()},
+    )
+    return output_path
+
+
+CALL_FILE_SUFFIXES = (".json", ".ndjson", ".jsonl")
+
+SortKey = tuple[datetime, str]
+
+
+def resolve_call_files(sources: Iterable[str | Path]) -> list[Path]:
+    """Expand files, directories and glob patterns into a sorted, de-duplicated file list.
+
+    Directories are searched recursively for ``.json``, ``.ndjson`` and ``.jsonl`` files.
+    """
+
+    files: set[Path] = set()
+    for source in sources:
+        text = str(source)
+        path = Path(text)
+        if path.is_dir():
+            files.update(
+                match
+                for match in path.rglob("*")
+                if match.is_file() and match.suffix.lower() in CALL_FILE_SUFFIXES
+            )
+        elif any(char in text for char in "*?["):
+            files.update(Path(match) for match in glob.glob(text, recursive=True))
+        elif path.is_file():
+            files.add(path)
+        else:
+            raise FileNotFoundError(path)
+    if not files:
+        raise FileNotFoundError(f"No call files matched {', '.join(map(str, sources))}")
+    return sorted(files)
+
+
+@dataclass(slots=True)
+class PartitionPart:
+    """One Parquet file a worker wrote into a date partition, with its key range."""
+
+    date: str
+    path: Path
+    first_key: SortKey
+    last_key: SortKey
+    ordered: bool = True
+    row_groups: int = 0
+
+
+@dataclass(slots=True)
+class FileConversion:
+    """What one worker produced from one raw calls file."""
+
+    row_count: int
+    parts: list[PartitionPart]
+    high_water: datetime | None
+    rollups: RollupAccumulator
+    stage_seconds: dict[str, float]
+
+
+def convert_call_file(
+    source: Path, agents_path: Path, staging_dir: Path, part_name: str, chunk_size: int
+) -> FileConversion:
+    """Parse, enrich and partition one raw calls file; runs inside a worker process.
+
+    Each touched date gets its own ``part_name`` file, so workers never share an output file.
+    The key range of every part is reported so the parent can tell whether partitions built
+    from several inputs are still globally ordered.
+    """
+
+    stages: dict[str, float] = {}
+    with timed_stage(stages, "load_agents"):
+        agents = load_agents(agents_path)
+    rollups = RollupAccumulator()
+    writers: dict[str, pq.ParquetWriter] = {}
+    parts: dict[str, PartitionPart] = {}
+    row_count = 0
+    high_water: datetime | None = None
+    try:
+        for chunk in timed_iter(stages, "parse", iter_call_chunks(source, chunk_size)):
+            with timed_stage(stages, "enrich"):
+                enriched = enrich_chunk(chunk, agents)
+            with timed_stage(stages, "rollup"):
+                rollups.add(enriched)
+            dates = partition_dates(enriched)
+            for date in dates.unique().sort():
+                with timed_stage(stages, "write"):
+                    partition = enriched.filter((dates == date).to_arrow())
+                    target = staging_dir / f"{PARTITION_KEY}={date}" / part_name
+                    writer = writers.get(date)
+                    if writer is None:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        writer = writers[date] = pq.ParquetWriter(
+                            target, CLEANED_CALL_SCHEMA, **CALL_PARQUET_OPTIONS
+                        )
+                    writer.write_table(partition, row_group_size=chunk_size)
+                first = (partition["started_at"][0].as_py(), partition["id"][0].as_py())
+                last = (partition["started_at"][-1].as_py(), partition["id"][-1].as_py())
+                part = parts.get(date)
+                if part is None:
+                    part = parts[date] = PartitionPart(date, target, first, last)
+                else:
+                    part.ordered = part.ordered and part.last_key <= first
+                    part.last_key = last
+                part.row_groups += 1
+            row_count += enriched.num_rows
+            # Dates and rows within a chunk are sorted, so the last row seen is its maximum.
+            if high_water is None or last[0] > high_water:
+                high_water = last[0]
+    finally:
+        for writer in writers.values():
+            writer.close()
+    rollups.compact()
+    return FileConversion(row_count, list(parts.values()), high_water, rollups, stages)
+
+
+def _partition_is_ordered(parts: list[PartitionPart]) -> bool:
+    return all(part.ordered for part in parts) and all(
+        previous.last_key <= current.first_key for previous, current in zip(parts, parts[1:])
+    )
+
+
+def compact_partition(paths: list[Path], target: Path, chunk_size: int) -> int:
+    """Merge overlapping parts of one date partition into a single sorted file.
+
+    Only needed when inputs overlap in time; hourly exports land in disjoint, ordered parts
+    and skip this step. Every row group of a part is already sorted, so the parts are merged
+    row group by row group with :func:`~support_analytics.ordering.merge_row_groups` and a
+    day larger than memory compacts in ``chunk_size`` steps. Returns the number of row groups
+    written.
+    """
+
+    staging = target.with_name(f".{target.name}.tmp")
+    try:
+        row_groups = merge_row_groups(paths, staging, chunk_size, **CALL_PARQUET_OPTIONS)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    for path in paths:
+        path.unlink()
+    os.replace(staging, target)
+    return row_groups
+
+
+def build_parallel_dataset(
+    call_files: Sequence[Path],
+    agents_path: Path,
+    manifest_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    output_path: Path | None = None,
+    workers: int | None = None,
+) -> EtlReport:
+    """Convert many raw call files in parallel into one partitioned dataset and manifest.
+
+    Files are parsed and enriched by a pool of ``workers`` processes (one task per file), each
+    writing its own part file per date straight into a new revision directory. The parent
+    merges the per-file rollup partials, compacts any date partition whose parts overlap in
+    time, writes the rollups and indexes next to the dataset and publishes the revision by
+    replacing the manifest, so readers never see a half-built dataset. Like
+    :func:`build_local_parquet` the run holds :func:`etl_lock`. Worker stage timings are
+    summed across processes.
+    """
+
+    started = time.perf_counter()
+    layout = EtlInput(
+        calls_path=call_files[0],
+        agents_path=agents_path,
+        manifest_path=manifest_path,
+        chunk_size=chunk_size,
+        output_path=output_path,
+    )
+    run_id = new_run_id()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(call_files)))
+    stages: dict[str, float] = {}
+    with etl_lock(manifest_path):
+        previous = read_manifest_content(manifest_path).get("revision")
+        with staged_revision(layout, run_id) as revision:
+            dataset_dir = revision.dataset_dir
+            dataset_dir.mkdir()
+            tasks = [
+                (source, agents_path, dataset_dir, f"part-{run_id}-{index:05d}.parquet", chunk_size)
+                for index, source in enumerate(call_files)
+            ]
+            with timed_stage(stages, "convert"):
+                if workers == 1:
+                    results = [convert_call_file(*task) for task in tasks]
+                else:
+                    # Spawned workers avoid forking a process whose Polars thread pool runs.
+                    context = multiprocessing.get_context("spawn")
+                    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                        results = list(pool.map(convert_call_file, *zip(*tasks)))
+
+            rollups = RollupAccumulator()
+            by_date: dict[str, list[PartitionPart]] = {}
+            for result in results:
+                rollups.merge(result.rollups)
+                for name, seconds in result.stage_seconds.items():
+                    stages[name] = stages.get(name, 0.0) + seconds
+                for part in result.parts:
+                    by_date.setdefault(part.date, []).append(part)
+
+            row_groups = 0
+            with timed_stage(stages, "compact"):
+                for parts in by_date.values():
+                    parts.sort(key=lambda part: part.path.name)
+                    if _partition_is_ordered(parts):
+                        row_groups += sum(part.row_groups for part in parts)
+                        continue
+                    target = parts[0].path.with_name(f"part-{run_id}.parquet")
+                    paths = [part.path for part in parts]
+                    row_groups += compact_partition(paths, target, chunk_size)
+
+            fingerprint = hashlib.blake2b(digest_size=16)
+            for source in call_files:
+                fingerprint.update(source_fingerprint(source).encode("utf-8"))
+            watermarks = [result.high_water for result in results if result.high_water]
+            report = EtlReport(
+                output_path=dataset_dir,
+                row_count=sum(result.row_count for result in results),
+                row_groups=row_groups,
+                elapsed_seconds=0.0,
+                peak_rss_bytes=None,
+                revision=revision.name,
+                watermark=format_timestamp(max(watermarks)) if watermarks else None,
+                source_fingerprint=f"{len(call_files)}-files-{fingerprint.hexdigest()}",
+                stage_seconds=stages,
+            )
+            with timed_stage(stages, "rollup_write"):
+                report.rollups = write_rollups(rollups, revision.rollup_dir)
+            with timed_stage(stages, "index"):
+                report.indexes = write_indexes(dataset_dir, revision.index_dir, run_id)
+            write_manifest(manifest_path, report)
+        prune_revisions(layout, keep=(run_id, previous))
+    report.elapsed_seconds = time.perf_counter() - started
+    report.peak_rss_bytes = peak_rss_bytes(include_children=True)
+    logger.info(
+        "etl.completed",
+        path=dataset_dir.as_posix(),
+        revision=report.revision,
+        files=len(call_files),
+        workers=workers,
+        rows=report.row_count,
+        row_groups=report.row_groups,
+        rows_per_second=round(report.rows_per_second),
+        peak_rss_bytes=report.peak_rss_bytes,
+        stage_seconds={name: round(value, 4) for name, value in stages.items()},
+    )
+    return report
 
 
 def infer_inputs(root: Path) -> EtlInput:
@@ -35,9 +1150,3 @@ def infer_inputs(root: Path) -> EtlInput:
     manifest = root / "data" / "manifest.json"
     return EtlInput(calls_path=calls, agents_path=agents, manifest_path=manifest)
 
-
-def refresh_artifacts(paths: Iterable[Path]) -> None:
-    """Placeholder hook for future cache invalidation logic."""
-
-    for path in paths:
-        print(f"[ETL] Would refresh derived data at {path}")
@@ -0,0 +1,131 @@
+"""Secondary index sidecars for point lookups into the cleaned calls dataset.
+
+The ``calls`` index maps every call ``id`` to the file, row group and row that hold it. Each
+index is a directory of ``part-<run id>.parquet`` files sorted on the index keys: a full build
+writes one part, and an incremental run adds one part covering only the files it wrote. A
+lookup prunes to a small index row group per part through Parquet statistics and then decodes
+one row group of the dataset instead of scanning it.
+
+The ``agents`` index is a posting list: one entry per agent and dataset row group, with the
+number of calls and the ``started_at`` range the agent has in it. An agent's history reads only
+the row groups listed for them, in time order, and the counts answer the total without a scan.
+
+File paths are stored relative to the dataset root (the directory of a monolithic file, or the
+partitioned dataset directory itself), so published datasets can be moved as a unit.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .manifest import artifact_files, atomic_output
+
+CALL_INDEX = "calls"
+AGENT_INDEX = "agents"
+INDEX_ROW_GROUP_SIZE = 32_768
+
+CALL_INDEX_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("file", pa.dictionary(pa.int32(), pa.string())),
+        ("row_group", pa.int32()),
+        ("row", pa.int32()),
+    ]
+)
+
+AGENT_INDEX_SCHEMA = pa.schema(
+    [
+        ("agent_id", pa.string()),
+        ("file", pa.dictionary(pa.int32(), pa.string())),
+        ("row_group", pa.int32()),
+        ("calls", pa.int64()),
+        ("first_started_at", pa.timestamp("us", tz="UTC")),
+        ("last_started_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+INDEX_SORT_KEYS: dict[str, list[str]] = {
+    CALL_INDEX: ["id"],
+    AGENT_INDEX: ["agent_id", "first_started_at", "file", "row_group"],
+}
+
+
+def dataset_root(artifact: Path) -> Path:
+    """Directory that indexed file paths are relative to."""
+
+    return artifact if artifact.is_dir() else artifact.parent
+
+
+def index_file(path: Path, root: Path) -> tuple[list[pl.DataFrame], list[pl.DataFrame]]:
+    """Build the call and agent index entries for one Parquet file, one frame per row group."""
+
+    relative = path.relative_to(root).as_posix()
+    parquet = pq.ParquetFile(path)
+    calls: list[pl.DataFrame] = []
+    postings: list[pl.DataFrame] = []
+    for row_group in range(parquet.num_row_groups):
+        frame = pl.from_arrow(
+            parquet.read_row_group(row_group, columns=["id", "agent_id", "started_at"])
+        )
+        assert isinstance(frame, pl.DataFrame)
+        location = [
+            pl.lit(relative).alias("file"),
+            pl.lit(row_group, pl.Int32).alias("row_group"),
+        ]
+        calls.append(
+            frame.select(
+                pl.col("id"), *location, pl.int_range(pl.len(), dtype=pl.Int32).alias("row")
+            )
+        )
+        postings.append(
+            frame.group_by(pl.col("agent_id").cast(pl.Utf8))
+            .agg(
+                pl.len().cast(pl.Int64).alias("calls"),
+                pl.col("started_at").min().alias("first_started_at"),
+                pl.col("started_at").max().alias("last_started_at"),
+            )
+            .select("agent_id", *location, "calls", "first_started_at", "last_started_at")
+        )
+    return calls, postings
+
+
+def _write_index(frames: list[pl.DataFrame], name: str, schema: pa.Schema, target: Path) -> None:
+    if frames:
+        table = pl.concat(frames).sort(INDEX_SORT_KEYS[name]).to_arrow().cast(schema)
+    else:
+        table = schema.empty_table()
+    with atomic_output(target) as staging:
+        pq.write_table(table, staging, row_group_size=INDEX_ROW_GROUP_SIZE)
+
+
+def write_indexes(
+    artifact: Path, index_dir: Path, part: str, files: Iterable[Path] | None = None
+) -> dict[str, str]:
+    """Add a ``part-<part>.parquet`` to the ``calls`` and ``agents`` indexes in ``index_dir``.
+
+    Every file of ``artifact`` is indexed unless ``files`` narrows it to those a run just
+    wrote, which is how incremental runs cover a delta without reading or rewriting the
+    entries of the rest of the dataset. An empty part is only written to start an index.
+    """
+
+    targets = {name: index_dir / name for name in INDEX_SORT_KEYS}
+    root = dataset_root(artifact)
+    calls: list[pl.DataFrame] = []
+    postings: list[pl.DataFrame] = []
+    for path in artifact_files(artifact) if files is None else files:
+        file_calls, file_postings = index_file(path, root)
+        calls.extend(file_calls)
+        postings.extend(file_postings)
+    for name, frames, schema in (
+        (CALL_INDEX, calls, CALL_INDEX_SCHEMA),
+        (AGENT_INDEX, postings, AGENT_INDEX_SCHEMA),
+    ):
+        target = targets[name]
+        if frames or not any(target.glob("*.parquet")):
+            _write_index(frames, name, schema, target / f"part-{part}.parquet")
+    return {name: target.as_posix() for name, target in targets.items()}
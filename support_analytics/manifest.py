@@ -1,10 +1,26 @@
-"""Utilities for inspecting the manifest emitted by the placeholder ETL."""
+"""Utilities for reading the manifest emitted by the ETL and fingerprinting its artifact."""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+HASH_BLOCK_SIZE = 1 << 20
+DIGEST_SIZE = 16
+MAX_CACHED_DIGESTS = 4096
+
+StatKey = tuple[str, int, int]
+# ``(st_dev, st_ino, st_mtime_ns, st_size)``: hard links to one file share it across paths.
+FileIdentity = tuple[int, int, int, int]
+# Per-file digests recorded in the manifest, keyed by the path relative to the artifact.
+FileDigests = dict[str, dict[str, Any]]
+IDENTITY_FIELDS = ("inode", "mtime_ns", "size")
 
 
 @dataclass(slots=True)
@@ -15,17 +31,229 @@ class ManifestRecord:
     hash: str
     row_count: int
     generated_at: str
-    notes: str
+    notes: str = ""
+    size_bytes: int = 0
+    watermark: dict[str, Any] | None = None
+    rollups: dict[str, str] | None = None
+    indexes: dict[str, str] | None = None
+    stage_seconds: dict[str, float] | None = None
+
+
+_lock = threading.Lock()
+_records: dict[str, tuple[StatKey, ManifestRecord]] = {}
+_digests: dict[FileIdentity, str] = {}
+
+
+def _stat_key(path: Path) -> StatKey:
+    stat = path.stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _hash_file(path: Path, block_size: int) -> str:
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
+        while read := handle.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def _file_digest(path: Path, stat: os.stat_result, block_size: int) -> str:
+    key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _digests.get(key)
+    if cached is not None:
+        return cached
+    value = _hash_file(path, block_size)
+    with _lock:
+        if len(_digests) >= MAX_CACHED_DIGESTS:
+            _digests.pop(next(iter(_digests)))
+        _digests[key] = value
+    return value
+
+
+def artifact_files(artifact: Path) -> list[Path]:
+    """List the Parquet files behind a monolithic artifact or a partitioned dataset."""
+
+    if artifact.is_dir():
+        return sorted(artifact.rglob("*.parquet"))
+    return [artifact]
+
+
+def hash_dataset(
+    artifact: Path, known: FileDigests | None = None, block_size: int = HASH_BLOCK_SIZE
+) -> tuple[str, int, FileDigests]:
+    """Return the digest and total size of a Parquet file or dataset plus per-file digests.
+
+    Files are read in ``block_size`` chunks into a reused buffer. A file whose inode, mtime
+    and size match its entry in ``known`` (the digests recorded by the previous run) is not
+    read again. Published files are never modified in place and incremental revisions
+    hard-link the unchanged ones, so a run only hashes the parts it wrote. Within a process
+    digests are also memoised on the file identity.
+    """
+
+    files = artifact_files(artifact)
+    single = len(files) == 1 and files[0] == artifact
+    known = known or {}
+    entries: FileDigests = {}
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    total = 0
+    for path in files:
+        name = artifact.name if single else path.relative_to(artifact).as_posix()
+        stat = path.stat()
+        entry: dict[str, Any] = {
+            "inode": stat.st_ino,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        previous = known.get(name) or {}
+        unchanged = all(previous.get(field) == entry[field] for field in IDENTITY_FIELDS)
+        if unchanged and previous.get("digest"):
+            entry["digest"] = previous["digest"]
+        else:
+            entry["digest"] = _file_digest(path, stat, block_size)
+        entries[name] = entry
+        total += stat.st_size
+        digest.update(name.encode("utf-8"))
+        digest.update(bytes.fromhex(entry["digest"]))
+    if single:
+        return entries[artifact.name]["digest"], total, entries
+    return digest.hexdigest(), total, entries
+
+
+def hash_artifact(artifact: Path, block_size: int = HASH_BLOCK_SIZE) -> tuple[str, int]:
+    """Return a streaming BLAKE2b digest and total size for a Parquet file or dataset."""
+
+    content_hash, size_bytes, _ = hash_dataset(artifact, block_size=block_size)
+    return content_hash, size_bytes
+
+
+@contextmanager
+def atomic_output(target: Path) -> Iterator[Path]:
+    """Yield a hidden staging path next to ``target`` and rename it over ``target`` on success.
+
+    Readers see either the previous file or the complete new one, never a partial write, and
+    dataset discovery skips the dot-prefixed staging file while it is being written.
+    """
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        yield staging
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    os.replace(staging, target)
+
+
+def manifest_entry(manifest_path: Path, artifact: Path) -> str:
+    """Render an artifact path for the manifest, relative to its folder when inside it.
+
+    Relative entries keep a published directory relocatable, e.g. when it is mirrored to an
+    object store prefix and the manifest is read back from there.
+    """
+
+    base = os.path.abspath(manifest_path.parent)
+    target = os.path.abspath(artifact)
+    if os.path.commonpath([base, target]) == base:
+        return Path(os.path.relpath(target, base)).as_posix()
+    return Path(target).as_posix()
+
+
+def resolve_artifact_path(manifest_path: Path, raw_path: str | None) -> Path:
+    """Resolve the manifest ``path`` entry, defaulting to a sibling ``cleaned_calls.parquet``.
+
+    Relative entries are looked up next to the manifest first, then relative to the working
+    directory (the convention of older manifests and the backend settings), then by their
+    trailing components under the manifest's folder. Entries that exist nowhere resolve
+    against the manifest's folder.
+    """
+
+    if not raw_path:
+        return manifest_path.with_name("cleaned_calls.parquet")
+    candidate = Path(raw_path)
+    if candidate.is_absolute():
+        return candidate
+    beside = manifest_path.parent / candidate
+    if beside.exists():
+        return beside
+    if candidate.exists():
+        return candidate
+    for start in range(1, len(candidate.parts)):
+        relocated = manifest_path.parent.joinpath(*candidate.parts[start:])
+        if relocated.exists():
+            return relocated
+    return beside
+
+
+def _read_manifest(manifest_path: Path) -> ManifestRecord:
+    raw = manifest_path.read_bytes()
+    content: dict[str, Any] = json.loads(raw.decode("utf-8") or "{}")
+    artifact = resolve_artifact_path(manifest_path, content.get("path"))
+    # The ETL hashes the artifact once when it publishes; rehashing it here would read the
+    # whole dataset on the request path. Hand-written manifests without a hash are
+    # identified by their own bytes so edits still invalidate cached results.
+    content_hash = content.get("hash") or hashlib.blake2b(raw, digest_size=DIGEST_SIZE).hexdigest()
+    return ManifestRecord(
+        path=str(artifact),
+        hash=str(content_hash),
+        row_count=int(content.get("row_count", 0)),
+        generated_at=str(content.get("generated_at", "")),
+        notes=str(content.get("notes", "")),
+        size_bytes=int(content.get("size_bytes", 0)),
+        watermark=content.get("watermark"),
+        rollups={
+            name: str(resolve_artifact_path(manifest_path, path))
+            for name, path in (content.get("rollups") or {}).items()
+        }
+        or None,
+        indexes={
+            name: str(resolve_artifact_path(manifest_path, path))
+            for name, path in (content.get("indexes") or {}).items()
+        }
+        or None,
+        stage_seconds=content.get("stage_seconds"),
+    )
 
 
 def load_manifest(manifest_path: Path) -> ManifestRecord:
-    """Load the manifest file and return a strongly typed placeholder instance."""
-
-    content: dict[str, Any] = {
-        "path": "data/cleaned_calls.parquet",
-        "hash": "placeholder",
-        "row_count": 0,
-        "generated_at": "2025-11-27T00:00:00Z",
-        "notes": "Manifest stub is ready for replacement once ETL logic lands.",
-    }
-    return ManifestRecord(**content)
+    """Load the manifest file, trusting the artifact ``hash`` the ETL recorded in it.
+
+    Results are cached on the manifest's ``(path, st_mtime_ns, st_size)``; the ETL always
+    rewrites the manifest after publishing new artifacts, so a repeat call costs one ``stat``.
+    Use :func:`verify_manifest` to check the recorded hash against the files offline.
+    """
+
+    key = _stat_key(manifest_path)
+    with _lock:
+        cached = _records.get(key[0])
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    record = _read_manifest(manifest_path)
+    with _lock:
+        _records[key[0]] = (key, record)
+    return record
+
+
+def verify_manifest(manifest_path: Path) -> bool:
+    """Rehash the published artifact and compare it with the manifest's ``hash`` and size.
+
+    This reads the whole dataset, so it belongs in the ETL, a CLI or a worker thread, never
+    on the request path.
+    """
+
+    content: dict[str, Any] = json.loads(manifest_path.read_text(encoding="utf-8") or "{}")
+    artifact = resolve_artifact_path(manifest_path, content.get("path"))
+    if not artifact.exists():
+        return False
+    content_hash, size_bytes = hash_artifact(artifact)
+    return (content_hash, size_bytes) == (content.get("hash"), content.get("size_bytes"))
+
+
+def clear_manifest_cache() -> None:
+    """Drop memoised manifests and digests (used by tests and manual refreshes)."""
+
+    with _lock:
+        _records.clear()
+        _digests.clear()
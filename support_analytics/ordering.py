@@ -0,0 +1,179 @@
+"""Keep the cleaned calls dataset globally ordered on the ``(started_at, id)`` keyset.
+
+The API pages calls with a ``> cursor`` predicate over files and row groups in order, which is
+only correct when rows are sorted across the whole dataset, not just within one chunk. Every
+chunk the ETL writes is sorted, so each row group is a sorted run. When chunks overlap in time,
+:func:`merge_row_groups` merges those runs with an external merge sort. Memory stays bounded:
+at most ``MAX_FAN_IN`` runs are open at once, each holding one batch, and wider inputs are
+merged in several passes through hidden scratch files.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+SORT_KEYS = [("started_at", "ascending"), ("id", "ascending")]
+MAX_FAN_IN = 32
+MIN_BATCH_ROWS = 1024
+
+SortKey = tuple[datetime, str]
+Run = list[tuple[pq.ParquetFile, int]]
+
+
+def key_range(table: pa.Table) -> tuple[SortKey, SortKey]:
+    """First and last ``(started_at, id)`` key of a sorted, non-empty table."""
+
+    started, ids = table.column("started_at"), table.column("id")
+    return (started[0].as_py(), ids[0].as_py()), (started[-1].as_py(), ids[-1].as_py())
+
+
+@dataclass(slots=True)
+class OrderTracker:
+    """Notice when sorted chunks appended to one file stop being ordered as a whole."""
+
+    last_key: SortKey | None = None
+    ordered: bool = True
+
+    def add(self, chunk: pa.Table) -> None:
+        """Record a sorted chunk that was just written after the previous ones."""
+
+        if chunk.num_rows == 0:
+            return
+        first, last = key_range(chunk)
+        if self.last_key is not None and first < self.last_key:
+            self.ordered = False
+        self.last_key = last if self.last_key is None else max(self.last_key, last)
+
+
+def _run_batches(run: Run, batch_rows: int) -> Iterator[pa.Table]:
+    for parquet, row_group in run:
+        for batch in parquet.iter_batches(batch_size=batch_rows, row_groups=[row_group]):
+            if batch.num_rows:
+                yield pa.Table.from_batches([batch])
+
+
+def _rows_through(table: pa.Table, bound: SortKey) -> int:
+    """Length of the sorted ``table``'s prefix whose keys are at most ``bound``."""
+
+    started = table.column("started_at")
+    moment = pa.scalar(bound[0], type=started.type)
+    within = pc.or_(
+        pc.less(started, moment),
+        pc.and_(pc.equal(started, moment), pc.less_equal(table.column("id"), bound[1])),
+    )
+    return int(pc.sum(within).as_py() or 0)
+
+
+def _merge_runs(runs: list[Run], writer: pq.ParquetWriter, chunk_size: int) -> int:
+    """Write the merged runs as ``chunk_size`` row groups; returns the row groups written."""
+
+    batch_rows = max(MIN_BATCH_ROWS, chunk_size // max(len(runs), 1))
+    sources: list[Iterator[pa.Table] | None] = [_run_batches(run, batch_rows) for run in runs]
+    buffers: list[pa.Table | None] = [None] * len(runs)
+    pending: list[pa.Table] = []
+    pending_rows = 0
+    row_groups = 0
+    while True:
+        for index, source in enumerate(sources):
+            if source is not None and buffers[index] is None:
+                buffers[index] = next(source, None)
+                if buffers[index] is None:
+                    sources[index] = None
+        live = [buffer for buffer in buffers if buffer is not None]
+        if not live:
+            break
+        # Later rows of every run sort after its buffered ones, so everything up to the
+        # smallest buffered maximum is final; the run that holds it drains completely.
+        bound = min(key_range(buffer)[1] for buffer in live)
+        ready: list[pa.Table] = []
+        for index, buffer in enumerate(buffers):
+            if buffer is None:
+                continue
+            count = _rows_through(buffer, bound)
+            if count:
+                ready.append(buffer.slice(0, count))
+            buffers[index] = buffer.slice(count) if count < buffer.num_rows else None
+        step = pa.concat_tables(ready).sort_by(SORT_KEYS)
+        pending.append(step)
+        pending_rows += step.num_rows
+        if pending_rows >= chunk_size:
+            merged = pa.concat_tables(pending)
+            full = merged.num_rows - merged.num_rows % chunk_size
+            writer.write_table(merged.slice(0, full), row_group_size=chunk_size)
+            row_groups += full // chunk_size
+            pending = [merged.slice(full)]
+            pending_rows = merged.num_rows - full
+    if pending_rows:
+        writer.write_table(pa.concat_tables(pending), row_group_size=chunk_size)
+        row_groups += 1
+    return row_groups
+
+
+def merge_row_groups(
+    sources: Sequence[Path],
+    target: Path,
+    chunk_size: int,
+    fan_in: int = MAX_FAN_IN,
+    **writer_options: Any,
+) -> int:
+    """Merge every (sorted) row group of ``sources`` into ``target`` in keyset order.
+
+    ``target`` is written as ``chunk_size``-row row groups with ``writer_options``; returns
+    the number of row groups written.
+    """
+
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    opened = [pq.ParquetFile(path) for path in sources]
+    schema = opened[0].schema_arrow
+    runs: list[Run] = [
+        [(parquet, row_group)] for parquet in opened for row_group in range(parquet.num_row_groups)
+    ]
+    scratch: list[Path] = []
+    try:
+        while len(runs) > fan_in:
+            merged: list[Run] = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start : start + fan_in]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+                path = target.with_name(f".{target.name}.merge-{len(scratch)}.tmp")
+                scratch.append(path)
+                with pq.ParquetWriter(path, schema, **writer_options) as writer:
+                    _merge_runs(group, writer, chunk_size)
+                parquet = pq.ParquetFile(path)
+                opened.append(parquet)
+                merged.append([(parquet, index) for index in range(parquet.num_row_groups)])
+            runs = merged
+        with pq.ParquetWriter(target, schema, **writer_options) as writer:
+            return _merge_runs(runs, writer, chunk_size)
+    finally:
+        for parquet in opened:
+            parquet.close()
+        for path in scratch:
+            path.unlink(missing_ok=True)
+
+
+def sort_parquet_file(path: Path, chunk_size: int, **writer_options: Any) -> int:
+    """Rewrite a file whose sorted row groups overlap so it is ordered as a whole.
+
+    Returns the number of row groups in the rewritten file.
+    """
+
+    sorted_path = path.with_name(f".{path.name.lstrip('.')}.sorted.tmp")
+    try:
+        row_groups = merge_row_groups([path], sorted_path, chunk_size, **writer_options)
+    except BaseException:
+        sorted_path.unlink(missing_ok=True)
+        raise
+    os.replace(sorted_path, path)
+    return row_groups
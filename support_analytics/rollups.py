@@ -0,0 +1,151 @@
+"""Pre-aggregated rollup tables emitted alongside the cleaned calls dataset.
+
+Rollups hold additive state (counts and sums) plus a serialised DDSketch of handle times, so
+partial aggregates from individual chunks, worker processes or incremental runs merge by
+re-grouping, summing and merging sketches. Keys stay dictionary-encoded (and ``bucket`` a
+UTC timestamp), so grouping hashes integer codes rather than strings.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .manifest import atomic_output
+from .sketch import DDSketch, merge_serialized
+
+AGENT_ROLLUP = "agents"
+KPI_ROLLUP = "kpi_hourly"
+MAX_PENDING_PARTIALS = 16
+
+ROLLUP_KEYS: dict[str, list[str]] = {
+    AGENT_ROLLUP: ["agent_id"],
+    KPI_ROLLUP: ["bucket", "customer_region", "issue_type"],
+}
+
+ADDITIVE_COLUMNS = [
+    "calls",
+    "duration_sum",
+    "resolved_calls",
+    "skill_rating_sum",
+    "skill_rating_count",
+]
+SKETCH_COLUMN = "duration_sketch"
+
+
+def _sketch_durations(durations: pl.Series) -> bytes:
+    return DDSketch().add_many(durations.to_numpy()).to_bytes()
+
+
+def _merge_sketches(payloads: pl.Series) -> bytes | None:
+    return merge_serialized(payloads.to_list())
+
+
+def _partial_aggregates(frame: pl.DataFrame, keys: list[str]) -> pl.DataFrame:
+    return frame.group_by(keys).agg(
+        pl.len().cast(pl.Int64).alias("calls"),
+        pl.col("duration_seconds").cast(pl.Int64).sum().alias("duration_sum"),
+        (pl.col("resolution_status") == "Resolved").cast(pl.Int64).sum().alias("resolved_calls"),
+        # Roster skill rating of the agent who took each call; the exports carry no survey score.
+        pl.col("skill_rating").fill_null(0.0).sum().alias("skill_rating_sum"),
+        pl.col("skill_rating").is_not_null().cast(pl.Int64).sum().alias("skill_rating_count"),
+        pl.col("duration_seconds")
+        .map_batches(
+            lambda durations: pl.Series([_sketch_durations(durations)]),
+            return_dtype=pl.Binary,
+            returns_scalar=True,
+        )
+        .alias(SKETCH_COLUMN),
+    )
+
+
+def merge_partials(partials: list[pl.DataFrame], keys: list[str]) -> pl.DataFrame:
+    """Combine partial rollups that share ``keys``: sum counters and merge sketches."""
+
+    # Partials carry their own local dictionaries; concatenating the (few) decoded keys is
+    # cheaper than letting Polars re-encode every categorical pairwise.
+    categorical = [key for key in keys if partials[0].schema[key] == pl.Categorical]
+    decoded = [partial.with_columns(pl.col(categorical).cast(pl.Utf8)) for partial in partials]
+    combined = pl.concat(decoded, how="vertical_relaxed")
+    return combined.group_by(keys).agg(
+        pl.col(ADDITIVE_COLUMNS).sum(),
+        pl.col(SKETCH_COLUMN)
+        .map_batches(
+            lambda payloads: pl.Series([_merge_sketches(payloads)]),
+            return_dtype=pl.Binary,
+            returns_scalar=True,
+        ),
+    ).sort(keys).with_columns(pl.col(categorical).cast(pl.Categorical))
+
+
+class RollupAccumulator:
+    """Fold enriched call chunks into per-agent and per-hour × region × issue rollups."""
+
+    def __init__(self) -> None:
+        self._partials: dict[str, list[pl.DataFrame]] = {name: [] for name in ROLLUP_KEYS}
+
+    def add(self, chunk: pa.Table) -> None:
+        """Aggregate one enriched chunk and keep only its (small) partial result."""
+
+        frame = pl.from_arrow(chunk)
+        assert isinstance(frame, pl.DataFrame)
+        frame = frame.with_columns(pl.col("started_at").dt.truncate("1h").alias("bucket"))
+        for name, keys in ROLLUP_KEYS.items():
+            pending = self._partials[name]
+            pending.append(_partial_aggregates(frame, keys))
+            if len(pending) > MAX_PENDING_PARTIALS:
+                self._partials[name] = [merge_partials(pending, keys)]
+
+    def merge(self, other: RollupAccumulator) -> None:
+        """Absorb the partials gathered by another accumulator (e.g. a worker process)."""
+
+        for name, partials in other._partials.items():
+            self._partials[name].extend(partials)
+
+    def compact(self) -> None:
+        """Merge pending partials in place, e.g. before shipping them to another process."""
+
+        for name, partials in self._partials.items():
+            if len(partials) > 1:
+                self._partials[name] = [merge_partials(partials, ROLLUP_KEYS[name])]
+
+    def tables(self) -> dict[str, pl.DataFrame]:
+        """Return the fully merged rollups keyed by rollup name."""
+
+        return {
+            name: merge_partials(partials, ROLLUP_KEYS[name])
+            for name, partials in self._partials.items()
+            if partials
+        }
+
+
+def write_rollups(
+    accumulator: RollupAccumulator, rollup_dir: Path, append: bool = False
+) -> dict[str, str]:
+    """Write each rollup to ``rollup_dir/<name>.parquet``.
+
+    With ``append`` the existing rollups are read back and merged with the new partials, which
+    is how incremental runs fold newly arrived partitions into the totals.
+    """
+
+    rollup_dir.mkdir(parents=True, exist_ok=True)
+    paths: dict[str, str] = {}
+    for name, table in accumulator.tables().items():
+        target = rollup_dir / f"{name}.parquet"
+        if append and target.exists():
+            table = merge_partials([pl.read_parquet(target), table], ROLLUP_KEYS[name])
+        with atomic_output(target) as staging:
+            pq.write_table(table.to_arrow(), staging)
+        paths[name] = target.as_posix()
+    for name in ROLLUP_KEYS:
+        target = rollup_dir / f"{name}.parquet"
+        if name in paths or not target.exists():
+            continue
+        if append:
+            paths[name] = target.as_posix()
+        else:
+            target.unlink()
+    return paths
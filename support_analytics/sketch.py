@@ -0,0 +1,156 @@
+"""Mergeable DDSketch used for handle-time percentiles in the rollup tables.
+
+A DDSketch maps each positive value ``v`` to the logarithmic bucket ``ceil(log_gamma(v))``
+and keeps a count per bucket. Any quantile is answered within ``relative_accuracy`` of the
+true value, and two sketches merge exactly by adding their bucket counts, which is what lets
+per-chunk, per-agent and per-hour sketches roll up into arbitrary windows.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Iterable
+
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+_HEADER = struct.Struct("<BdQQddI")
+_VERSION = 1
+
+
+class DDSketch:
+    """Relative-error quantile sketch with an exact, commutative merge."""
+
+    __slots__ = (
+        "relative_accuracy",
+        "_gamma",
+        "_log_gamma",
+        "bins",
+        "zero_count",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add_many(self, values: Iterable[float] | np.ndarray) -> DDSketch:
+        """Insert non-negative values in one vectorised pass."""
+
+        array = np.asarray(values, dtype=np.float64)
+        array = array[~np.isnan(array)]
+        if array.size == 0:
+            return self
+        if (array < 0).any():
+            raise ValueError("DDSketch only accepts non-negative values")
+        positive = array[array > 0]
+        self.zero_count += int(array.size - positive.size)
+        if positive.size:
+            keys, counts = np.unique(
+                np.ceil(np.log(positive) / self._log_gamma).astype(np.int32), return_counts=True
+            )
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                self.bins[key] = self.bins.get(key, 0) + count
+        self.count += int(array.size)
+        self.min = min(self.min, float(array.min()))
+        self.max = max(self.max, float(array.max()))
+        return self
+
+    def merge(self, other: DDSketch) -> DDSketch:
+        """Fold ``other`` into this sketch in place."""
+
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        """Return the value at quantile ``q`` (0–1), or ``None`` for an empty sketch."""
+
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def rank(self, value: float) -> float:
+        """Return the approximate fraction of inserted values that are ``<= value``."""
+
+        if self.count == 0:
+            return 0.0
+        if value <= 0:
+            return self.zero_count / self.count
+        limit = math.ceil(math.log(value) / self._log_gamma)
+        below = self.zero_count + sum(count for key, count in self.bins.items() if key <= limit)
+        return below / self.count
+
+    def to_bytes(self) -> bytes:
+        """Serialise to a compact little-endian binary blob for Parquet ``binary`` columns."""
+
+        keys = np.fromiter(sorted(self.bins), dtype=np.int32, count=len(self.bins))
+        counts = np.fromiter((self.bins[key] for key in keys.tolist()), dtype=np.uint64)
+        header = _HEADER.pack(
+            _VERSION,
+            self.relative_accuracy,
+            self.zero_count,
+            self.count,
+            self.min,
+            self.max,
+            len(self.bins),
+        )
+        return header + keys.tobytes() + counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> DDSketch:
+        """Rebuild a sketch produced by :meth:`to_bytes`."""
+
+        version, accuracy, zero_count, count, low, high, size = _HEADER.unpack_from(payload)
+        if version != _VERSION:
+            raise ValueError(f"Unsupported sketch version {version}")
+        sketch = cls(accuracy)
+        offset = _HEADER.size
+        keys = np.frombuffer(payload, dtype=np.int32, count=size, offset=offset)
+        counts = np.frombuffer(payload, dtype=np.uint64, count=size, offset=offset + 4 * size)
+        sketch.bins = dict(zip(keys.tolist(), counts.tolist()))
+        sketch.zero_count = zero_count
+        sketch.count = count
+        sketch.min = low
+        sketch.max = high
+        return sketch
+
+
+def merge_serialized(payloads: Iterable[bytes | None]) -> bytes | None:
+    """Merge serialised sketches, skipping nulls; ``None`` when nothing was merged."""
+
+    merged: DDSketch | None = None
+    for payload in payloads:
+        if payload is None:
+            continue
+        sketch = DDSketch.from_bytes(payload)
+        merged = sketch if merged is None else merged.merge(sketch)
+    return None if merged is None else merged.to_bytes()
@@ -0,0 +1,47 @@
+"""Conversions between the stored ``timestamp[us, UTC]`` type and the ISO-8601 wire format.
+
+The cleaned dataset stores ``started_at`` as a real timestamp, while the API contract, the
+manifest watermark and pagination cursors keep the ``YYYY-MM-DDTHH:MM:SSZ`` strings of the
+raw exports. A fractional part is written only when one is present, with three or six digits
+like Polars' ``%.f``, so cursors and rendered rows agree.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+POLARS_WIRE_FORMAT = "%Y-%m-%dT%H:%M:%S%.fZ"
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 string into an aware UTC datetime; naive values are taken as UTC."""
+
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Render a datetime in the wire format, e.g. ``2025-11-25T14:03:00Z``."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    micros = value.microsecond
+    if not micros:
+        fraction = ""
+    elif micros % 1000:
+        fraction = f".{micros:06d}"
+    else:
+        fraction = f".{micros // 1000:03d}"
+    return f"{value:%Y-%m-%dT%H:%M:%S}{fraction}Z"
+
+
+def timestamp_scalar(value: str | datetime) -> pa.TimestampScalar:
+    """Build an Arrow scalar comparable with the stored ``started_at`` column."""
+
+    moment = parse_timestamp(value) if isinstance(value, str) else value
+    return pa.scalar(moment, type=TIMESTAMP_TYPE)
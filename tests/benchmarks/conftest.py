@@ -0,0 +1,150 @@
+"""Opt-in benchmark harness with a stored baseline and regression check.
+
+Benchmarks only run when ``SUPPORT_ANALYTICS_BENCH`` lists the row counts to generate, e.g.
+``SUPPORT_ANALYTICS_BENCH=1e5,1e6 pytest tests/benchmarks``. Each measurement is the median of
+a few rounds and fails when it exceeds the baseline by more than the stored tolerance.
+``SUPPORT_ANALYTICS_BENCH_UPDATE=1`` rewrites ``baseline.json`` from the current run instead,
+and ``SUPPORT_ANALYTICS_BENCH_DATA`` keeps generated inputs between sessions.
+
+The stored baseline covers 1e5 and 1e6 rows only. Sizes without an entry, such as 1e7, are
+timed and reported with a warning but never fail until a baseline is recorded for them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from support_analytics.etl import EtlInput, build_local_parquet
+
+from .datagen import generate_dataset
+
+BENCH_ENV = "SUPPORT_ANALYTICS_BENCH"
+UPDATE_ENV = "SUPPORT_ANALYTICS_BENCH_UPDATE"
+DATA_ENV = "SUPPORT_ANALYTICS_BENCH_DATA"
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def bench_sizes() -> list[int]:
+    """Parse the requested dataset sizes; empty when benchmarks are disabled."""
+
+    raw = os.environ.get(BENCH_ENV, "").strip()
+    if not raw:
+        return []
+    return [int(float(value)) for value in raw.split(",") if value.strip()]
+
+
+@dataclass(slots=True)
+class Benchmark:
+    """Collects median timings and compares them against the stored baseline."""
+
+    baseline: dict[str, float]
+    tolerance: float
+    min_slack_seconds: float
+    update: bool
+    results: dict[str, float] = field(default_factory=dict)
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        rounds: int = 5,
+        setup: Callable[[], Any] | None = None,
+    ) -> float:
+        """Time ``func`` over ``rounds`` runs (after ``setup`` each time) and check the median."""
+
+        timings = []
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return self.record(name, statistics.median(timings))
+
+    def record(self, name: str, seconds: float) -> float:
+        """Store a timing measured elsewhere and fail if it regressed past the baseline."""
+
+        self.results[name] = seconds
+        expected = self.baseline.get(name)
+        if self.update:
+            return seconds
+        if expected is None:
+            warnings.warn(f"{name}: {seconds * 1000:.1f} ms, not checked (no baseline)")
+            return seconds
+        limit = expected * (1 + self.tolerance) + self.min_slack_seconds
+        assert seconds <= limit, (
+            f"{name} regressed: {seconds * 1000:.1f} ms vs baseline {expected * 1000:.1f} ms "
+            f"(limit {limit * 1000:.1f} ms)"
+        )
+        return seconds
+
+
+@pytest.fixture(scope="session")
+def benchmark() -> Iterator[Benchmark]:
+    """Session-wide recorder; rewrites the baseline at the end when updating."""
+
+    stored: dict[str, Any] = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    recorder = Benchmark(
+        baseline=stored.get("results", {}),
+        tolerance=float(stored.get("tolerance", 0.25)),
+        min_slack_seconds=float(stored.get("min_slack_seconds", 0.005)),
+        update=os.environ.get(UPDATE_ENV) == "1",
+    )
+    yield recorder
+    if recorder.update and recorder.results:
+        stored["results"] = {
+            **stored.get("results", {}),
+            **{name: round(value, 6) for name, value in recorder.results.items()},
+        }
+        BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+@dataclass(slots=True, frozen=True)
+class PublishedBenchmarkData:
+    """ETL output for one generated size plus how long the ETL took."""
+
+    rows: int
+    manifest_path: Path
+    parquet_path: Path
+    etl_seconds: float
+
+
+@pytest.fixture(scope="session")
+def published(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int], PublishedBenchmarkData]:
+    """Return a factory that generates and publishes each size once per session."""
+
+    data_dir = Path(os.environ.get(DATA_ENV) or tmp_path_factory.mktemp("bench-inputs"))
+    cache: dict[int, PublishedBenchmarkData] = {}
+
+    def publish(rows: int) -> PublishedBenchmarkData:
+        if rows not in cache:
+            generated = generate_dataset(REPO_ROOT, data_dir, rows)
+            output_dir = tmp_path_factory.mktemp(f"bench-{rows}")
+            inputs = EtlInput(
+                calls_path=generated.calls_path,
+                agents_path=generated.agents_path,
+                manifest_path=output_dir / "manifest.json",
+            )
+            started = time.perf_counter()
+            parquet_path = build_local_parquet(inputs)
+            cache[rows] = PublishedBenchmarkData(
+                rows=rows,
+                manifest_path=inputs.manifest_path,
+                parquet_path=parquet_path,
+                etl_seconds=time.perf_counter() - started,
+            )
+        return cache[rows]
+
+    return publish
@@ -0,0 +1,152 @@
+"""Synthetic call and agent datasets shaped like ``data/sample_calls.json`` and ``agents.csv``.
+
+Field names, field order and value pools are taken from the sample files and widened with a
+few plausible extra categories, so generated inputs exercise the same ETL code paths at
+10^5–10^7 rows. Generation is vectorised per chunk and seeded, so a size always produces the
+same bytes and can be cached between benchmark sessions.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+CHUNK_ROWS = 500_000
+CALLS_PER_AGENT = 2_000
+DAYS_COVERED = 30
+
+EXTRA_REGIONS = ("LATAM", "MEA")
+EXTRA_ISSUE_TYPES = ("Account", "Shipping", "Onboarding")
+EXTRA_STATUSES = ("Pending",)
+
+
+@dataclass(slots=True, frozen=True)
+class SampleShape:
+    """Field order and value pools observed in the sample inputs."""
+
+    call_fields: tuple[str, ...]
+    agent_fields: tuple[str, ...]
+    regions: tuple[str, ...]
+    issue_types: tuple[str, ...]
+    statuses: tuple[str, ...]
+    duration_mean: float
+    start: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class GeneratedDataset:
+    """Paths of one generated calls/agents pair."""
+
+    rows: int
+    calls_path: Path
+    agents_path: Path
+
+
+def _merge(observed: list[str], extra: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys([*observed, *extra]))
+
+
+def read_sample_shape(repo_root: Path) -> SampleShape:
+    """Derive the generator's pools from the checked-in sample data."""
+
+    calls = json.loads((repo_root / "data" / "sample_calls.json").read_text(encoding="utf-8"))
+    agents = pl.read_csv(repo_root / "data" / "agents.csv")
+    started = min(
+        datetime.strptime(row["started_at"], "%Y-%m-%dT%H:%M:%SZ") for row in calls
+    ).replace(hour=0, minute=0, second=0, tzinfo=timezone.utc)
+    return SampleShape(
+        call_fields=tuple(calls[0]),
+        agent_fields=tuple(agents.columns),
+        regions=_merge(
+            [row["customer_region"] for row in calls] + agents["region"].to_list(), EXTRA_REGIONS
+        ),
+        issue_types=_merge([row["issue_type"] for row in calls], EXTRA_ISSUE_TYPES),
+        statuses=_merge([row["resolution_status"] for row in calls], EXTRA_STATUSES),
+        duration_mean=float(np.mean([row["duration_seconds"] for row in calls])),
+        start=started,
+    )
+
+
+def _agents_frame(shape: SampleShape, count: int, rng: np.random.Generator) -> pl.DataFrame:
+    regions = np.array(shape.regions)
+    frame = pl.DataFrame(
+        {
+            "agent_id": [f"A-{index:05d}" for index in range(count)],
+            "name": [f"Agent {index:05d}" for index in range(count)],
+            "region": regions[rng.integers(0, len(regions), count)],
+            "skill_rating": np.round(rng.uniform(3.0, 5.0, count), 1),
+        }
+    )
+    return frame.select(shape.agent_fields)
+
+
+def _calls_chunk(
+    shape: SampleShape,
+    agent_ids: np.ndarray,
+    first_index: int,
+    size: int,
+    window_start: datetime,
+    window_seconds: float,
+    rng: np.random.Generator,
+) -> pl.DataFrame:
+    regions = np.array(shape.regions)
+    issue_types = np.array(shape.issue_types)
+    statuses = np.array(shape.statuses)
+    status_weights = np.linspace(len(statuses), 1, len(statuses))
+    offsets = np.sort(rng.uniform(0, window_seconds, size)).astype("timedelta64[s]")
+    started_at = np.datetime64(window_start.replace(tzinfo=None), "s") + offsets
+    # Polars converts millisecond (not second) resolution datetimes from NumPy.
+    started_at = started_at.astype("datetime64[ms]")
+    frame = pl.DataFrame(
+        {
+            "id": [f"call-{index:09d}" for index in range(first_index, first_index + size)],
+            "agent_id": agent_ids[rng.integers(0, len(agent_ids), size)],
+            "customer_region": regions[rng.integers(0, len(regions), size)],
+            "issue_type": issue_types[rng.integers(0, len(issue_types), size)],
+            "duration_seconds": np.maximum(
+                rng.gamma(2.0, shape.duration_mean / 2.0, size).astype(np.int64), 1
+            ),
+            "resolution_status": statuses[
+                rng.choice(len(statuses), size, p=status_weights / status_weights.sum())
+            ],
+            "started_at": pl.Series(started_at).dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    )
+    return frame.select(shape.call_fields)
+
+
+def generate_dataset(
+    repo_root: Path, target_dir: Path, rows: int, seed: int = 7
+) -> GeneratedDataset:
+    """Write ``rows`` NDJSON calls and a matching roster, reusing files from a prior run."""
+
+    calls_path = target_dir / f"calls-{rows}-{seed}.ndjson"
+    agents_path = target_dir / f"agents-{rows}-{seed}.csv"
+    dataset = GeneratedDataset(rows=rows, calls_path=calls_path, agents_path=agents_path)
+    if calls_path.exists() and agents_path.exists():
+        return dataset
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    shape = read_sample_shape(repo_root)
+    rng = np.random.default_rng(seed)
+    agents = _agents_frame(shape, max(rows // CALLS_PER_AGENT, 10), rng)
+    agents.write_csv(agents_path)
+
+    agent_ids = agents["agent_id"].to_numpy()
+    seconds_per_row = DAYS_COVERED * 86_400 / rows
+    staging = calls_path.with_suffix(".tmp")
+    with staging.open("wb") as handle:
+        for first in range(0, rows, CHUNK_ROWS):
+            size = min(CHUNK_ROWS, rows - first)
+            window_start = shape.start + timedelta(seconds=first * seconds_per_row)
+            chunk = _calls_chunk(
+                shape, agent_ids, first, size, window_start, size * seconds_per_row, rng
+            )
+            handle.write(chunk.write_ndjson().encode("utf-8"))
+    staging.replace(calls_path)
+    return dataset
@@ -0,0 +1,102 @@
+"""End-to-end timings for the ETL, manifest hashing and the hot API routes."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.core.config import settings
+from backend.app.db.cache import result_cache
+from backend.app.main import app
+from support_analytics.manifest import clear_manifest_cache, hash_artifact
+
+from .conftest import Benchmark, PublishedBenchmarkData, bench_sizes
+
+SIZES = bench_sizes()
+
+pytestmark = pytest.mark.skipif(
+    not SIZES, reason="set SUPPORT_ANALYTICS_BENCH=1e5[,1e6,1e7] to run benchmarks"
+)
+
+size_param = pytest.mark.parametrize("rows", SIZES or [100_000], ids=lambda rows: f"{rows:.0e}")
+
+
+@pytest.fixture
+def client(
+    published: Callable[[int], PublishedBenchmarkData],
+    rows: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
+    """Point the backend at the published benchmark dataset."""
+
+    data = published(rows)
+    monkeypatch.setattr(settings, "manifest_path", str(data.manifest_path))
+    monkeypatch.setattr(settings, "parquet_path", str(data.parquet_path))
+    return TestClient(app)
+
+
+def _cold(client: TestClient, url: str, params: dict[str, object] | None = None) -> Callable:
+    def request() -> None:
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+
+    return request
+
+
+@size_param
+def test_etl(benchmark: Benchmark, published, rows: int) -> None:
+    """Full rebuild: parse, enrich, write Parquet and rollups, publish the manifest."""
+
+    benchmark.record(f"etl[{rows}]", published(rows).etl_seconds)
+
+
+@size_param
+def test_manifest_hash(benchmark: Benchmark, published, rows: int) -> None:
+    """Uncached streaming hash of the published artifact."""
+
+    parquet_path = published(rows).parquet_path
+    benchmark.measure(
+        f"manifest_hash[{rows}]", lambda: hash_artifact(parquet_path), setup=clear_manifest_cache
+    )
+
+
+@size_param
+def test_calls_filtered_page(benchmark: Benchmark, client: TestClient, rows: int) -> None:
+    """First and keyset-continued pages of a region + issue type filter, cache cleared."""
+
+    params = {"region": "EU", "issue_type": "Billing", "per_page": 50}
+    benchmark.measure(
+        f"calls_page[{rows}]", _cold(client, "/api/calls", params), setup=result_cache.clear
+    )
+    cursor = client.get("/api/calls", params=params).json()["links"]["next"]
+    assert cursor is not None
+    benchmark.measure(f"calls_next_page[{rows}]", _cold(client, cursor), setup=result_cache.clear)
+
+
+@size_param
+def test_agents(benchmark: Benchmark, client: TestClient, rows: int) -> None:
+    """Agent leaderboard from the rollup, cache cleared."""
+
+    benchmark.measure(f"agents[{rows}]", _cold(client, "/api/agents"), setup=result_cache.clear)
+
+
+@size_param
+def test_metrics(benchmark: Benchmark, client: TestClient, rows: int) -> None:
+    """Daily KPI series from the hourly rollup, cache cleared."""
+
+    benchmark.measure(f"metrics[{rows}]", _cold(client, "/api/metrics"), setup=result_cache.clear)
+
+
+@size_param
+def test_point_lookups(benchmark: Benchmark, client: TestClient, rows: int) -> None:
+    """Call detail by id and one agent's first page, both served through the index sidecars."""
+
+    call_id = f"call-{rows // 2:09d}"
+    benchmark.measure(
+        f"call_by_id[{rows}]", _cold(client, f"/api/calls/{call_id}"), setup=result_cache.clear
+    )
+    benchmark.measure(
+        f"agent_calls[{rows}]", _cold(client, "/api/agents/A-00003/calls"), setup=result_cache.clear
+    )
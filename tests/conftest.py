@@ -2,13 +2,62 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 
+from support_analytics import etl
+
+PublishCalls = Callable[..., etl.EtlInput]
+
 
 @pytest.fixture(scope="session")
 def repo_root() -> Path:
     """Return the repository root so tests can resolve sample fixtures."""
 
     return Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def sample_calls(repo_root: Path) -> list[dict[str, Any]]:
+    """Rows of the sample export, parsed afresh so a test may edit them."""
+
+    return json.loads((repo_root / "data" / "sample_calls.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def publish_calls(
+    repo_root: Path, tmp_path: Path, sample_calls: list[dict[str, Any]]
+) -> PublishCalls:
+    """Write calls as an NDJSON export under ``tmp_path`` and run the ETL over it.
+
+    ``publish_calls(calls=None, *, build=True, directory="published", **options)`` defaults to
+    the sample rows; ``options`` such as ``chunk_size`` and ``incremental`` go to
+    :class:`~support_analytics.etl.EtlInput`. The manifest lives in ``tmp_path / directory``,
+    and ``build=False`` only prepares the inputs, for tests that run the ETL themselves.
+    """
+
+    def publish(
+        calls: list[dict[str, Any]] | None = None,
+        *,
+        build: bool = True,
+        directory: str = "published",
+        **options: Any,
+    ) -> etl.EtlInput:
+        rows = sample_calls if calls is None else calls
+        calls_path = tmp_path / "calls.ndjson"
+        calls_path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+        inputs = etl.EtlInput(
+            calls_path=calls_path,
+            agents_path=repo_root / "data" / "agents.csv",
+            manifest_path=tmp_path / directory / "manifest.json",
+            **options,
+        )
+        inputs.manifest_path.parent.mkdir(exist_ok=True)
+        if build:
+            etl.build_local_parquet(inputs)
+        return inputs
+
+    return publish
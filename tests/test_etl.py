@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
-from support_analytics import etl
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from support_analytics import etl, manifest
+from support_analytics.timestamps import parse_timestamp
+
+
+def published_revision(inputs: etl.EtlInput) -> etl.Revision:
+    """The revision the manifest currently points at."""
+
+    content = etl.read_manifest_content(inputs.manifest_path)
+    revision = etl.published_revision(inputs, content)
+    assert revision is not None
+    return revision
 
 
 def test_infer_inputs_returns_expected_paths(repo_root) -> None:
@@ -12,3 +28,314 @@ def test_infer_inputs_returns_expected_paths(repo_root) -> None:
     assert inputs.calls_path.name == "sample_calls.json"
     assert inputs.agents_path.name == "agents.csv"
     assert inputs.manifest_path.name == "manifest.json"
+
+
+def test_build_local_parquet_streams_bounded_row_groups(sample_calls, publish_calls) -> None:
+    """Calls are joined against the roster and written one row group per chunk."""
+
+    calls = [dict(row, id=f"call-{index:03d}") for index, row in enumerate(sample_calls * 5)]
+    inputs = publish_calls(calls, build=False, chunk_size=4)
+
+    output = etl.build_local_parquet(inputs)
+
+    parquet = pq.ParquetFile(output)
+    assert parquet.metadata.num_rows == len(calls)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("agent_name").to_pylist()[0] == "Jordan Li"
+    assert parquet.schema_arrow == etl.CLEANED_CALL_SCHEMA
+    assert pa.types.is_dictionary(parquet.schema_arrow.field("customer_region").type)
+    manifest = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+    assert manifest["row_count"] == len(calls)
+    assert {"parse", "enrich", "write", "rollup", "hash"} <= set(manifest["stage_seconds"])
+
+
+def test_failed_runs_leave_the_published_artifacts_untouched(
+    sample_calls, publish_calls, tmp_path
+) -> None:
+    """Artifacts are renamed into place when complete; a failure mid-stream publishes nothing."""
+
+    inputs = publish_calls(build=False, chunk_size=1)
+    updates: list[tuple[str, int]] = []
+    output = etl.build_local_parquet(inputs, progress=lambda *update: updates.append(update))
+    assert updates == [
+        ("write", 1),
+        ("write", 2),
+        ("rollup_write", 2),
+        ("index", 2),
+        ("manifest", 2),
+    ]
+    published = (output.read_bytes(), inputs.manifest_path.read_bytes())
+
+    inputs.calls_path.write_text(
+        json.dumps(dict(sample_calls[0], id="call-003")) + "\n{not json", encoding="utf-8"
+    )
+    with pytest.raises(ValueError):
+        etl.build_local_parquet(inputs)
+
+    assert (output.read_bytes(), inputs.manifest_path.read_bytes()) == published
+    assert list(inputs.revisions_dir.iterdir()) == [published_revision(inputs).root]
+    assert not list(tmp_path.rglob(".*"))
+
+
+def test_runs_publish_whole_revisions_by_replacing_the_manifest(publish_calls) -> None:
+    """Each run writes a new revision; the one it replaces is kept intact until the next run."""
+
+    inputs = publish_calls()
+    first = published_revision(inputs)
+    files = {path: path.read_bytes() for path in first.root.rglob("*") if path.is_file()}
+
+    etl.build_local_parquet(inputs)
+    second = published_revision(inputs)
+    assert second.root != first.root
+    assert {path: path.read_bytes() for path in first.root.rglob("*") if path.is_file()} == files
+    manifest = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+    entries = [manifest["path"], *manifest["rollups"].values(), *manifest["indexes"].values()]
+    for entry in entries:
+        assert etl.resolve_artifact_path(inputs.manifest_path, entry).is_relative_to(second.root)
+
+    etl.build_local_parquet(inputs)
+    third = published_revision(inputs)
+    assert sorted(inputs.revisions_dir.iterdir()) == [second.root, third.root]
+
+
+def test_a_second_run_is_rejected_while_another_holds_the_lock(publish_calls) -> None:
+    """Runs publishing to the same manifest are serialised by a file lock, not a queue."""
+
+    inputs = publish_calls(build=False)
+    with etl.etl_lock(inputs.manifest_path):
+        with pytest.raises(etl.EtlLockedError):
+            etl.build_local_parquet(inputs)
+    assert not inputs.manifest_path.exists()
+    etl.build_local_parquet(inputs)
+    assert inputs.manifest_path.exists()
+
+
+def test_incremental_run_only_appends_calls_past_the_watermark(
+    sample_calls, publish_calls
+) -> None:
+    """Incremental runs write new date partitions and advance the manifest watermark."""
+
+    inputs = publish_calls(incremental=True)
+    assert etl.build_incremental_dataset(inputs).row_count == 0
+
+    late_call = dict(sample_calls[0], id="call-003", started_at="2025-11-26T09:00:00Z")
+    with inputs.calls_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(late_call) + "\n")
+    report = etl.build_incremental_dataset(inputs)
+
+    revision = published_revision(inputs)
+    dataset_dir = revision.dataset_dir
+    manifest = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+    assert report.row_count == 1
+    assert manifest["row_count"] == len(sample_calls) + 1
+    assert manifest["watermark"]["started_at"] == "2025-11-26T09:00:00Z"
+    assert sorted(path.name for path in dataset_dir.iterdir()) == [
+        "date=2025-11-25",
+        "date=2025-11-26",
+    ]
+    # The delta is indexed as a new part next to the hard-linked one of the first run.
+    assert len(list((revision.index_dir / "calls").iterdir())) == 2
+    call_index = pq.read_table(revision.index_dir / "calls").to_pylist()
+    assert [(row["id"], row["file"].split("/")[0]) for row in call_index] == [
+        ("call-001", "date=2025-11-25"),
+        ("call-002", "date=2025-11-25"),
+        ("call-003", "date=2025-11-26"),
+    ]
+    postings = pq.read_table(revision.index_dir / "agents").to_pylist()
+    assert sorted((row["agent_id"], row["file"].split("/")[0]) for row in postings) == [
+        ("A-101", "date=2025-11-25"),
+        ("A-101", "date=2025-11-26"),
+        ("A-102", "date=2025-11-25"),
+    ]
+
+
+def test_incremental_runs_resume_parsing_where_the_previous_run_stopped(
+    sample_calls, publish_calls, monkeypatch
+) -> None:
+    """Appended lines are parsed from the recorded offset; a rewritten export from the start."""
+
+    inputs = publish_calls(incremental=True)
+    calls_path = inputs.calls_path
+    watermark = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))["watermark"]
+    assert watermark["source_offset"] == calls_path.stat().st_size
+
+    parsed: list[int] = []
+    iter_call_chunks = etl.iter_call_chunks
+
+    def counting_chunks(path, chunk_size, start=0):
+        for chunk in iter_call_chunks(path, chunk_size, start):
+            parsed.append(chunk.num_rows)
+            yield chunk
+
+    monkeypatch.setattr(etl, "iter_call_chunks", counting_chunks)
+    late_call = dict(sample_calls[0], id="call-003", started_at="2025-11-26T09:00:00Z")
+    with calls_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(late_call) + "\n")
+    assert etl.build_incremental_dataset(inputs).row_count == 1
+    assert parsed == [1]
+
+    parsed.clear()
+    rewritten = [dict(row, id=f"new-{row['id']}") for row in sample_calls]
+    calls_path.write_text(
+        "".join(json.dumps(row) + "\n" for row in [*rewritten, late_call, late_call]),
+        encoding="utf-8",
+    )
+    etl.build_incremental_dataset(inputs)
+    assert parsed == [len(sample_calls) + 2]
+
+
+def test_reseeding_after_a_full_rebuild_does_not_duplicate_partitions(
+    sample_calls, publish_calls
+) -> None:
+    """A re-seed replaces stale partitions, so data, manifest and rollups agree."""
+
+    inputs = publish_calls(incremental=True)
+    inputs.incremental = False
+    etl.build_local_parquet(inputs)
+    inputs.incremental = True
+    dataset_dir = etl.build_local_parquet(inputs)
+
+    ids = pq.ParquetDataset(dataset_dir).read(columns=["id"]).column("id").to_pylist()
+    assert sorted(ids) == sorted(row["id"] for row in sample_calls)
+    manifest = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+    assert manifest["row_count"] == len(sample_calls)
+    agents = pq.read_table(published_revision(inputs).rollup_dir / "agents.parquet")
+    assert sum(agents.column("calls").to_pylist()) == len(sample_calls)
+
+
+def test_overlapping_chunks_are_merged_into_one_global_order(
+    sample_calls, publish_calls
+) -> None:
+    """Chunks that overlap in time still publish rows sorted on ``(started_at, id)``."""
+
+    # Start times jump around both days, so every chunk of three overlaps its neighbours.
+    calls = []
+    for index in range(40):
+        started_at = f"2025-11-{25 + index % 2}T{(index * 7) % 24:02d}:{index:02d}:00Z"
+        calls.append(dict(sample_calls[index % 2], id=f"call-{index:03d}", started_at=started_at))
+    expected = sorted((parse_timestamp(row["started_at"]), row["id"]) for row in calls)
+
+    for incremental in (False, True):
+        inputs = publish_calls(
+            calls,
+            build=False,
+            directory=f"incremental-{incremental}",
+            chunk_size=3,
+            incremental=incremental,
+        )
+        output = etl.build_local_parquet(inputs)
+
+        table = pq.ParquetDataset(output).read(columns=["started_at", "id"])
+        keys = list(zip(table.column("started_at").to_pylist(), table.column("id").to_pylist()))
+        assert keys == expected
+        assert not [path for path in output.parent.rglob(".*")]
+        manifest = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+        assert "sort" in manifest["stage_seconds"]
+
+
+def test_incremental_runs_merge_rollups(sample_calls, publish_calls) -> None:
+    """Rollups written by later incremental runs fold into the existing totals."""
+
+    inputs = publish_calls(incremental=True)
+    late_call = dict(sample_calls[0], id="call-003", started_at="2025-11-26T09:00:00Z")
+    with inputs.calls_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(late_call) + "\n")
+    etl.build_local_parquet(inputs)
+
+    rollup_dir = published_revision(inputs).rollup_dir
+    agents = pq.read_table(rollup_dir / "agents.parquet").to_pylist()
+    assert {row["agent_id"]: row["calls"] for row in agents} == {"A-101": 2, "A-102": 1}
+    hourly = pq.read_table(rollup_dir / "kpi_hourly.parquet")
+    assert hourly.column("bucket").to_pylist()[-1] == parse_timestamp("2025-11-26T09:00:00Z")
+    assert sum(hourly.column("calls").to_pylist()) == 3
+
+
+def test_parallel_build_merges_many_files_into_one_ordered_dataset(
+    repo_root, sample_calls, tmp_path
+) -> None:
+    """Hourly files are converted by worker processes and overlapping days are compacted."""
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    hours = ["2025-11-25T14", "2025-11-25T15", "2025-11-26T09"]
+    for index, hour in enumerate(hours):
+        rows = [dict(sample_calls[index % 2], id=f"call-{index}", started_at=f"{hour}:03:00Z")]
+        (raw_dir / f"calls-{hour}.json").write_text(json.dumps(rows), encoding="utf-8")
+    # A late file that overlaps the first day forces that partition to be compacted.
+    late = [dict(sample_calls[0], id="call-late", started_at="2025-11-25T14:30:00Z")]
+    (raw_dir / "late.ndjson").write_text(json.dumps(late[0]) + "\n", encoding="utf-8")
+
+    files = etl.resolve_call_files([raw_dir / "*.json", raw_dir])
+    assert [path.name for path in files][-1] == "late.ndjson"
+    report = etl.build_parallel_dataset(
+        files, repo_root / "data" / "agents.csv", tmp_path / "manifest.json", workers=2
+    )
+
+    dataset = pq.ParquetDataset(report.output_path)
+    ids = dataset.read(columns=["id"]).column("id").to_pylist()
+    assert ids == ["call-0", "call-late", "call-1", "call-2"]
+    assert len(list((report.output_path / "date=2025-11-25").iterdir())) == 1
+    assert report.output_path.parent.parent == tmp_path / etl.REVISIONS_DIR
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["row_count"] == 4
+    assert manifest["watermark"]["started_at"] == "2025-11-26T09:03:00Z"
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".")]
+
+
+def test_compaction_merges_overlapping_parts_in_chunk_sized_row_groups(tmp_path) -> None:
+    """Parts whose sorted row groups interleave are merged into one ordered file."""
+
+    parts = []
+    for part in range(3):
+        path = tmp_path / f"part-{part}.parquet"
+        with pq.ParquetWriter(path, etl.CLEANED_CALL_SCHEMA, **etl.CALL_PARQUET_OPTIONS) as writer:
+            for group in range(2):
+                # Minutes part*2 + group, +6, +12, ...: every row group spans the whole hour.
+                minutes = [row * 6 + part * 2 + group for row in range(5)]
+                columns = {name: [None] * len(minutes) for name in etl.CLEANED_CALL_SCHEMA.names}
+                columns["id"] = [f"call-{part}-{group}-{minute:02d}" for minute in minutes]
+                columns["started_at"] = [
+                    parse_timestamp(f"2025-11-25T14:{minute:02d}:00Z") for minute in minutes
+                ]
+                writer.write_table(pa.table(columns).cast(etl.CLEANED_CALL_SCHEMA))
+        parts.append(path)
+    target = tmp_path / "part-compacted.parquet"
+
+    row_groups = etl.compact_partition(parts, target, chunk_size=4)
+
+    table = pq.read_table(target)
+    keys = list(zip(table.column("started_at").to_pylist(), table.column("id").to_pylist()))
+    assert len(keys) == 30 and keys == sorted(keys)
+    assert row_groups == pq.ParquetFile(target).metadata.num_row_groups == 8
+    assert [path.name for path in tmp_path.iterdir()] == ["part-compacted.parquet"]
+
+
+def test_incremental_runs_only_hash_the_parts_they_wrote(
+    sample_calls, publish_calls, monkeypatch
+) -> None:
+    """Digests of hard-linked partitions carry over from the manifest instead of a rehash."""
+
+    inputs = publish_calls(incremental=True)
+    late_call = dict(sample_calls[0], id="call-003", started_at="2025-11-26T09:00:00Z")
+    with inputs.calls_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(late_call) + "\n")
+    manifest.clear_manifest_cache()
+    hashed: list[str] = []
+    hash_file = manifest._hash_file
+
+    def recording_hash(path, block_size):
+        hashed.append(path.parent.name)
+        return hash_file(path, block_size)
+
+    monkeypatch.setattr(manifest, "_hash_file", recording_hash)
+    etl.build_local_parquet(inputs)
+
+    assert hashed == ["date=2025-11-26"]
+    content = json.loads(inputs.manifest_path.read_text(encoding="utf-8"))
+    assert sorted(path.split("/")[0] for path in content["files"]) == [
+        "date=2025-11-25",
+        "date=2025-11-26",
+    ]
+    assert (content["hash"], content["size_bytes"]) == manifest.hash_artifact(
+        published_revision(inputs).dataset_dir
+    )
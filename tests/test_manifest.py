@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 
 from support_analytics import manifest
@@ -14,3 +16,51 @@ def test_load_manifest_uses_placeholder_contract(tmp_path: Path) -> None:
     dummy_manifest.write_text("{}", encoding="utf-8")
     record = manifest.load_manifest(dummy_manifest)
     assert record.path.endswith("cleaned_calls.parquet")
+
+
+def test_load_manifest_trusts_the_recorded_hash(tmp_path: Path, monkeypatch) -> None:
+    """Loads never read the artifact; repeat loads reuse the record until the manifest changes."""
+
+    artifact = tmp_path / "cleaned_calls.parquet"
+    artifact.write_bytes(b"PAR1" * 1024)
+    manifest_path = tmp_path / "manifest.json"
+    content = {
+        "path": str(artifact),
+        "hash": "recorded",
+        "size_bytes": 4096,
+        "row_count": 7,
+        "generated_at": "2025-11-27T00:00:00Z",
+    }
+    manifest_path.write_text(json.dumps(content), encoding="utf-8")
+    manifest.clear_manifest_cache()
+    hashed: list[Path] = []
+    monkeypatch.setattr(manifest, "_hash_file", lambda path, size: hashed.append(path) or "")
+
+    first = manifest.load_manifest(manifest_path)
+    second = manifest.load_manifest(manifest_path)
+
+    assert first is second
+    assert hashed == []
+    assert (first.hash, first.size_bytes, first.row_count) == ("recorded", 4096, 7)
+
+    del content["hash"]
+    manifest_path.write_text(json.dumps(content), encoding="utf-8")
+    unhashed = manifest.load_manifest(manifest_path)
+    assert unhashed.hash == hashlib.blake2b(manifest_path.read_bytes(), digest_size=16).hexdigest()
+    assert hashed == []
+
+
+def test_verify_manifest_rehashes_the_artifact_offline(tmp_path: Path) -> None:
+    """Verification compares a fresh digest of the artifact with the recorded one."""
+
+    artifact = tmp_path / "cleaned_calls.parquet"
+    artifact.write_bytes(b"PAR1" * 1024)
+    manifest_path = tmp_path / "manifest.json"
+    content_hash, size_bytes = manifest.hash_artifact(artifact)
+    content = {"path": artifact.name, "hash": content_hash, "size_bytes": size_bytes}
+    manifest_path.write_text(json.dumps(content), encoding="utf-8")
+    assert manifest.verify_manifest(manifest_path)
+
+    manifest.clear_manifest_cache()
+    artifact.write_bytes(b"PAR2" * 1024)
+    assert not manifest.verify_manifest(manifest_path)
@@ -0,0 +1,35 @@
+"""Unit tests for the mergeable DDSketch."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from support_analytics.sketch import DDSketch, merge_serialized
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy() -> None:
+    """Merged, round-tripped sketches answer quantiles within 1% of the exact values.
+
+    The exact value is taken at the same rank the sketch uses, ``floor(q * (n - 1))``.
+    """
+
+    rng = np.random.default_rng(7)
+    values = rng.lognormal(mean=6.0, sigma=0.8, size=20_000)
+    halves = [DDSketch().add_many(part).to_bytes() for part in np.array_split(values, 2)]
+    merged_payload = merge_serialized(halves)
+    assert merged_payload is not None
+    merged = DDSketch.from_bytes(merged_payload)
+
+    assert merged.count == values.size
+    for q in (0.5, 0.9, 0.99):
+        estimate = merged.quantile(q)
+        exact = float(np.quantile(values, q, method="lower"))
+        assert estimate is not None
+        assert abs(estimate - exact) <= merged.relative_accuracy * exact
+
+
+def test_empty_sketch_has_no_quantiles() -> None:
+    """An empty sketch reports no percentiles instead of inventing zeros."""
+
+    assert DDSketch().quantile(0.5) is None
+    assert merge_serialized([None]) is None
@@ -4,6 +4,6 @@ from __future__ import annotations
 
 KPI_LABELS = {
     "avg_handle_time": "Average Handle Time",
-    "csat": "Customer Satisfaction",
+    "resolution_rate": "Resolution Rate",
     "volume": "Call Volume",
 }